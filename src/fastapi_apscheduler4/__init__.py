@@ -7,17 +7,22 @@ from fastapi_apscheduler4.config import (  # noqa: E402
     DataStoreType,
     EventBrokerType,
     PostgresConfig,
+    ReconcileLockType,
     RedisConfig,
     SchedulerAPIConfig,
     SchedulerConfig,
 )
+from fastapi_apscheduler4.dtos import ScheduleEntry, ScheduleEntryResult  # noqa: E402
 from fastapi_apscheduler4.scheduler import Scheduler  # noqa: E402
 
 __all__ = [
     "DataStoreType",
     "EventBrokerType",
     "PostgresConfig",
+    "ReconcileLockType",
     "RedisConfig",
+    "ScheduleEntry",
+    "ScheduleEntryResult",
     "Scheduler",
     "SchedulerAPIConfig",
     "SchedulerApp",
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import math
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, Annotated, Any, ParamSpec
+from typing import TYPE_CHECKING, Annotated, Any, ParamSpec, cast
+from uuid import uuid4
 
-from apscheduler import AsyncScheduler, ConflictPolicy
+from anyio import CancelScope, Event, create_task_group, current_time
+from apscheduler import AsyncScheduler, ConflictPolicy, Schedule, Task, TaskLookupError
+from apscheduler._converters import as_timedelta
 from apscheduler._marshalling import callable_to_ref
+from apscheduler._utils import UnsetValue
 from typing_extensions import Doc, TypeVar
 
 from fastapi_apscheduler4 import logger
@@ -21,14 +28,29 @@ from fastapi_apscheduler4.config import (
     SchedulerConfig,
     SchedulerEnvConfig,
 )
-from fastapi_apscheduler4.constants import SCHEDULE_PREFIX
-from fastapi_apscheduler4.errors import AlreadySetupError
+from fastapi_apscheduler4.constants import (
+    BULK_MAX_CONCURRENCY,
+    MANIFEST_TASK_ID,
+    SCHEDULE_PREFIX,
+    SCHEDULE_SPREAD_METADATA,
+    THREAD_POOL_JOB_EXECUTOR,
+)
+from fastapi_apscheduler4.dtos import ScheduleEntry, ScheduleEntryResult
+from fastapi_apscheduler4.errors import AlreadySetupError, NotReadyAPIError
+from fastapi_apscheduler4.locks import MemoryReconcileLock
+from fastapi_apscheduler4.registry import get_task_entries
 from fastapi_apscheduler4.scheduler import Scheduler
+from fastapi_apscheduler4.schemas import SchedulerPhase
+from fastapi_apscheduler4.spread import spread_trigger
+from fastapi_apscheduler4.utils import get_trigger_params, is_async_callable
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Callable
+    from collections.abc import AsyncGenerator, Callable, Iterable
 
     from fastapi import FastAPI
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from fastapi_apscheduler4.cache import ResponseCache
 
 P = ParamSpec("P")
 RT = TypeVar("RT")
@@ -104,11 +126,17 @@ class SchedulerApp(Scheduler):
             self._apscheduler = _apscheduler
             self._event_broker = None
             self._data_store = None
+            self._reconcile_lock = MemoryReconcileLock(timeout=self._scheduler.reconcile_lock_timeout)
+            self._engine: AsyncEngine | None = None
         else:
             apscheduler_builder = APSSchedulerBuilder(scheduler=self._scheduler, postgres=postgres, redis=redis)
             self._apscheduler = apscheduler_builder.build()
             self._event_broker = apscheduler_builder.computed_event_broker_type
             self._data_store = apscheduler_builder.computed_data_store_type
+            self._reconcile_lock = apscheduler_builder.build_reconcile_lock()
+            self._engine = apscheduler_builder.engine
+        self._phase = SchedulerPhase.STOPPED
+        self._cache: ResponseCache | None = None
 
     def setup(self, app: FastAPI) -> None:
         """Initialize the plugin."""
@@ -118,11 +146,42 @@ class SchedulerApp(Scheduler):
         app.extra["apscheduler"] = self.apscheduler
 
         if self.api.enabled:
+            from fastapi import Depends
+
+            from fastapi_apscheduler4.cache import DataStoreVersions, ResponseCache
+            from fastapi_apscheduler4.routers.events import EventsAPIRouter
+            from fastapi_apscheduler4.routers.jobs import JobsAPIRouter
+            from fastapi_apscheduler4.routers.scheduler import SchedulerAPIRouter
             from fastapi_apscheduler4.routers.schedules import SchedulesAPIRouter
             from fastapi_apscheduler4.routers.tasks import TasksAPIRouter
 
-            app.include_router(SchedulesAPIRouter.from_config(self.apscheduler, self.api))
-            app.include_router(TasksAPIRouter.from_config(self.apscheduler, self.api))
+            # The data store is not available until the scheduler is ready when it starts in the background
+            dependencies = [Depends(self._require_ready)] if self.scheduler.background_startup else None
+
+            # The cache versions are shared with the ETags, so that one subscription invalidates both
+            versions: DataStoreVersions | None = None
+            if self.api.cache_enabled:
+                self._cache = ResponseCache(max_size=self.api.cache_max_size, ttl=self.api.cache_ttl)
+                versions = self._cache
+            elif self.api.etag_enabled:
+                versions = DataStoreVersions()
+            if versions is not None:
+                versions.subscribe(self.apscheduler.event_broker)
+            etag_versions = versions if self.api.etag_enabled else None
+
+            app.include_router(SchedulerAPIRouter.from_config(lambda: self.phase, self.api, self.cache))
+            app.include_router(
+                SchedulesAPIRouter.from_config(self.apscheduler, self.api, self.cache, etag_versions),
+                dependencies=dependencies,
+            )
+            app.include_router(
+                TasksAPIRouter.from_config(self.apscheduler, self.api, self.cache, etag_versions),
+                dependencies=dependencies,
+            )
+            if self.api.jobs_enabled:
+                app.include_router(JobsAPIRouter.from_config(self.apscheduler, self.api), dependencies=dependencies)
+            if self.api.events_enabled:
+                app.include_router(EventsAPIRouter.from_config(self.apscheduler, self.api), dependencies=dependencies)
 
     @property
     def scheduler(self) -> SchedulerConfig:
@@ -139,6 +198,11 @@ class SchedulerApp(Scheduler):
         """Get the APScheduler."""
         return self._apscheduler
 
+    @property
+    def cache(self) -> ResponseCache | None:
+        """Get the response cache of the API, if enabled."""
+        return self._cache
+
     @property
     def event_broker(self) -> EventBrokerType | None:
         """Get the event broker."""
@@ -149,41 +213,405 @@ class SchedulerApp(Scheduler):
         """Get the data store."""
         return self._data_store
 
+    @property
+    def phase(self) -> SchedulerPhase:
+        """Get the scheduler phase."""
+        return self._phase
+
     @asynccontextmanager
     async def lifespan(self, app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: ARG002
-        """Start the scheduler."""
-        async with self.apscheduler:
-            await self._clean_auto_schedules()
-            await self._add_auto_schedules()
-            if self.scheduler.auto_start:
-                await self.apscheduler.start_in_background()
-            yield
-
-    async def _add_auto_schedules(self) -> None:
-        """Add auto schedules."""
-        for func, trigger in self.schedules:
-            schedule_id = self._get_schedule_id(func)
-            logger.debug(f"Scheduler: Configure schedule {schedule_id}")
-            await self.apscheduler.add_schedule(
-                func,
-                id=schedule_id,
-                trigger=trigger,
-                conflict_policy=ConflictPolicy.replace,
+        """Start the scheduler.
+
+        With background startup, the application serves requests right away while the scheduler starts.
+        """
+        if not self.scheduler.background_startup:
+            self._phase = SchedulerPhase.INITIALIZING
+            try:
+                async with self._run_apscheduler():
+                    await self._start()
+                    yield
+            finally:
+                self._phase = SchedulerPhase.STOPPED
+            return
+
+        stopped = Event()
+        async with create_task_group() as tg:
+            tg.start_soon(self._run_in_background, stopped)
+            try:
+                yield
+            finally:
+                stopped.set()
+                if self.phase is not SchedulerPhase.READY:
+                    tg.cancel_scope.cancel()
+
+    async def _run_in_background(self, stopped: Event) -> None:
+        """Start the scheduler within the startup timeout and run it until stopped."""
+        self._phase = SchedulerPhase.INITIALIZING
+        with CancelScope() as cancel_scope:
+            if self.scheduler.startup_timeout is not None:
+                cancel_scope.deadline = current_time() + self.scheduler.startup_timeout
+            try:
+                async with self._run_apscheduler():
+                    await self._start()
+                    cancel_scope.deadline = math.inf
+                    await stopped.wait()
+            except Exception:  # noqa: BLE001
+                logger.exception("Scheduler: Background startup failed")
+                self._phase = SchedulerPhase.FAILED
+                return
+
+        if cancel_scope.cancelled_caught and not stopped.is_set():
+            logger.error(f"Scheduler: Background startup timeout after {self.scheduler.startup_timeout}s")
+            self._phase = SchedulerPhase.FAILED
+        else:
+            self._phase = SchedulerPhase.STOPPED
+
+    @asynccontextmanager
+    async def _run_apscheduler(self) -> AsyncGenerator[None, None]:
+        """Enter the APScheduler, then dispose the shared engine that its data store and event broker do not own."""
+        try:
+            async with self.apscheduler:
+                yield
+        finally:
+            if self._engine is not None:
+                with CancelScope(shield=True):
+                    await self._engine.dispose()
+
+    async def _start(self) -> None:
+        """Reconcile the auto schedules and start the scheduler."""
+        self._phase = SchedulerPhase.RECONCILING
+        await self._sync_auto_schedules()
+        if self.scheduler.auto_start:
+            await self.apscheduler.start_in_background()
+        self._phase = SchedulerPhase.READY
+
+    def _require_ready(self) -> None:
+        """Dependency requiring the scheduler to be ready."""
+        if self.phase is not SchedulerPhase.READY:
+            raise NotReadyAPIError
+
+    async def add_schedules(
+        self,
+        entries: Iterable[ScheduleEntry],
+        *,
+        conflict_policy: ConflictPolicy = ConflictPolicy.do_nothing,
+        max_concurrency: int = BULK_MAX_CONCURRENCY,
+    ) -> list[ScheduleEntryResult]:
+        """Add many schedules at once.
+
+        Each task is configured once, then the schedules are written to the data store concurrently, with at most
+        `max_concurrency` writes in flight. A failing schedule does not prevent the others from being added.
+
+        Args:
+            entries: Schedules to add.
+            conflict_policy: What to do when a schedule with the same ID already exists.
+            max_concurrency: Maximum number of concurrent writes to the data store.
+
+        Returns:
+            The result of each entry, in the same order.
+
+        Raises:
+            RuntimeError: If the scheduler has not been initialized yet, like `AsyncScheduler.add_schedule`.
+        """
+        self.apscheduler._check_initialized()  # noqa: SLF001
+        entries = list(entries)
+        tasks = await self._configure_tasks(entries)
+        return await self._write_schedules(entries, tasks, conflict_policy, max_concurrency)
+
+    async def _configure_tasks(self, entries: list[ScheduleEntry]) -> dict[Callable[..., Any], Task | Exception]:
+        """Configure the task of each function once, with the options of its first entry.
+
+        Returns:
+            The task of each function, or the error raised while configuring it.
+        """
+        return {func: await self._try_configure_task(entry) for func, entry in get_task_entries(entries).items()}
+
+    async def _try_configure_task(self, entry: ScheduleEntry) -> Task | Exception:
+        """Configure the task of an entry, returning the error instead of raising it."""
+        try:
+            return await self.apscheduler.configure_task(
+                entry.func,
+                job_executor=self._get_job_executor(entry),
+                max_running_jobs=entry.max_running_jobs,
+                misfire_grace_time=entry.misfire_grace_time,
             )
+        except Exception as e:  # noqa: BLE001
+            return e
+
+    def _get_job_executor(self, entry: ScheduleEntry) -> str | UnsetValue:
+        """Get the job executor of an entry, routing the sync functions to the thread pool unless explicitly set."""
+        if (
+            isinstance(entry.job_executor, UnsetValue)
+            and self.scheduler.thread_pool_sync_jobs
+            and THREAD_POOL_JOB_EXECUTOR in self.apscheduler.job_executors
+            and not is_async_callable(entry.func)
+        ):
+            return THREAD_POOL_JOB_EXECUTOR
+        return entry.job_executor
+
+    async def _write_schedules(
+        self,
+        entries: list[ScheduleEntry],
+        tasks: dict[Callable[..., Any], Task | Exception],
+        conflict_policy: ConflictPolicy,
+        max_concurrency: int,
+    ) -> list[ScheduleEntryResult]:
+        """Write the schedules of configured tasks to the data store with bounded concurrency."""
+        results: list[ScheduleEntryResult | None] = [None] * len(entries)
+
+        def fail(index: int, schedule_id: str, error: Exception) -> None:
+            logger.warning(f"Scheduler: Failed to add schedule {schedule_id}: {error!r}")
+            results[index] = ScheduleEntryResult(id=schedule_id, success=False, error=str(error))
+
+        async def add(index: int, entry: ScheduleEntry) -> None:
+            schedule_id = entry.id or str(uuid4())
+            task = tasks[entry.func]
+            if isinstance(task, Exception):
+                fail(index, schedule_id, task)
+                return
+            try:
+                schedule = self._build_schedule(schedule_id, task, entry)
+                await self.apscheduler.data_store.add_schedule(schedule, conflict_policy)
+            except Exception as e:  # noqa: BLE001
+                fail(index, schedule_id, e)
+            else:
+                results[index] = ScheduleEntryResult(id=schedule_id, success=True)
+
+        pending = enumerate(entries)
 
-    async def _clean_auto_schedules(self) -> None:
-        """Clean unconfigured schedules."""
-        configured_schedule_ids = {self._get_schedule_id(func) for func, _ in self.schedules}
-        active_auto_schedule_ids = {
-            schedule.id
+        async def worker() -> None:
+            for index, entry in pending:
+                await add(index, entry)
+
+        async with create_task_group() as tg:
+            for _ in range(min(max_concurrency, len(entries))):
+                tg.start_soon(worker)
+
+        return cast("list[ScheduleEntryResult]", results)
+
+    def _build_schedule(self, schedule_id: str, task: Task, entry: ScheduleEntry) -> Schedule:
+        """Build a schedule from an entry, with the same defaults as `AsyncScheduler.add_schedule`.
+
+        The spread window is stored in the schedule metadata, as the offset of the interval triggers is not comparable.
+        """
+        metadata = task.metadata.copy()
+        if window := self._get_spread_window(entry):
+            metadata[SCHEDULE_SPREAD_METADATA] = window
+        entry = self._spread_entry(schedule_id, entry)
+        schedule = Schedule(
+            id=schedule_id,
+            task_id=task.id,
+            trigger=entry.trigger,
+            args=entry.args,
+            kwargs=entry.kwargs,
+            coalesce=entry.coalesce,
+            misfire_grace_time=task.misfire_grace_time
+            if isinstance(entry.misfire_grace_time, UnsetValue)
+            else entry.misfire_grace_time,
+            metadata=metadata,
+            max_jitter=entry.max_jitter,
+            job_executor=task.job_executor if isinstance(entry.job_executor, UnsetValue) else entry.job_executor,
+            paused=entry.paused,
+        )
+        schedule.next_fire_time = entry.trigger.next()
+        return schedule
+
+    def _spread_entry(self, schedule_id: str, entry: ScheduleEntry) -> ScheduleEntry:
+        """Spread the trigger of an entry by the offset of its schedule ID.
+
+        The triggers that cannot be offset get the spread window as `max_jitter` instead, unless already set.
+
+        Returns:
+            The spread entry, with the spread disabled so that it is not spread twice.
+        """
+        window = self._get_spread_window(entry)
+        if not window:
+            return entry
+        trigger = spread_trigger(entry.trigger, schedule_id, window)
+        if trigger is not None:
+            return entry.model_copy(update={"trigger": trigger, "spread": 0})
+        if entry.max_jitter is None:
+            return entry.model_copy(update={"max_jitter": window, "spread": 0})
+        return entry.model_copy(update={"spread": 0})
+
+    def _get_spread_window(self, entry: ScheduleEntry) -> float:
+        """Get the spread window of an entry, defaulting to the scheduler config."""
+        return self.scheduler.spread if entry.spread is None else entry.spread
+
+    async def _sync_auto_schedules(self) -> None:
+        """Synchronize the auto schedules with the data store.
+
+        The reconciliation is skipped when the manifest fingerprint stored in the data store matches the configured
+        schedules, which only costs a single task read.
+        """
+        fingerprint = self._get_manifest_fingerprint()
+        if await self._get_stored_manifest_fingerprint() == fingerprint:
+            logger.info("Scheduler: Auto schedules manifest unchanged, skip reconciliation")
+            return
+
+        async with self._reconcile_lock.hold() as acquired:
+            if not acquired:
+                logger.warning("Scheduler: Reconcile lock timeout, reconciling without lock")
+            elif await self._get_stored_manifest_fingerprint() == fingerprint:
+                logger.info("Scheduler: Auto schedules reconciled by another process")
+                return
+            # Keep the fingerprint outdated on failure so the next startup retries the reconciliation
+            if await self._reconcile_auto_schedules():
+                await self._store_manifest_fingerprint(fingerprint)
+
+    async def _reconcile_auto_schedules(self) -> bool:
+        """Reconcile the auto schedules in the data store with the configured ones.
+
+        Only the new and outdated schedules are written in bulk, and the unconfigured ones are removed in one batch.
+        Must be called while holding the reconcile lock, so the processes starting after the one reconciling only
+        find unchanged schedules. The paused state is not part of the configuration, so the paused schedules stay
+        paused when updated.
+
+        Returns:
+            True if all the configured schedules are written, False otherwise.
+        """
+        configured_schedules = {cast("str", entry.id): entry for entry in self.schedules}
+        task_entries = get_task_entries(configured_schedules.values())
+        active_auto_schedules = {
+            schedule.id: schedule
             for schedule in await self.apscheduler.get_schedules()
             if schedule.id.startswith(SCHEDULE_PREFIX)
         }
 
-        for schedule_id in active_auto_schedule_ids - configured_schedule_ids:
+        removed_schedule_ids = active_auto_schedules.keys() - configured_schedules.keys()
+        for schedule_id in removed_schedule_ids:
             logger.warning(f"Scheduler: Remove schedule {schedule_id}")
-            await self.apscheduler.remove_schedule(schedule_id)
+        if removed_schedule_ids:
+            await self.apscheduler.data_store.remove_schedules(removed_schedule_ids)
+
+        entries: list[ScheduleEntry] = []
+        added_count = updated_count = 0
+        for schedule_id, entry in configured_schedules.items():
+            active_schedule = active_auto_schedules.get(schedule_id)
+            if active_schedule is None:
+                added_count += 1
+            elif self._get_active_schedule_spec(active_schedule, entry) != self._get_schedule_spec(
+                entry, task_entries[entry.func]
+            ):
+                updated_count += 1
+            else:
+                continue
+
+            logger.debug(f"Scheduler: Configure schedule {schedule_id}")
+            paused = active_schedule is not None and active_schedule.paused
+            entries.append(entry.model_copy(update={"paused": True}) if paused else entry)
+
+        # Configure the tasks of all the configured schedules so that the task options are updated as well
+        tasks = await self._configure_tasks(list(configured_schedules.values()))
+        results = await self._write_schedules(entries, tasks, ConflictPolicy.replace, BULK_MAX_CONCURRENCY)
+        failed_count = len(
+            {result.id for result in results if not result.success}
+            | {
+                schedule_id
+                for schedule_id, entry in configured_schedules.items()
+                if isinstance(tasks[entry.func], Exception)
+            }
+        )
+
+        unchanged_count = len(configured_schedules) - added_count - updated_count
+        logger.info(
+            f"Scheduler: Reconciled auto schedules (added={added_count}, updated={updated_count}, "
+            f"removed={len(removed_schedule_ids)}, unchanged={unchanged_count})"
+        )
+        if failed_count:
+            logger.error(f"Scheduler: Failed to configure {failed_count} auto schedules")
+        return not failed_count
+
+    async def _get_stored_manifest_fingerprint(self) -> str | None:
+        """Get the manifest fingerprint stored in the data store."""
+        try:
+            task = await self.apscheduler.data_store.get_task(MANIFEST_TASK_ID)
+        except TaskLookupError:
+            return None
+        return cast("str | None", task.metadata.get("fingerprint"))
+
+    async def _store_manifest_fingerprint(self, fingerprint: str) -> None:
+        """Store the manifest fingerprint in the data store."""
+        await self.apscheduler.data_store.add_task(
+            Task(
+                id=MANIFEST_TASK_ID,
+                func=None,
+                job_executor=cast("str", self.apscheduler.task_defaults.job_executor),
+                metadata={"fingerprint": fingerprint},
+            )
+        )
+
+    def _get_manifest_fingerprint(self) -> str:
+        """Get a stable fingerprint of the configured auto schedules and of the options of their tasks."""
+        entries = list(self.schedules)
+        task_entries = get_task_entries(entries)
+        manifest = {
+            "schedules": sorted(
+                (entry.id, self._get_schedule_spec(entry, task_entries[entry.func])) for entry in entries
+            ),
+            "tasks": sorted(
+                (callable_to_ref(func), self._get_task_spec(entry)) for func, entry in task_entries.items()
+            ),
+        }
+        serialized = json.dumps(manifest, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
 
-    def _get_schedule_id(self, func: Callable[..., Any]) -> str:
-        """Get the schedule ID."""
-        return SCHEDULE_PREFIX + callable_to_ref(func)
+    def _get_task_spec(self, entry: ScheduleEntry) -> dict[str, Any]:
+        """Get the comparable options of the task configured by an entry.
+
+        The unset options are resolved with the scheduler task defaults, like `AsyncScheduler.configure_task`.
+        """
+        task_defaults = self.apscheduler.task_defaults
+        job_executor = self._get_job_executor(entry)
+        max_running_jobs = entry.max_running_jobs
+        misfire_grace_time = entry.misfire_grace_time
+        return {
+            "job_executor": task_defaults.job_executor if isinstance(job_executor, UnsetValue) else job_executor,
+            "max_running_jobs": task_defaults.max_running_jobs
+            if isinstance(max_running_jobs, UnsetValue)
+            else max_running_jobs,
+            "misfire_grace_time": as_timedelta(
+                task_defaults.misfire_grace_time if isinstance(misfire_grace_time, UnsetValue) else misfire_grace_time
+            ),
+        }
+
+    def _get_schedule_spec(self, entry: ScheduleEntry, task_entry: ScheduleEntry) -> dict[str, Any]:
+        """Get the comparable specification of a configured schedule, with its spread applied.
+
+        The unset options are resolved with the options of its task, configured by the first entry of its function,
+        like `_build_schedule`.
+        """
+        task_spec = self._get_task_spec(task_entry)
+        job_executor = task_spec["job_executor"] if isinstance(entry.job_executor, UnsetValue) else entry.job_executor
+        misfire_grace_time = (
+            task_spec["misfire_grace_time"]
+            if isinstance(entry.misfire_grace_time, UnsetValue)
+            else as_timedelta(entry.misfire_grace_time)
+        )
+        window = self._get_spread_window(entry)
+        entry = self._spread_entry(cast("str", entry.id), entry)
+        return {
+            "task_id": callable_to_ref(entry.func),
+            "trigger": get_trigger_params(entry.trigger, keep_start=entry.explicit_start),
+            "args": list(entry.args),
+            "kwargs": entry.kwargs,
+            "job_executor": job_executor,
+            "misfire_grace_time": misfire_grace_time,
+            "coalesce": entry.coalesce.name,
+            "max_jitter": as_timedelta(entry.max_jitter),
+            "spread": window,
+        }
+
+    def _get_active_schedule_spec(self, schedule: Schedule, entry: ScheduleEntry) -> dict[str, Any]:
+        """Get the comparable specification of an active schedule, against its configured entry."""
+        return {
+            "task_id": schedule.task_id,
+            "trigger": get_trigger_params(schedule.trigger, keep_start=entry.explicit_start),
+            "args": list(schedule.args),
+            "kwargs": schedule.kwargs,
+            "job_executor": schedule.job_executor,
+            "misfire_grace_time": schedule.misfire_grace_time,
+            "coalesce": schedule.coalesce.name,
+            "max_jitter": schedule.max_jitter,
+            "spread": schedule.metadata.get(SCHEDULE_SPREAD_METADATA, 0),
+        }
@@ -1,9 +1,12 @@
 """APScheduler Builder."""
 
 from functools import cached_property
+from typing import TYPE_CHECKING, cast
 
 from apscheduler import AsyncScheduler
-from apscheduler.abc import DataStore, EventBroker
+from apscheduler.abc import DataStore, EventBroker, JobExecutor
+from apscheduler.executors.async_ import AsyncJobExecutor
+from apscheduler.executors.thread import ThreadPoolJobExecutor
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from fastapi_apscheduler4.config import (
@@ -11,12 +14,18 @@ from fastapi_apscheduler4.config import (
     EventBrokerType,
     PostgresConfig,
     PostgresEnvConfig,
+    ReconcileLockType,
     RedisConfig,
     RedisEnvConfig,
     SchedulerConfig,
     SchedulerEnvConfig,
 )
 from fastapi_apscheduler4.errors import ConfigNotFoundError, MissingDependencyError
+from fastapi_apscheduler4.executors import ProcessPoolJobExecutor
+from fastapi_apscheduler4.locks import MemoryReconcileLock, ReconcileLock
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
 
 
 class APSSchedulerBuilder(BaseModel):
@@ -27,6 +36,9 @@ class APSSchedulerBuilder(BaseModel):
     If not explicitly provided in the scheduler config, the data store and event broker types are computed as follows:
     - Data store: Postgres if available, otherwise Memory.
     - Event broker: Redis if available, Postgres if available, otherwise Memory.
+    - Reconcile lock: Postgres if the data store is Postgres, otherwise Memory.
+
+    The Postgres data store and event broker share the same pooled engine.
     """
 
     model_config = ConfigDict(frozen=True, validate_default=True, extra="forbid")
@@ -63,13 +75,74 @@ class APSSchedulerBuilder(BaseModel):
             return EventBrokerType.POSTGRES
         return EventBrokerType.MEMORY
 
+    @computed_field()
+    @cached_property
+    def computed_reconcile_lock_type(self) -> ReconcileLockType:
+        """Computed reconcile lock type."""
+        if self.scheduler.reconcile_lock:
+            if self.scheduler.reconcile_lock is ReconcileLockType.REDIS and not self.redis:
+                raise ConfigNotFoundError("redis", "Required for Redis reconcile lock.")
+            if self.scheduler.reconcile_lock is ReconcileLockType.POSTGRES and not self.postgres:
+                raise ConfigNotFoundError("postgres", "Required for Postgres reconcile lock.")
+            return self.scheduler.reconcile_lock
+        if self.computed_data_store_type is DataStoreType.POSTGRES:
+            return ReconcileLockType.POSTGRES
+        return ReconcileLockType.MEMORY
+
+    @cached_property
+    def engine(self) -> "AsyncEngine | None":
+        """Pooled async engine shared by the Postgres data store and event broker, None if neither is used."""
+        if (
+            self.computed_data_store_type is not DataStoreType.POSTGRES
+            and self.computed_event_broker_type is not EventBrokerType.POSTGRES
+        ):
+            return None
+
+        # Lazy imports to avoid SQLAlchemy dependency
+        try:
+            from sqlalchemy.ext.asyncio import create_async_engine
+        except ImportError as e:
+            raise MissingDependencyError(
+                dependency="sqlalchemy",
+                feature="Postgres engine",
+                extra="postgres",
+            ) from e
+
+        if not self.postgres:
+            raise ConfigNotFoundError("postgres", "Required for Postgres engine.")
+
+        return create_async_engine(
+            self.postgres.get_postgres_url(),
+            pool_size=self.postgres.pool_size,
+            max_overflow=self.postgres.max_overflow,
+            pool_pre_ping=self.postgres.pool_pre_ping,
+            pool_recycle=self.postgres.pool_recycle or -1,
+        )
+
     def build(self) -> AsyncScheduler:
         """Create APScheduler Async Scheduler."""
         return AsyncScheduler(
             data_store=self.build_data_store(),
             event_broker=self.build_event_broker(),
+            job_executors=self.build_job_executors(),
         )
 
+    def build_job_executors(self) -> dict[str, JobExecutor]:
+        """Build APScheduler job executors.
+
+        Same executors as the APScheduler defaults, with configurable `threadpool` and `processpool` executors.
+        """
+        return {
+            "async": AsyncJobExecutor(),
+            "threadpool": ThreadPoolJobExecutor(max_workers=self.scheduler.thread_pool_max_workers),
+            "processpool": ProcessPoolJobExecutor(
+                max_workers=self.scheduler.process_pool_max_workers,
+                forkserver=self.scheduler.process_pool_forkserver,
+                preload_modules=self.scheduler.process_pool_preload_modules or (),
+                max_jobs_per_child=self.scheduler.process_pool_max_jobs_per_child,
+            ),
+        }
+
     def build_event_broker(self) -> EventBroker:
         """Build APScheduler event broker."""
         broker_type = self.computed_event_broker_type
@@ -93,7 +166,7 @@ class APSSchedulerBuilder(BaseModel):
         if broker_type is EventBrokerType.POSTGRES:
             # Lazy imports to avoid asyncpg dependency
             try:
-                from apscheduler.eventbrokers.asyncpg import AsyncpgEventBroker
+                from fastapi_apscheduler4.eventbrokers import PooledAsyncpgEventBroker
             except ImportError as e:
                 raise MissingDependencyError(
                     dependency="asyncpg",
@@ -104,7 +177,7 @@ class APSSchedulerBuilder(BaseModel):
             if not self.postgres:
                 raise ConfigNotFoundError("postgres", "Required for Postgres event broker.")
 
-            return AsyncpgEventBroker(dsn=self.postgres.get_postgres_url())
+            return PooledAsyncpgEventBroker.from_engine(cast("AsyncEngine", self.engine))
 
         if broker_type is EventBrokerType.MEMORY:
             from apscheduler.eventbrokers.local import LocalEventBroker
@@ -133,7 +206,7 @@ class APSSchedulerBuilder(BaseModel):
             if not self.postgres:
                 raise ConfigNotFoundError("postgres", "Required for Postgres data store.")
 
-            return SQLAlchemyDataStore(self.postgres.get_postgres_url())
+            return SQLAlchemyDataStore(cast("AsyncEngine", self.engine))
 
         if data_store_type is DataStoreType.MEMORY:
             from apscheduler.datastores.memory import MemoryDataStore
@@ -143,3 +216,47 @@ class APSSchedulerBuilder(BaseModel):
         # Replace with assert_never(data_store_type) when Python 3.11 is the minimum supported version
         msg = f"Unexpected data store type: {data_store_type}"
         raise AssertionError(msg)
+
+    def build_reconcile_lock(self) -> ReconcileLock:
+        """Build the lock used to reconcile the auto schedules."""
+        lock_type = self.computed_reconcile_lock_type
+        timeout = self.scheduler.reconcile_lock_timeout
+
+        if lock_type is ReconcileLockType.REDIS:
+            # Lazy imports to avoid Redis dependency
+            try:
+                from fastapi_apscheduler4.locks.redis import RedisReconcileLock
+            except ImportError as e:
+                raise MissingDependencyError(
+                    dependency="redis",
+                    feature="Redis reconcile lock",
+                    extra="redis",
+                ) from e
+
+            if not self.redis:
+                raise ConfigNotFoundError("redis", "Required for Redis reconcile lock.")
+
+            return RedisReconcileLock(self.redis.get_redis_url(), timeout=timeout)
+
+        if lock_type is ReconcileLockType.POSTGRES:
+            # Lazy imports to avoid SQLAlchemy dependency
+            try:
+                from fastapi_apscheduler4.locks.postgres import PostgresReconcileLock
+            except ImportError as e:
+                raise MissingDependencyError(
+                    dependency="sqlalchemy",
+                    feature="Postgres reconcile lock",
+                    extra="postgres",
+                ) from e
+
+            if not self.postgres:
+                raise ConfigNotFoundError("postgres", "Required for Postgres reconcile lock.")
+
+            return PostgresReconcileLock(self.postgres.get_postgres_url(), timeout=timeout)
+
+        if lock_type is ReconcileLockType.MEMORY:
+            return MemoryReconcileLock(timeout=timeout)
+
+        # Replace with assert_never(lock_type) when Python 3.11 is the minimum supported version
+        msg = f"Unexpected reconcile lock type: {lock_type}"
+        raise AssertionError(msg)
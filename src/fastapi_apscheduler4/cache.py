@@ -0,0 +1,159 @@
+"""Response Cache.
+
+In-process cache and versions of the read endpoints, invalidated by the data store events published on the event
+broker, so that polling the API does not hit the data store while nothing changes.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import TYPE_CHECKING, Any, TypeVar
+from uuid import uuid4
+
+from apscheduler import ScheduleAdded, ScheduleRemoved, ScheduleUpdated, TaskAdded, TaskRemoved, TaskUpdated
+
+from fastapi_apscheduler4.constants import API_CACHE_DEFAULT_MAX_SIZE, API_CACHE_DEFAULT_TTL
+from fastapi_apscheduler4.schemas import CacheStats
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+    from apscheduler import Event
+    from apscheduler.abc import EventBroker, Subscription
+
+T = TypeVar("T")
+
+
+class CacheNamespace(str, Enum):
+    """Cache Namespace.
+
+    Group of entries invalidated together.
+    """
+
+    SCHEDULES = "schedules"
+    TASKS = "tasks"
+
+
+EVENT_NAMESPACES: dict[type[Event], CacheNamespace] = {
+    ScheduleAdded: CacheNamespace.SCHEDULES,
+    ScheduleUpdated: CacheNamespace.SCHEDULES,
+    ScheduleRemoved: CacheNamespace.SCHEDULES,
+    TaskAdded: CacheNamespace.TASKS,
+    TaskUpdated: CacheNamespace.TASKS,
+    TaskRemoved: CacheNamespace.TASKS,
+}
+"""Namespace invalidated by each data store event."""
+
+
+class DataStoreVersions:
+    """Data Store Versions.
+
+    Version of each namespace, bumped on invalidation by the data store events. The versions are local to the process,
+    so they come with a random epoch telling them apart from the versions of the other processes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the versions."""
+        self.epoch = uuid4().hex
+        self._versions = dict.fromkeys(CacheNamespace, 0)
+
+    def subscribe(self, event_broker: EventBroker) -> Subscription:
+        """Subscribe to the data store events invalidating the namespaces."""
+        return event_broker.subscribe(self.handle_event, EVENT_NAMESPACES.keys())
+
+    def handle_event(self, event: Event) -> None:
+        """Invalidate the namespace changed by a data store event."""
+        namespace = EVENT_NAMESPACES.get(type(event))
+        if namespace is not None:
+            self.invalidate(namespace)
+
+    def invalidate(self, namespace: CacheNamespace) -> None:
+        """Invalidate a namespace, bumping its version."""
+        self._versions[namespace] += 1
+
+    def get_version(self, namespace: CacheNamespace) -> int:
+        """Get the version of a namespace, bumped on each invalidation."""
+        return self._versions[namespace]
+
+    def get_etag(self, namespace: CacheNamespace) -> str:
+        """Get the weak ETag of the current version of a namespace."""
+        return f'W/"{self.epoch}-{self._versions[namespace]}"'
+
+
+class ResponseCache(DataStoreVersions):
+    """Response Cache.
+
+    Least recently used entries are evicted beyond the maximum size. The TTL bounds the staleness when an event is
+    missed, for example while the event broker reconnects.
+
+    A result loaded while its namespace is invalidated is not stored, so that a concurrent change is never hidden by
+    the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = API_CACHE_DEFAULT_MAX_SIZE,
+        ttl: float = API_CACHE_DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries.
+            ttl: Time to live of the entries in seconds.
+            clock: Monotonic clock in seconds.
+        """
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[tuple[CacheNamespace, Hashable], tuple[float, Any]] = OrderedDict()
+
+    def invalidate(self, namespace: CacheNamespace) -> None:
+        """Invalidate all the entries of a namespace, bumping its version."""
+        super().invalidate(namespace)
+        for key in [key for key in self._entries if key[0] is namespace]:
+            del self._entries[key]
+
+    async def get_or_load(self, namespace: CacheNamespace, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """Get a cached result, or load and cache it.
+
+        The errors are not cached.
+        """
+        entry_key = (namespace, key)
+        entry = self._entries.get(entry_key)
+        if entry is not None:
+            expires_at, value = entry
+            if self._clock() < expires_at:
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+                return value
+            del self._entries[entry_key]
+
+        self.misses += 1
+        version = self._versions[namespace]
+        value = await load()
+        if self._versions[namespace] == version:
+            self._entries[entry_key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def get_stats(self) -> CacheStats:
+        """Get the cache statistics."""
+        return CacheStats(hits=self.hits, misses=self.misses, size=len(self._entries), max_size=self.max_size)
+
+
+async def get_or_load(
+    cache: ResponseCache | None, namespace: CacheNamespace, key: Hashable, load: Callable[[], Awaitable[T]]
+) -> T:
+    """Get a cached result, or load it when there is no cache."""
+    if cache is None:
+        return await load()
+    return await cache.get_or_load(namespace, key, load)
@@ -1,6 +1,7 @@
 """Configuration models."""
 
 import os
+import sys
 from enum import Enum
 from typing import Annotated, cast
 
@@ -19,7 +20,15 @@ from pydantic_core import MultiHostUrl, Url
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing_extensions import Self
 
-from fastapi_apscheduler4.constants import API_PAGE_DEFAULT_LIMIT, API_PAGE_MAX_LIMIT
+from fastapi_apscheduler4.constants import (
+    API_CACHE_DEFAULT_MAX_SIZE,
+    API_CACHE_DEFAULT_TTL,
+    API_PAGE_DEFAULT_LIMIT,
+    API_PAGE_MAX_LIMIT,
+    EVENTS_DEFAULT_BUFFER_SIZE,
+    EVENTS_DEFAULT_KEEPALIVE,
+    JOB_RESULT_DEFAULT_MAX_WAIT,
+)
 from fastapi_apscheduler4.utils import transform_comma_separated_string_to_list
 
 
@@ -86,6 +95,14 @@ class DataStoreType(str, Enum):
     POSTGRES = "postgres"
 
 
+class ReconcileLockType(str, Enum):
+    """Scheduler reconcile lock."""
+
+    MEMORY = "memory"
+    POSTGRES = "postgres"
+    REDIS = "redis"
+
+
 class PostgresConfig(_BaseConfig):
     """Postgres Config."""
 
@@ -94,6 +111,25 @@ class PostgresConfig(_BaseConfig):
     username: str
     password: SecretStr
     db: str
+    pool_size: Annotated[
+        int,
+        Field(
+            ge=1,
+            description=(
+                "Number of connections kept in the pool shared by the data store and the event broker, which holds "
+                "one of them to listen to the events."
+            ),
+        ),
+    ] = 5
+    max_overflow: Annotated[
+        int, Field(ge=0, description="Number of connections opened beyond the pool size under load.")
+    ] = 10
+    pool_pre_ping: Annotated[
+        bool, Field(description="True will test the connections when they are checked out of the pool.")
+    ] = True
+    pool_recycle: Annotated[
+        int | None, Field(gt=0, description="Maximum age in seconds of a connection before it is replaced.")
+    ] = None
 
     def get_postgres_dsn(self) -> PostgresDsn:
         """Get Postgres URL."""
@@ -149,6 +185,86 @@ class SchedulerConfig(_BaseConfig):
     event_broker: EventBrokerType | None = None
     data_store: DataStoreType | None = None
     redis_channel: str = "apscheduler"
+    reconcile_lock: ReconcileLockType | None = None
+    reconcile_lock_timeout: Annotated[
+        float,
+        Field(gt=0, description="Maximum time in seconds to wait for the reconcile lock before reconciling anyway."),
+    ] = 60
+    background_startup: Annotated[
+        bool,
+        Field(
+            description=(
+                "True will serve requests right away and start the scheduler in the background, "
+                "the readiness endpoint reports when it is ready."
+            )
+        ),
+    ] = False
+    startup_timeout: Annotated[
+        float | None,
+        Field(gt=0, description="Maximum time in seconds to start the scheduler in the background."),
+    ] = None
+    spread: Annotated[
+        float,
+        Field(
+            ge=0,
+            description=(
+                "Default window in seconds to spread the schedule fire times with a deterministic offset per "
+                "schedule ID, 0 to disable."
+            ),
+        ),
+    ] = 0
+    thread_pool_max_workers: Annotated[
+        int,
+        Field(
+            gt=0,
+            description=(
+                "Number of concurrent jobs of the `threadpool` executor, separate from the thread limit of the "
+                "sync API routes."
+            ),
+        ),
+    ] = 40
+    thread_pool_sync_jobs: Annotated[
+        bool,
+        Field(
+            description=(
+                "True will run the sync functions in the `threadpool` executor instead of blocking the event loop, "
+                "unless they have an explicit job executor."
+            )
+        ),
+    ] = True
+    process_pool_max_workers: Annotated[
+        int | None,
+        Field(gt=0, description="Number of worker processes of the `processpool` executor, defaults to the CPU count."),
+    ] = None
+    process_pool_forkserver: Annotated[
+        bool,
+        Field(
+            description=(
+                "True will fork the `processpool` workers from a server process that has imported the preloaded "
+                "modules, instead of spawning fresh interpreters."
+            )
+        ),
+    ] = False
+    process_pool_preload_modules: Annotated[
+        list[str] | None,
+        BeforeValidator(transform_comma_separated_string_to_list),
+        Field(description="Modules imported once by each `processpool` worker, comma separated in environment."),
+    ] = None
+    process_pool_max_jobs_per_child: Annotated[
+        int | None,
+        Field(
+            gt=0,
+            description="Number of jobs a `processpool` worker runs before being replaced (Python 3.11+).",
+        ),
+    ] = None
+
+    @model_validator(mode="after")
+    def validate_process_pool(self) -> Self:
+        """Validate that recycling the process pool workers is supported."""
+        if self.process_pool_max_jobs_per_child and sys.version_info < (3, 11):
+            msg = "process_pool_max_jobs_per_child requires Python 3.11+"
+            raise ValueError(msg)
+        return self
 
 
 class SchedulerAPIConfig(_BaseConfig):
@@ -158,6 +274,43 @@ class SchedulerAPIConfig(_BaseConfig):
     prefix: str = "/api/v1"
     tags: Annotated[list[str | Enum] | None, BeforeValidator(transform_comma_separated_string_to_list)] = ["scheduler"]
     include_in_schema: bool = True
+    cache_enabled: Annotated[
+        bool,
+        Field(
+            description=(
+                "True will cache the schedules and tasks read endpoints in process, invalidated by the data store "
+                "events of the event broker."
+            )
+        ),
+    ] = False
+    cache_max_size: Annotated[int, Field(ge=1, description="Maximum number of cached responses.")] = (
+        API_CACHE_DEFAULT_MAX_SIZE
+    )
+    cache_ttl: Annotated[
+        float, Field(gt=0, description="Time to live in seconds of the cached responses, if an event is missed.")
+    ] = API_CACHE_DEFAULT_TTL
+    etag_enabled: Annotated[
+        bool,
+        Field(
+            description=(
+                "True will return an ETag on the schedules and tasks read endpoints, versioned by the data store "
+                "events of the event broker, and respond with 304 Not Modified to the matching `If-None-Match`."
+            )
+        ),
+    ] = False
+    jobs_enabled: Annotated[bool, Field(description="True will add the jobs routes.")] = True
+    job_result_max_wait: Annotated[
+        float, Field(gt=0, description="Maximum number of seconds a job result request waits for the job to finish.")
+    ] = JOB_RESULT_DEFAULT_MAX_WAIT
+    events_enabled: Annotated[
+        bool, Field(description="True will stream the events of the event broker as server-sent events.")
+    ] = False
+    events_buffer_size: Annotated[
+        int, Field(ge=1, description="Maximum number of events buffered per client, beyond which they are dropped.")
+    ] = EVENTS_DEFAULT_BUFFER_SIZE
+    events_keepalive: Annotated[
+        float, Field(gt=0, description="Number of seconds without event after which a keepalive comment is sent.")
+    ] = EVENTS_DEFAULT_KEEPALIVE
 
 
 class RedisEnvConfig(RedisConfig, _BaseEnvConfig):
@@ -1,6 +1,40 @@
 """Constants."""
 
 SCHEDULE_PREFIX = "auto:"
+MANIFEST_TASK_ID = f"{SCHEDULE_PREFIX}manifest"
+"""Task storing the fingerprint of the auto schedules, hidden from the API."""
+SCHEDULE_SPREAD_METADATA = "spread"
+"""Schedule metadata key of the spread window applied to the trigger, compared when reconciling."""
+THREAD_POOL_JOB_EXECUTOR = "threadpool"
+"""Job executor running the sync functions."""
+TRIGGER_DEFAULT_START_TOLERANCE = 1.0
+"""Number of seconds before its registration within which the start time of a trigger is taken as its default."""
+BULK_MAX_CONCURRENCY = 100
+"""Default maximum number of concurrent data store writes of the bulk operations."""
+BULK_BATCH_SIZE = 500
+"""Number of schedules acted on by each data store operation of the bulk operations."""
 
 API_PAGE_DEFAULT_LIMIT = 100
 API_PAGE_MAX_LIMIT = 1000
+API_CACHE_DEFAULT_MAX_SIZE = 1024
+"""Default maximum number of entries of the response cache."""
+API_CACHE_DEFAULT_TTL = 60.0
+"""Default time to live in seconds of the response cache entries."""
+JOB_RESULT_DEFAULT_MAX_WAIT = 60.0
+"""Default maximum number of seconds a job result request waits for the job to finish."""
+JOB_RUN_DEFAULT_RESULT_EXPIRATION = 300.0
+"""Default number of seconds the results of the jobs run from the API are kept."""
+HISTOGRAM_MAX_HORIZON = 86400
+"""Maximum number of seconds of the fire time histogram."""
+HISTOGRAM_MAX_FIRE_TIMES = 20000
+"""Maximum number of fire times computed for the fire time histogram, over all the schedules."""
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+EXPORT_CHUNK_SIZE = 500
+"""Number of items read from the data store at once by the exports."""
+SSE_MEDIA_TYPE = "text/event-stream"
+EVENTS_DEFAULT_BUFFER_SIZE = 100
+"""Default number of events buffered per client of the event stream, beyond which the events are dropped."""
+EVENTS_DEFAULT_KEEPALIVE = 15.0
+"""Default number of seconds without event after which the event stream sends a keepalive comment."""
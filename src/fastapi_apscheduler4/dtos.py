@@ -1,15 +1,142 @@
 """Data Transfer Objects (DTOs)."""
 
 from collections.abc import Callable
+from datetime import timedelta
+from typing import Any, Generic, TypeVar
 
+from apscheduler import CoalescePolicy
+from apscheduler._utils import UnsetValue, unset
 from apscheduler.abc import Trigger as APSchedulerTrigger
-from pydantic import BaseModel, Field
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, model_validator
+from typing_extensions import Self, TypedDict
 
-ScheduleType = tuple[Callable, APSchedulerTrigger]
+from fastapi_apscheduler4.schemas import TriggerType
+
+T = TypeVar("T")
 
 
 class LimitOffset(BaseModel):
-    """Limit Offset."""
+    """Limit Offset.
+
+    The cursor of the next page takes precedence over the offset when given.
+    """
 
     limit: int = Field(ge=1)
     offset: int = Field(ge=0)
+    cursor: str | None = None
+
+
+class ScheduleFilters(BaseModel):
+    """Schedule Filters.
+
+    The schedules must match all the given filters, and any of the values of a multi-valued filter.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    task_id: list[str] | None = None
+    trigger: list[TriggerType] | None = None
+    acquired_by: str | None = None
+    next_fire_time_min: AwareDatetime | None = None
+    next_fire_time_max: AwareDatetime | None = None
+
+
+class ScheduleSelection(BaseModel):
+    """Schedule Selection.
+
+    The schedules of a bulk operation, either by ID or matching the filters.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    ids: list[str] | None = Field(default=None, description="IDs of the schedules, the unknown ones are reported.")
+    filters: ScheduleFilters | None = Field(default=None, description="Filters of the schedules, instead of the IDs.")
+
+    @model_validator(mode="after")
+    def validate_selection(self) -> Self:
+        """Validate that either the IDs or the filters are given."""
+        if (self.ids is None) == (self.filters is None):
+            msg = "Either the IDs or the filters must be given."
+            raise ValueError(msg)
+        return self
+
+
+class JobFilters(BaseModel):
+    """Job Filters.
+
+    The jobs must match all the given filters, and any of the values of a multi-valued filter.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    task_id: list[str] | None = None
+    acquired: bool | None = None
+
+
+class Page(BaseModel, Generic[T]):
+    """Page.
+
+    A page of items, with the total count when it is computed and the cursor of the next page if any.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    items: list[T]
+    total_count: int | None = None
+    next_cursor: str | None = None
+
+
+class ScheduleOptions(TypedDict, total=False):
+    """Schedule Options.
+
+    Job execution options of a schedule. The unset options fall back to the task, then to the scheduler defaults.
+    """
+
+    job_executor: str | UnsetValue
+    max_running_jobs: int | UnsetValue | None
+    misfire_grace_time: float | timedelta | UnsetValue | None
+    coalesce: CoalescePolicy
+    max_jitter: float | timedelta | None
+    spread: float | None
+
+
+class ScheduleEntry(BaseModel):
+    """Schedule Entry.
+
+    A schedule to add in bulk. A random ID is assigned if none is given.
+
+    The task options (`job_executor`, `max_running_jobs` and `misfire_grace_time`) configure the task of the function
+    with its first entry, so `max_running_jobs` is shared by all the schedules of a function.
+
+    The `spread` window defaults to the scheduler config, 0 disables it. A paused schedule does not fire until resumed.
+
+    The start times of the trigger are only compared to the stored schedule when `explicit_start` is set, since they
+    default to the instantiation time of the trigger.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    func: Callable[..., Any]
+    trigger: APSchedulerTrigger
+    id: str | None = None
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = Field(default_factory=dict)
+    job_executor: str | UnsetValue = unset
+    max_running_jobs: int | UnsetValue | None = unset
+    misfire_grace_time: float | timedelta | UnsetValue | None = unset
+    coalesce: CoalescePolicy = CoalescePolicy.latest
+    max_jitter: float | timedelta | None = None
+    spread: float | None = Field(default=None, ge=0)
+    paused: bool = False
+    explicit_start: bool = False
+
+
+class ScheduleEntryResult(BaseModel):
+    """Schedule Entry Result.
+
+    The outcome of adding a single schedule in bulk.
+    """
+
+    id: str
+    success: bool
+    error: str | None = None
@@ -10,8 +10,6 @@ from fastapi import HTTPException, status
 from fastapi_apscheduler4 import logger
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
     from pydantic import BaseModel
 
 
@@ -88,10 +86,20 @@ class ScheduleAlreadyExistsError(FastAPIAPScheduler4Error, ValueError):
     Raised when trying to add a schedule that already exists.
     """
 
-    def __init__(self, func: Callable) -> None:
+    def __init__(self, schedule_id: str) -> None:
         """Initialize the error."""
-        func_name = getattr(func, "__name__", repr(func))
-        super().__init__(f"Schedule for function {func_name} already exists.")
+        super().__init__(f"Schedule {schedule_id} already exists.")
+
+
+class InvalidCursorError(FastAPIAPScheduler4Error, ValueError):
+    """Invalid Cursor Error.
+
+    Raised when a pagination cursor is malformed or was not returned by the API.
+    """
+
+    def __init__(self, cursor: str) -> None:
+        """Initialize the error."""
+        super().__init__(f"Invalid cursor {cursor}.")
 
 
 class APIError(FastAPIAPScheduler4Error, HTTPException):
@@ -136,3 +144,49 @@ class DeleteNotAllowedAPIError(APIError):
         """Initialize the error."""
         detail = f"{model.__name__} with ID {id} does not allow delete."
         super().__init__(status_code=status.HTTP_405_METHOD_NOT_ALLOWED, detail=detail)
+
+
+class WriteNotAllowedAPIError(APIError):
+    """Write Not Allowed API Error.
+
+    Raised when a resource does not allow create or update operations from the API.
+    """
+
+    def __init__(self, model: type, id: str) -> None:
+        """Initialize the error."""
+        detail = f"{model.__name__} with ID {id} does not allow write."
+        super().__init__(status_code=status.HTTP_405_METHOD_NOT_ALLOWED, detail=detail)
+
+
+class AlreadyExistsAPIError(APIError):
+    """Already Exists API Error.
+
+    Raised when creating a resource whose ID is already taken from the API.
+    """
+
+    def __init__(self, model: type[BaseModel], id: str) -> None:
+        """Initialize the error."""
+        detail = f"{model.__name__} with ID {id} already exists."
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+class InvalidCursorAPIError(APIError):
+    """Invalid Cursor API Error.
+
+    Raised when a pagination cursor is malformed or was not returned by the API.
+    """
+
+    def __init__(self, cursor: str) -> None:
+        """Initialize the error."""
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid cursor {cursor}.")
+
+
+class NotReadyAPIError(APIError):
+    """Not Ready API Error.
+
+    Raised when the scheduler is still starting in the background or failed to start.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the error."""
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Scheduler is not ready.")
@@ -0,0 +1,54 @@
+"""Event Brokers."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+import attrs
+from apscheduler.eventbrokers.asyncpg import AsyncpgEventBroker
+from sqlalchemy.exc import InterfaceError, OperationalError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    import asyncpg
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@attrs.define(eq=False, repr=False)
+class PooledAsyncpgEventBroker(AsyncpgEventBroker):
+    """Pooled Asyncpg Event Broker.
+
+    Same as the APScheduler asyncpg event broker, except that the connection is checked out of the pool of an
+    SQLAlchemy engine instead of being opened on its own, so that the broker shares the pool of the data store.
+
+    The engine is not disposed by the broker.
+    """
+
+    engine: AsyncEngine = attrs.field(kw_only=True)
+
+    @classmethod
+    def from_engine(cls, engine: AsyncEngine, *, channel: str = "apscheduler") -> PooledAsyncpgEventBroker:
+        """Create the event broker from an SQLAlchemy engine using the asyncpg driver."""
+        if engine.dialect.driver != "asyncpg":
+            msg = f'The driver in the engine must be "asyncpg" (current: {engine.dialect.driver})'
+            raise ValueError(msg)
+
+        # The DSN is only used for the representation of the broker, the connections come from the engine
+        dsn = engine.url.render_as_string(hide_password=True).replace("+asyncpg", "")
+        return cls(dsn, engine=engine, channel=channel)
+
+    @property
+    def _temporary_failure_exceptions(self) -> tuple[type[Exception], ...]:
+        """Exceptions retried when connecting, including the ones wrapped by SQLAlchemy."""
+        return (*super()._temporary_failure_exceptions, OperationalError, InterfaceError)
+
+    @asynccontextmanager
+    async def _connect(self) -> AsyncGenerator[asyncpg.Connection, None]:
+        """Check a connection out of the engine pool, returned to the pool on exit."""
+        async for attempt in self._retry():
+            with attempt:
+                async with self.engine.connect() as connection:
+                    raw_connection = await connection.get_raw_connection()
+                    yield raw_connection.driver_connection
@@ -0,0 +1,105 @@
+"""Event Stream.
+
+Server-sent events (SSE) of the APScheduler events published on the event broker, filtered by type and task.
+
+Each client reads its events from a bounded buffer. The events published while the buffer of a slow client is full are
+dropped, rather than buffered without bound, and the client is told how many were dropped before its next event.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import TYPE_CHECKING
+
+import apscheduler as aps
+from anyio import WouldBlock, create_memory_object_stream, move_on_after
+from pydantic_core import to_json
+
+from fastapi_apscheduler4.constants import EVENTS_DEFAULT_BUFFER_SIZE, EVENTS_DEFAULT_KEEPALIVE, MANIFEST_TASK_ID
+from fastapi_apscheduler4.schemas import EventType
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+    from apscheduler.abc import EventBroker, Subscription
+
+EVENT_CLASSES: dict[EventType, type[aps.Event]] = {
+    event_type: getattr(aps, event_type.value) for event_type in EventType
+}
+"""APScheduler event class of each event type."""
+
+DROPPED_EVENT = "dropped"
+"""Name of the event telling a slow client how many events were dropped."""
+CONNECTED = b": connected\n\n"
+"""Comment sent once subscribed, so that the client knows from when the events are streamed."""
+KEEPALIVE = b": keepalive\n\n"
+"""Comment sent while there is no event, so that the idle connections are not closed by the proxies."""
+
+
+def format_sse(event: str, data: bytes) -> bytes:
+    """Format a server-sent event."""
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+def dump_event(event: aps.Event) -> bytes:
+    """Dump the fields of an APScheduler event into JSON, with the enums by name."""
+    fields = {key: value.name if isinstance(value, Enum) else value for key, value in event.marshal().items()}
+    return to_json(fields)
+
+
+class EventStream:
+    """Event Stream of a client.
+
+    The events of the hidden manifest task are never streamed.
+    """
+
+    def __init__(
+        self,
+        *,
+        types: Iterable[EventType] | None = None,
+        task_ids: Iterable[str] | None = None,
+        buffer_size: int = EVENTS_DEFAULT_BUFFER_SIZE,
+        keepalive: float = EVENTS_DEFAULT_KEEPALIVE,
+    ) -> None:
+        """Initialize the event stream.
+
+        Args:
+            types: Types of the streamed events, all of them if empty.
+            task_ids: IDs of the tasks of the streamed events, all of them if empty.
+            buffer_size: Maximum number of buffered events, beyond which the events are dropped.
+            keepalive: Number of seconds without event after which a keepalive comment is sent.
+        """
+        self.types = frozenset(types or EventType)
+        self.task_ids = frozenset(task_ids) if task_ids else None
+        self.keepalive = keepalive
+        self.dropped = 0
+        self._send, self._receive = create_memory_object_stream[aps.Event](buffer_size)
+
+    def subscribe(self, event_broker: EventBroker) -> Subscription:
+        """Subscribe to the events of the streamed types."""
+        return event_broker.subscribe(self.handle_event, [EVENT_CLASSES[event_type] for event_type in self.types])
+
+    def handle_event(self, event: aps.Event) -> None:
+        """Buffer an event of the streamed tasks, or drop it if the buffer is full."""
+        task_id = getattr(event, "task_id", None)
+        if task_id == MANIFEST_TASK_ID or (self.task_ids is not None and task_id not in self.task_ids):
+            return
+        try:
+            self._send.send_nowait(event)
+        except WouldBlock:
+            self.dropped += 1
+
+    async def iter_sse(self) -> AsyncIterator[bytes]:
+        """Iterate over the server-sent events of the buffered events, until cancelled."""
+        while True:
+            event: aps.Event | None = None
+            with move_on_after(self.keepalive):
+                event = await self._receive.receive()
+            if event is None:
+                yield KEEPALIVE
+                continue
+
+            if self.dropped:
+                yield format_sse(DROPPED_EVENT, to_json({"count": self.dropped}))
+                self.dropped = 0
+            yield format_sse(type(event).__name__, dump_event(event))
@@ -0,0 +1,100 @@
+"""Job Executors."""
+
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from anyio import CapacityLimiter, get_cancelled_exc_class, to_thread
+from apscheduler.abc import JobExecutor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from contextlib import AsyncExitStack
+
+    from apscheduler import Job
+
+
+class ProcessPoolJobExecutor(JobExecutor):
+    """Process Pool Job Executor.
+
+    Runs the jobs in a pool of long-lived worker processes, so the modules imported by a job are only imported once
+    per worker instead of once per job.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        forkserver: bool = False,
+        preload_modules: Sequence[str] = (),
+        max_jobs_per_child: int | None = None,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Number of worker processes, defaults to the number of CPUs.
+            forkserver: True will fork the workers from a server process that has already imported the preloaded
+                modules, which is faster than spawning fresh interpreters.
+            preload_modules: Modules imported by each worker when it starts.
+            max_jobs_per_child: Number of jobs a worker runs before being replaced, unlimited by default.
+                Requires Python 3.11+.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.forkserver = forkserver
+        self.preload_modules = list(preload_modules)
+        self.max_jobs_per_child = max_jobs_per_child
+        self._pool: ProcessPoolExecutor | None = None
+        self._limiter = CapacityLimiter(self.max_workers)
+
+    async def start(self, exit_stack: AsyncExitStack) -> None:
+        """Start the worker processes, which are shut down with the scheduler."""
+        self._pool = self._create_pool()
+        exit_stack.push_async_callback(to_thread.run_sync, self._pool.shutdown)
+
+    async def run_job(self, func: Callable[..., Any], job: Job) -> Any:  # noqa: ANN401
+        """Run the job in a worker process."""
+        if self._pool is None:
+            msg = "The process pool job executor is not started."
+            raise RuntimeError(msg)
+
+        future = self._pool.submit(partial(func, *job.args, **job.kwargs))
+        try:
+            # Waiting threads are capped to the number of workers, the pool queues the other jobs
+            return await to_thread.run_sync(future.result, abandon_on_cancel=True, limiter=self._limiter)
+        except get_cancelled_exc_class():
+            future.cancel()
+            raise
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        """Create the process pool."""
+        if self.forkserver:
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload(self.preload_modules)
+        elif self.max_jobs_per_child:
+            # Recycling the workers is not supported with the fork start method
+            context = multiprocessing.get_context("spawn")
+        else:
+            context = None
+
+        kwargs: dict[str, Any] = {}
+        if self.max_jobs_per_child:
+            kwargs["max_tasks_per_child"] = self.max_jobs_per_child
+
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=_preload_modules,
+            initargs=(self.preload_modules,),
+            **kwargs,
+        )
+
+
+def _preload_modules(modules: list[str]) -> None:
+    """Import the modules in a worker process."""
+    for module in modules:
+        importlib.import_module(module)
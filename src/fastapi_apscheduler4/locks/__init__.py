@@ -0,0 +1,90 @@
+"""Reconcile Locks.
+
+Locks ensuring that a single process reconciles the auto schedules at a time when several processes share the same
+data store.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from anyio import move_on_after, sleep
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+RECONCILE_LOCK_NAME = "fastapi_apscheduler4:reconcile"
+
+
+class ReconcileLock(ABC):
+    """Reconcile Lock.
+
+    Base class for all reconcile locks. Subclasses only implement a non-blocking acquire and a release, the waiting is
+    done by polling until the timeout is reached.
+    """
+
+    def __init__(self, *, timeout: float = 60, poll_interval: float = 0.5) -> None:
+        """Initialize the lock.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the lock.
+            poll_interval: Time in seconds between two acquire attempts.
+        """
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+    @asynccontextmanager
+    async def hold(self) -> AsyncGenerator[bool, None]:
+        """Hold the lock, waiting up to the timeout to acquire it.
+
+        Yields:
+            True if the lock is acquired, False if the timeout is reached.
+        """
+        acquired = False
+        try:
+            with move_on_after(self.timeout):
+                acquired = await self._try_acquire()
+                while not acquired:
+                    await sleep(self.poll_interval)
+                    acquired = await self._try_acquire()
+            yield acquired
+        finally:
+            if acquired:
+                await self._release()
+            await self._close()
+
+    @abstractmethod
+    async def _try_acquire(self) -> bool:
+        """Try to acquire the lock without waiting."""
+
+    @abstractmethod
+    async def _release(self) -> None:
+        """Release the acquired lock."""
+
+    async def _close(self) -> None:  # noqa: B027
+        """Close the resources opened to acquire the lock."""
+
+
+class MemoryReconcileLock(ReconcileLock):
+    """Memory Reconcile Lock.
+
+    Only locks within the current process, which is enough for the memory data store that is not shared.
+    """
+
+    def __init__(self, *, timeout: float = 60, poll_interval: float = 0.5) -> None:
+        """Initialize the lock."""
+        super().__init__(timeout=timeout, poll_interval=poll_interval)
+        self._locked = False
+
+    async def _try_acquire(self) -> bool:
+        """Try to acquire the lock without waiting."""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    async def _release(self) -> None:
+        """Release the acquired lock."""
+        self._locked = False
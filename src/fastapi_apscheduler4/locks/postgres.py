@@ -0,0 +1,54 @@
+"""Postgres Reconcile Lock."""
+
+from __future__ import annotations
+
+import hashlib
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from fastapi_apscheduler4.locks import RECONCILE_LOCK_NAME, ReconcileLock
+
+
+class PostgresReconcileLock(ReconcileLock):
+    """Postgres Reconcile Lock.
+
+    Uses a session level advisory lock, which is released by Postgres if the process dies while holding it.
+    """
+
+    def __init__(
+        self, url: str, *, name: str = RECONCILE_LOCK_NAME, timeout: float = 60, poll_interval: float = 0.5
+    ) -> None:
+        """Initialize the lock.
+
+        Args:
+            url: SQLAlchemy URL of the Postgres database (asyncpg driver).
+            name: Lock name, hashed to the advisory lock key.
+            timeout: Maximum time in seconds to wait for the lock.
+            poll_interval: Time in seconds between two acquire attempts.
+        """
+        super().__init__(timeout=timeout, poll_interval=poll_interval)
+        self._engine = create_async_engine(url, poolclass=NullPool)
+        self._key = int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], "big", signed=True)
+        self._connection: AsyncConnection | None = None
+
+    async def _try_acquire(self) -> bool:
+        """Try to acquire the lock without waiting."""
+        if self._connection is None:
+            self._connection = await self._engine.connect()
+            await self._connection.execution_options(isolation_level="AUTOCOMMIT")
+        result = await self._connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self._key})
+        return bool(result.scalar())
+
+    async def _release(self) -> None:
+        """Release the acquired lock."""
+        if self._connection is not None:
+            await self._connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self._key})
+
+    async def _close(self) -> None:
+        """Close the connection holding the lock."""
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+        await self._engine.dispose()
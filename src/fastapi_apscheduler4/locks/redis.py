@@ -0,0 +1,118 @@
+"""Redis Reconcile Lock."""
+
+from __future__ import annotations
+
+import uuid
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from anyio import create_task_group, sleep
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from fastapi_apscheduler4 import logger
+from fastapi_apscheduler4.locks import RECONCILE_LOCK_NAME, ReconcileLock
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+_RENEW_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class RedisReconcileLock(ReconcileLock):
+    """Redis Reconcile Lock.
+
+    Uses a `SET NX` lease renewed while the lock is held, so a process dying while holding it cannot block the others
+    for longer than the lease, and a long reconciliation keeps the lock. The lease is only renewed and released with
+    the token of the process holding it.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        name: str = RECONCILE_LOCK_NAME,
+        timeout: float = 60,
+        poll_interval: float = 0.5,
+        lease: float = 30,
+    ) -> None:
+        """Initialize the lock.
+
+        Args:
+            url: Redis URL.
+            name: Lock name, used as the Redis key.
+            timeout: Maximum time in seconds to wait for the lock.
+            poll_interval: Time in seconds between two acquire attempts.
+            lease: Time in seconds after which the lock expires if not renewed, renewed every third of it.
+        """
+        super().__init__(timeout=timeout, poll_interval=poll_interval)
+        self.lease = lease
+        self._url = url
+        self._name = name
+        self._token = uuid.uuid4().hex
+        self._client: Redis | None = None
+
+    @asynccontextmanager
+    async def hold(self) -> AsyncGenerator[bool, None]:
+        """Hold the lock, renewing its lease until released.
+
+        Yields:
+            True if the lock is acquired, False if the timeout is reached.
+        """
+        async with super().hold() as acquired:
+            if not acquired:
+                yield False
+                return
+            async with create_task_group() as task_group:
+                task_group.start_soon(self._renew)
+                try:
+                    yield True
+                finally:
+                    task_group.cancel_scope.cancel()
+
+    async def _try_acquire(self) -> bool:
+        """Try to acquire the lock without waiting."""
+        if self._client is None:
+            self._client = Redis.from_url(self._url)
+        return bool(await self._client.set(self._name, self._token, nx=True, px=self._lease_ms))
+
+    async def _renew(self) -> None:
+        """Renew the lease every third of it, until lost or cancelled."""
+        while self._client is not None:
+            await sleep(self.lease / 3)
+            try:
+                renewed = await self._client.eval(_RENEW_SCRIPT, 1, self._name, self._token, self._lease_ms)
+            except RedisError as error:
+                logger.warning(f"Scheduler: Failed to renew the reconcile lock lease: {error!r}")
+                return
+            if not renewed:
+                logger.warning("Scheduler: Reconcile lock lease lost before release")
+                return
+
+    async def _release(self) -> None:
+        """Release the lease if still owned."""
+        if self._client is not None:
+            await self._client.eval(_RELEASE_SCRIPT, 1, self._name, self._token)
+
+    async def _close(self) -> None:
+        """Close the Redis client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def _lease_ms(self) -> int:
+        """Lease duration in milliseconds."""
+        return int(self.lease * 1000)
@@ -0,0 +1,147 @@
+"""Newline Delimited JSON (NDJSON).
+
+Export and import of the schedules and tasks, one JSON object per line, so that they are streamed with a flat memory
+usage at any count.
+
+The objects are encoded with the APScheduler JSON serializer, so that the triggers are restored as they were exported.
+The acquisition state of the schedules and the running jobs of the tasks are not exported.
+
+An object that cannot be serialized is exported as an error line holding its ID and the error, so that the export
+completes and reports what it left out, and the line is reported as a failure when imported.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import attrs
+from apscheduler import Schedule, SerializationError, Task
+from apscheduler.serializers.json import JSONSerializer
+
+from fastapi_apscheduler4 import logger
+from fastapi_apscheduler4.constants import NDJSON_MEDIA_TYPE
+from fastapi_apscheduler4.utils import get_error_message
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+
+    from fastapi_apscheduler4.dtos import Page
+
+T = TypeVar("T")
+ExportedT = TypeVar("ExportedT", Schedule, Task)
+
+_SCHEDULE_EXCLUDED_FIELDS = ("acquired_by", "acquired_until")
+_TASK_EXCLUDED_FIELDS = ("running_jobs",)
+EXPORT_ERROR_KEY = "export_error"
+"""Key of the error lines, holding the error of the object that could not be exported."""
+
+serializer = JSONSerializer()
+"""Serializer of the NDJSON lines."""
+
+NDJSON_REQUEST_BODY: dict[str, Any] = {
+    "requestBody": {"required": True, "content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}}}
+}
+"""OpenAPI request body of the NDJSON imports, read as a stream instead of a validated body."""
+
+
+def dump_lines(items: Iterable[ExportedT], dump: Callable[[ExportedT], bytes]) -> bytes:
+    """Dump objects into NDJSON lines, with an error line in place of each object that cannot be serialized."""
+    return b"".join(_dump_or_error(item, dump) for item in items)
+
+
+def _dump_or_error(item: ExportedT, dump: Callable[[ExportedT], bytes]) -> bytes:
+    try:
+        return dump(item)
+    except SerializationError as error:
+        message = get_error_message(error)
+        logger.warning(f"Failed to export {type(item).__name__} {item.id}: {message}")
+        return serializer.serialize({"id": item.id, EXPORT_ERROR_KEY: message}) + b"\n"
+
+
+def dump_schedule(schedule: Schedule) -> bytes:
+    """Dump a schedule into an NDJSON line.
+
+    Raises:
+        SerializationError: If the trigger, args or kwargs are not JSON serializable.
+    """
+    return _dump(schedule, _SCHEDULE_EXCLUDED_FIELDS)
+
+
+def load_schedule(line: bytes) -> Schedule:
+    """Load a schedule from an NDJSON line.
+
+    Raises:
+        DeserializationError: If the line is not valid JSON.
+        TypeError: If the line is not a schedule.
+        ValueError: If a value of the schedule is invalid.
+    """
+    return Schedule(**_load(line))
+
+
+def dump_task(task: Task) -> bytes:
+    """Dump a task into an NDJSON line.
+
+    Raises:
+        SerializationError: If the metadata is not JSON serializable.
+    """
+    return _dump(task, _TASK_EXCLUDED_FIELDS)
+
+
+def load_task(line: bytes) -> Task:
+    """Load a task from an NDJSON line.
+
+    Raises:
+        DeserializationError: If the line is not valid JSON.
+        TypeError: If the line is not a task.
+        ValueError: If a value of the task is invalid.
+    """
+    return Task(**_load(line))
+
+
+def _dump(instance: Schedule | Task, excluded_fields: tuple[str, ...]) -> bytes:
+    """Dump the fields of an attrs instance into an NDJSON line."""
+    fields = attrs.asdict(instance, recurse=False, filter=lambda field, _: field.name not in excluded_fields)
+    return serializer.serialize(fields) + b"\n"
+
+
+def _load(line: bytes) -> dict[str, Any]:
+    """Load the fields of an NDJSON line.
+
+    Raises:
+        DeserializationError: If the line is not valid JSON.
+        TypeError: If the line is not a JSON object.
+        ValueError: If the line is the error line of an object that was not exported.
+    """
+    fields = serializer.deserialize(line)
+    if not isinstance(fields, dict):
+        msg = f"Expected a JSON object, got {type(fields).__name__}"
+        raise TypeError(msg)
+    if EXPORT_ERROR_KEY in fields:
+        msg = f"Not exported: {fields[EXPORT_ERROR_KEY]}"
+        raise ValueError(msg)
+    return fields
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+    """Split a stream of chunks into numbered lines, from 1, skipping the blank lines."""
+    buffer = b""
+    line_number = 0
+    async for chunk in chunks:
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield line_number, line
+    if buffer.strip():
+        yield line_number + 1, buffer
+
+
+async def iter_pages(get_page: Callable[[str | None], Awaitable[Page[T]]]) -> AsyncIterator[list[T]]:
+    """Iterate over the pages read after the cursor of the previous page, from the first page."""
+    cursor: str | None = None
+    while True:
+        page = await get_page(cursor)
+        yield page.items
+        if page.next_cursor is None:
+            return
+        cursor = page.next_cursor
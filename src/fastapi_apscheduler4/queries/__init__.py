@@ -0,0 +1,467 @@
+"""Data Store Queries.
+
+Paginated, filtered and sorted queries pushed down to the data store when it supports them, so that reading a page does
+not cost as much as loading and deserializing every schedule.
+
+The pages are either read at an offset, or after an opaque keyset cursor, whose cost does not grow with the depth of the
+page and whose results do not shift while schedules are added.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from functools import partial
+from itertools import chain
+from typing import TYPE_CHECKING, Any, TypeVar
+from uuid import UUID
+
+import attrs
+from apscheduler import ConflictPolicy, ScheduleUpdated
+from apscheduler.datastores.memory import MemoryDataStore
+
+from fastapi_apscheduler4.constants import MANIFEST_TASK_ID
+from fastapi_apscheduler4.dtos import JobFilters, Page, ScheduleFilters
+from fastapi_apscheduler4.errors import InvalidCursorError
+from fastapi_apscheduler4.schemas import ScheduleSort, TriggerType, model_trigger_discriminator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable
+
+    from apscheduler import Job, Schedule, Task
+    from apscheduler.abc import DataStore
+
+T = TypeVar("T")
+
+_MIN_FIRE_TIME = datetime.min.replace(tzinfo=timezone.utc)
+
+ScheduleSortKey = tuple[bool, datetime, str]
+"""Sort key of a schedule, see `make_schedule_sort_key`."""
+JobSortKey = tuple[datetime, UUID]
+"""Sort key of a job, by creation time then ID."""
+
+
+class DataStoreQueries:
+    """Data Store Queries.
+
+    Generic implementation working with any data store, by loading all the schedules with the public data store API then
+    filtering, sorting and paginating them in memory.
+
+    The manifest task of the auto schedules is hidden from the tasks.
+
+    The bulk operations act on the given schedules in as few data store operations as the data store allows, and return
+    the IDs of the schedules that exist.
+    """
+
+    def __init__(self, data_store: DataStore) -> None:
+        """Initialize the queries."""
+        self.data_store = data_store
+
+    async def get_schedules(
+        self,
+        *,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        filters: ScheduleFilters | None = None,
+        sort: ScheduleSort = ScheduleSort.NEXT_FIRE_TIME,
+    ) -> Page[Schedule]:
+        """Get a page of filtered schedules, ordered by next fire time then ID by default.
+
+        The total count is only computed for the offset pages.
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid, or was returned for another sort.
+        """
+        filters = filters or ScheduleFilters()
+        schedules = filter_schedules(await self._get_candidate_schedules(filters), filters)
+        return paginate_schedules(schedules, limit=limit, offset=offset, cursor=cursor, sort=sort)
+
+    async def get_sparse_schedules(
+        self,
+        fields: Collection[str],  # noqa: ARG002
+        *,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        filters: ScheduleFilters | None = None,
+        sort: ScheduleSort = ScheduleSort.NEXT_FIRE_TIME,
+    ) -> Page[Any]:
+        """Get a page of filtered schedules like `get_schedules`, with at least the attributes of the fields.
+
+        The whole schedules are loaded, only the data stores reading them by column load fewer fields.
+        """
+        return await self.get_schedules(limit=limit, offset=offset, cursor=cursor, filters=filters, sort=sort)
+
+    async def get_schedule_ids(self, filters: ScheduleFilters) -> list[str]:
+        """Get the IDs of the schedules matching the filters, in no particular order."""
+        return [schedule.id for schedule in filter_schedules(await self._get_candidate_schedules(filters), filters)]
+
+    async def remove_schedules(self, ids: Collection[str]) -> set[str]:
+        """Remove schedules by ID.
+
+        Returns:
+            The IDs of the removed schedules, the others do not exist.
+        """
+        existing_ids = {schedule.id for schedule in await self._get_schedules_by_id(ids)}
+        await self.data_store.remove_schedules(existing_ids)
+        return existing_ids
+
+    async def set_schedules_paused(self, ids: Collection[str], *, paused: bool) -> set[str]:
+        """Pause or resume schedules by ID.
+
+        The resumed schedules keep their next fire time, the fire times missed while paused are handled by their
+        misfire grace time and coalesce policy.
+
+        Returns:
+            The IDs of the existing schedules, already in that state or not.
+        """
+        schedules = await self._get_schedules_by_id(ids)
+        for schedule in schedules:
+            if schedule.paused is not paused:
+                await self.data_store.add_schedule(attrs.evolve(schedule, paused=paused), ConflictPolicy.replace)
+        return {schedule.id for schedule in schedules}
+
+    async def _get_schedules_by_id(self, ids: Collection[str]) -> list[Schedule]:
+        """Get the existing schedules among the IDs, none if there is no ID."""
+        # The data stores read all the schedules without IDs
+        if not ids:
+            return []
+        return await self.data_store.get_schedules(set(ids))
+
+    async def get_tasks(self, *, limit: int, offset: int = 0, cursor: str | None = None) -> Page[Task]:
+        """Get a page of tasks, ordered by ID.
+
+        The total count is only computed for the offset pages.
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid.
+        """
+        tasks = sorted(task for task in await self.data_store.get_tasks() if task.id != MANIFEST_TASK_ID)
+        if cursor is None:
+            return get_offset_page(tasks[offset : offset + limit], offset, len(tasks), encode_task_cursor)
+
+        start = bisect_right(tasks, decode_task_cursor(cursor), key=lambda task: task.id)
+        return get_cursor_page(tasks[start : start + limit + 1], limit, encode_task_cursor)
+
+    async def get_sparse_tasks(
+        self,
+        fields: Collection[str],  # noqa: ARG002
+        *,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> Page[Any]:
+        """Get a page of tasks like `get_tasks`, with at least the attributes of the fields.
+
+        The whole tasks are loaded, only the data stores reading them by column load fewer fields.
+        """
+        return await self.get_tasks(limit=limit, offset=offset, cursor=cursor)
+
+    async def get_jobs(
+        self, *, limit: int, offset: int = 0, cursor: str | None = None, filters: JobFilters | None = None
+    ) -> Page[Job]:
+        """Get a page of filtered jobs, ordered by creation time then ID.
+
+        The total count is only computed for the offset pages.
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid.
+        """
+        filters = filters or JobFilters()
+        jobs = sorted(filter_jobs(await self._get_candidate_jobs(filters), filters), key=get_job_sort_key)
+        if cursor is None:
+            return get_offset_page(jobs[offset : offset + limit], offset, len(jobs), encode_job_cursor)
+
+        start = bisect_right(jobs, decode_job_cursor(cursor), key=get_job_sort_key)
+        return get_cursor_page(jobs[start : start + limit + 1], limit, encode_job_cursor)
+
+    async def _get_candidate_schedules(self, filters: ScheduleFilters) -> Iterable[Schedule]:  # noqa: ARG002
+        """Get the schedules that may match the filters, all of them by default."""
+        return await self.data_store.get_schedules()
+
+    async def _get_candidate_jobs(self, filters: JobFilters) -> Iterable[Job]:  # noqa: ARG002
+        """Get the jobs that may match the filters, all of them by default."""
+        return await self.data_store.get_jobs()
+
+
+class MemoryDataStoreQueries(DataStoreQueries):
+    """Memory Data Store Queries.
+
+    Narrows the schedules to filter with the indexes of the memory data store: by task ID, or by next fire time window
+    on its list of schedules already sorted by next fire time. Narrows the jobs to filter by task ID.
+    """
+
+    data_store: MemoryDataStore
+
+    def __init__(self, data_store: MemoryDataStore) -> None:
+        """Initialize the queries."""
+        super().__init__(data_store)
+
+    async def _get_candidate_schedules(self, filters: ScheduleFilters) -> Iterable[Schedule]:
+        """Get the schedules of the filtered tasks, or within the next fire time window."""
+        if filters.task_id is not None:
+            schedules_by_id = self.data_store._schedules_by_id  # noqa: SLF001
+            schedules_by_task_id = self.data_store._schedules_by_task_id  # noqa: SLF001
+            schedules = chain.from_iterable(schedules_by_task_id.get(task_id, ()) for task_id in filters.task_id)
+            # The task index keeps the removed schedules
+            return (schedule for schedule in schedules if schedules_by_id.get(schedule.id) is schedule)
+
+        schedules = self.data_store._schedules  # noqa: SLF001
+        if filters.next_fire_time_min is None and filters.next_fire_time_max is None:
+            return schedules
+
+        def key(schedule: Schedule) -> tuple[bool, datetime]:
+            return schedule.next_fire_time is None, schedule.next_fire_time or _MIN_FIRE_TIME
+
+        start = bisect_left(schedules, (False, filters.next_fire_time_min or _MIN_FIRE_TIME), key=key)
+        if filters.next_fire_time_max is None:
+            end = bisect_left(schedules, (True, _MIN_FIRE_TIME), key=key)
+        else:
+            end = bisect_right(schedules, (False, filters.next_fire_time_max), key=key)
+        return schedules[start:end]
+
+    async def set_schedules_paused(self, ids: Collection[str], *, paused: bool) -> set[str]:
+        """Pause or resume schedules by ID, in place.
+
+        The resumed schedules keep their next fire time, the fire times missed while paused are handled by their
+        misfire grace time and coalesce policy.
+
+        Returns:
+            The IDs of the existing schedules, already in that state or not.
+        """
+        schedules_by_id = self.data_store._schedules_by_id  # noqa: SLF001
+        schedules = [schedules_by_id[schedule_id] for schedule_id in ids if schedule_id in schedules_by_id]
+        for schedule in schedules:
+            if schedule.paused is not paused:
+                schedule.paused = paused
+                event = ScheduleUpdated(
+                    schedule_id=schedule.id, task_id=schedule.task_id, next_fire_time=schedule.next_fire_time
+                )
+                await self.data_store._event_broker.publish(event)  # noqa: SLF001
+        return {schedule.id for schedule in schedules}
+
+    async def _get_candidate_jobs(self, filters: JobFilters) -> Iterable[Job]:
+        """Get the jobs of the filtered tasks, or all of them."""
+        if filters.task_id is not None:
+            jobs_by_task_id = self.data_store._jobs_by_task_id  # noqa: SLF001
+            return chain.from_iterable(jobs_by_task_id.get(task_id, ()) for task_id in filters.task_id)
+        return self.data_store._jobs_by_id.values()  # noqa: SLF001
+
+
+def filter_schedules(schedules: Iterable[Schedule], filters: ScheduleFilters) -> list[Schedule]:
+    """Get the schedules matching the filters."""
+    return [schedule for schedule in schedules if match_schedule(schedule, filters)]
+
+
+def match_schedule(schedule: Schedule, filters: ScheduleFilters) -> bool:  # noqa: PLR0911
+    """Check if a schedule matches the filters."""
+    if filters.task_id is not None and schedule.task_id not in filters.task_id:
+        return False
+    if filters.acquired_by is not None and schedule.acquired_by != filters.acquired_by:
+        return False
+    if filters.trigger is not None and get_trigger_type(schedule) not in filters.trigger:
+        return False
+    if filters.next_fire_time_min is not None or filters.next_fire_time_max is not None:
+        if schedule.next_fire_time is None:
+            return False
+        if filters.next_fire_time_min is not None and schedule.next_fire_time < filters.next_fire_time_min:
+            return False
+        if filters.next_fire_time_max is not None and schedule.next_fire_time > filters.next_fire_time_max:
+            return False
+    return True
+
+
+def filter_jobs(jobs: Iterable[Job], filters: JobFilters) -> list[Job]:
+    """Get the jobs matching the filters."""
+    return [job for job in jobs if match_job(job, filters)]
+
+
+def match_job(job: Job, filters: JobFilters) -> bool:
+    """Check if a job matches the filters."""
+    if filters.task_id is not None and job.task_id not in filters.task_id:
+        return False
+    return filters.acquired is None or (job.acquired_by is not None) is filters.acquired
+
+
+def get_trigger_type(schedule: Schedule) -> TriggerType:
+    """Get the trigger type of a schedule, unknown for the triggers without API schema."""
+    return TriggerType(model_trigger_discriminator(schedule.trigger))
+
+
+def paginate_schedules(
+    schedules: list[Schedule], *, limit: int, offset: int, cursor: str | None, sort: ScheduleSort
+) -> Page[Schedule]:
+    """Sort and paginate schedules in memory.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid, or was returned for another sort.
+    """
+    key = partial(get_schedule_sort_key, sort=sort)
+    encode = partial(encode_schedule_cursor, sort=sort)
+    schedules = sorted(schedules, key=key, reverse=sort.descending)
+    if cursor is None:
+        return get_offset_page(schedules[offset : offset + limit], offset, len(schedules), encode)
+
+    after = make_schedule_sort_key(*decode_schedule_cursor(cursor, sort), sort=sort)
+    start = next(
+        (
+            index
+            for index, schedule in enumerate(schedules)
+            if (key(schedule) < after if sort.descending else key(schedule) > after)
+        ),
+        len(schedules),
+    )
+    return get_cursor_page(schedules[start : start + limit + 1], limit, encode)
+
+
+def get_offset_page(items: list[T], offset: int, total_count: int, encode: Callable[[T], str]) -> Page[T]:
+    """Get a page read at an offset, with the cursor of the next page if any."""
+    has_next = offset + len(items) < total_count
+    return Page(items=items, total_count=total_count, next_cursor=encode(items[-1]) if has_next else None)
+
+
+def get_cursor_page(items: list[T], limit: int, encode: Callable[[T], str]) -> Page[T]:
+    """Get a page read after a cursor, from one item more than the limit to know if there is a next page."""
+    if len(items) > limit:
+        return Page(items=items[:limit], next_cursor=encode(items[limit - 1]))
+    return Page(items=items)
+
+
+def get_schedule_sort_key(schedule: Schedule, sort: ScheduleSort = ScheduleSort.NEXT_FIRE_TIME) -> ScheduleSortKey:
+    """Get the sort key of a schedule, to sort in reverse for the descending orders."""
+    return make_schedule_sort_key(schedule.next_fire_time, schedule.id, sort=sort)
+
+
+def make_schedule_sort_key(next_fire_time: datetime | None, schedule_id: str, *, sort: ScheduleSort) -> ScheduleSortKey:
+    """Make the sort key of a schedule, to sort in reverse for the descending orders.
+
+    The first item keeps the exhausted schedules last in both orders, the ID breaks the ties.
+    """
+    if sort in (ScheduleSort.ID, ScheduleSort.ID_DESC):
+        return False, _MIN_FIRE_TIME, schedule_id
+    exhausted = next_fire_time is None
+    return exhausted is not sort.descending, next_fire_time or _MIN_FIRE_TIME, schedule_id
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode the sort key values of the last item of a page into an opaque cursor."""
+    # Without padding, so that the cursor can be used as is in a query string
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decode the sort key values of a cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is not a list of `size` values.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as error:
+        raise InvalidCursorError(cursor) from error
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError(cursor)
+    return values
+
+
+def encode_schedule_cursor(schedule: Schedule, sort: ScheduleSort = ScheduleSort.NEXT_FIRE_TIME) -> str:
+    """Encode the cursor following a schedule."""
+    next_fire_time = schedule.next_fire_time.isoformat() if schedule.next_fire_time else None
+    return encode_cursor([sort.value, next_fire_time, schedule.id])
+
+
+def decode_schedule_cursor(
+    cursor: str, sort: ScheduleSort = ScheduleSort.NEXT_FIRE_TIME
+) -> tuple[datetime | None, str]:
+    """Decode the next fire time and ID of the schedule preceding a cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid, or was returned for another sort.
+    """
+    cursor_sort, next_fire_time, schedule_id = decode_cursor(cursor, 3)
+    if cursor_sort != sort.value or not isinstance(schedule_id, str):
+        raise InvalidCursorError(cursor)
+    if next_fire_time is None:
+        return None, schedule_id
+    return decode_cursor_datetime(cursor, next_fire_time), schedule_id
+
+
+def decode_cursor_datetime(cursor: str, value: Any) -> datetime:  # noqa: ANN401
+    """Decode a timezone aware datetime value of a cursor.
+
+    Raises:
+        InvalidCursorError: If the value is not a timezone aware ISO 8601 datetime.
+    """
+    if not isinstance(value, str):
+        raise InvalidCursorError(cursor)
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as error:
+        raise InvalidCursorError(cursor) from error
+    if parsed.tzinfo is None:
+        raise InvalidCursorError(cursor)
+    return parsed
+
+
+def encode_task_cursor(task: Task) -> str:
+    """Encode the cursor following a task."""
+    return encode_cursor([task.id])
+
+
+def decode_task_cursor(cursor: str) -> str:
+    """Decode the ID of the task preceding a cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid.
+    """
+    (task_id,) = decode_cursor(cursor, 1)
+    if not isinstance(task_id, str):
+        raise InvalidCursorError(cursor)
+    return task_id
+
+
+def get_job_sort_key(job: Job) -> JobSortKey:
+    """Get the sort key of a job."""
+    return job.created_at, job.id
+
+
+def encode_job_cursor(job: Job) -> str:
+    """Encode the cursor following a job."""
+    return encode_cursor([job.created_at.isoformat(), str(job.id)])
+
+
+def decode_job_cursor(cursor: str) -> JobSortKey:
+    """Decode the creation time and ID of the job preceding a cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid.
+    """
+    created_at, job_id = decode_cursor(cursor, 2)
+    if not isinstance(job_id, str):
+        raise InvalidCursorError(cursor)
+    try:
+        parsed_job_id = UUID(job_id)
+    except ValueError as error:
+        raise InvalidCursorError(cursor) from error
+    return decode_cursor_datetime(cursor, created_at), parsed_job_id
+
+
+def get_data_store_queries(data_store: DataStore) -> DataStoreQueries:
+    """Get the queries of a data store, pushed down to SQL for the SQLAlchemy data store."""
+    if isinstance(data_store, MemoryDataStore):
+        return MemoryDataStoreQueries(data_store)
+
+    # Lazy imports to avoid SQLAlchemy dependency
+    try:
+        from apscheduler.datastores.sqlalchemy import SQLAlchemyDataStore
+
+        from fastapi_apscheduler4.queries.sqlalchemy import SQLAlchemyDataStoreQueries
+    except ImportError:
+        return DataStoreQueries(data_store)
+
+    if isinstance(data_store, SQLAlchemyDataStore):
+        return SQLAlchemyDataStoreQueries(data_store)
+    return DataStoreQueries(data_store)
@@ -0,0 +1,422 @@
+"""SQLAlchemy Data Store Queries."""
+
+from __future__ import annotations
+
+import operator
+from functools import partial
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from apscheduler import ScheduleRemoved, ScheduleUpdated, Task
+from sqlalchemy import and_, func, or_, select
+
+from fastapi_apscheduler4.constants import MANIFEST_TASK_ID
+from fastapi_apscheduler4.dtos import JobFilters, ScheduleFilters
+from fastapi_apscheduler4.queries import (
+    DataStoreQueries,
+    decode_job_cursor,
+    decode_schedule_cursor,
+    decode_task_cursor,
+    encode_job_cursor,
+    encode_schedule_cursor,
+    encode_task_cursor,
+    filter_schedules,
+    get_cursor_page,
+    get_offset_page,
+    paginate_schedules,
+)
+from fastapi_apscheduler4.schemas import ScheduleSort
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Collection
+    from datetime import datetime
+
+    from apscheduler import Job, Schedule
+    from apscheduler.datastores.sqlalchemy import SQLAlchemyDataStore
+    from sqlalchemy import ColumnElement, Row, Select
+
+    from fastapi_apscheduler4.dtos import Page
+
+T = TypeVar("T")
+
+_SERIALIZED_SCHEDULE_COLUMNS = frozenset({"trigger", "args", "kwargs"})
+"""Columns of the schedules serialized by the data store, only read with the whole schedules."""
+_FIRE_TIME_COLUMNS = frozenset({"next_fire_time", "last_fire_time"})
+"""Fire time columns of the schedules, with a UTC offset column when the database has no timezone aware type."""
+
+
+class SQLAlchemyDataStoreQueries(DataStoreQueries):
+    """SQLAlchemy Data Store Queries.
+
+    Issues the pagination, filters and sort as SQL on the tables of the data store, so that only the rows of the page
+    are deserialized. The cursor pages are read with range conditions on the indexed columns, instead of an offset.
+
+    The triggers are stored serialized, so the trigger type filter is applied after deserializing the schedules
+    matching the other filters.
+
+    Relies on the internals of the APScheduler SQLAlchemy data store (tables, transactions and retries).
+    """
+
+    data_store: SQLAlchemyDataStore
+
+    def __init__(self, data_store: SQLAlchemyDataStore) -> None:
+        """Initialize the queries."""
+        super().__init__(data_store)
+
+    async def get_schedules(
+        self,
+        *,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        filters: ScheduleFilters | None = None,
+        sort: ScheduleSort = ScheduleSort.NEXT_FIRE_TIME,
+    ) -> Page[Schedule]:
+        """Get a page of filtered schedules, ordered by next fire time then ID by default.
+
+        The total count is only computed for the offset pages.
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid, or was returned for another sort.
+        """
+        filters = filters or ScheduleFilters()
+        table = self.data_store._t_schedules  # noqa: SLF001
+        if filters.trigger is not None:
+            rows, _ = await self._fetch([table.select().where(*self._get_schedule_conditions(filters))])
+            schedules = filter_schedules(await self.data_store._deserialize_schedules(rows), filters)  # noqa: SLF001
+            return paginate_schedules(schedules, limit=limit, offset=offset, cursor=cursor, sort=sort)
+
+        return await self._get_schedules_page(
+            table.select(),
+            self.data_store._deserialize_schedules,  # noqa: SLF001
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            filters=filters,
+            sort=sort,
+        )
+
+    async def get_sparse_schedules(
+        self,
+        fields: Collection[str],
+        *,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        filters: ScheduleFilters | None = None,
+        sort: ScheduleSort = ScheduleSort.NEXT_FIRE_TIME,
+    ) -> Page[Any]:
+        """Get a page of filtered schedules like `get_schedules`, with at least the attributes of the fields.
+
+        Only the columns of the fields, the ID and the next fire time are read, into plain objects, unless a serialized
+        field (trigger, args or kwargs) is requested or the trigger type is filtered, which need the whole schedules.
+        """
+        filters = filters or ScheduleFilters()
+        if filters.trigger is not None or not _SERIALIZED_SCHEDULE_COLUMNS.isdisjoint(fields):
+            return await self.get_schedules(limit=limit, offset=offset, cursor=cursor, filters=filters, sort=sort)
+
+        table = self.data_store._t_schedules  # noqa: SLF001
+        names = {"id", "next_fire_time", *fields}
+        if not self.data_store._supports_tzaware_timestamps:  # noqa: SLF001
+            names.update(f"{name}_utcoffset" for name in _FIRE_TIME_COLUMNS & names)
+        return await self._get_schedules_page(
+            select(*(table.c[name] for name in sorted(names))),
+            self._load_sparse_schedules,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            filters=filters,
+            sort=sort,
+        )
+
+    async def _get_schedules_page(
+        self,
+        query: Select[Any],
+        load: Callable[[list[Row[Any]]], Awaitable[list[T]]],
+        *,
+        limit: int,
+        offset: int,
+        cursor: str | None,
+        filters: ScheduleFilters,
+        sort: ScheduleSort,
+    ) -> Page[T]:
+        """Get a page of the schedules read by a query of the schedules table, filtered then sorted in SQL."""
+        table = self.data_store._t_schedules  # noqa: SLF001
+        query = query.where(*self._get_schedule_conditions(filters))
+        encode = partial(encode_schedule_cursor, sort=sort)
+        if cursor is None:
+            query = query.order_by(*self._get_schedule_order(sort)).offset(offset)
+            count = select(func.count()).select_from(table).where(*self._get_schedule_conditions(filters))
+            rows, total_count = await self._fetch([query], limit, count=count)
+            return get_offset_page(await load(rows), offset, total_count, encode)
+
+        next_fire_time, schedule_id = decode_schedule_cursor(cursor, sort)
+        rows, _ = await self._fetch(
+            self._get_schedule_queries_after(query, sort, next_fire_time, schedule_id), limit + 1
+        )
+        return get_cursor_page(await load(rows), limit, encode)
+
+    async def _load_sparse_schedules(self, rows: list[Row[Any]]) -> list[SimpleNamespace]:
+        """Load the schedule rows of some columns into plain objects, with their fire times converted."""
+        return [
+            SimpleNamespace(**self.data_store._convert_incoming_fire_times(row._asdict()))  # noqa: SLF001
+            for row in rows
+        ]
+
+    async def get_schedule_ids(self, filters: ScheduleFilters) -> list[str]:
+        """Get the IDs of the schedules matching the filters, in no particular order.
+
+        Only the IDs are read, unless the trigger type is filtered.
+        """
+        if filters.trigger is not None:
+            return await super().get_schedule_ids(filters)
+        table = self.data_store._t_schedules  # noqa: SLF001
+        rows, _ = await self._fetch([select(table.c.id).where(*self._get_schedule_conditions(filters))])
+        return [row.id for row in rows]
+
+    async def remove_schedules(self, ids: Collection[str]) -> set[str]:
+        """Remove schedules by ID, in a single statement when the database supports `DELETE ... RETURNING`.
+
+        Returns:
+            The IDs of the removed schedules, the others do not exist.
+        """
+        if not ids:
+            return set()
+        table = self.data_store._t_schedules  # noqa: SLF001
+        async for attempt in self.data_store._retry():  # noqa: SLF001
+            with attempt:
+                async with self.data_store._begin_transaction() as conn:  # noqa: SLF001
+                    if self.data_store._supports_update_returning:  # noqa: SLF001
+                        delete = table.delete().where(table.c.id.in_(ids)).returning(table.c.id, table.c.task_id)
+                        rows = list(await self.data_store._execute(conn, delete))  # noqa: SLF001
+                    else:
+                        query = select(table.c.id, table.c.task_id).where(table.c.id.in_(ids))
+                        rows = list(await self.data_store._execute(conn, query))  # noqa: SLF001
+                        delete = table.delete().where(table.c.id.in_([row.id for row in rows]))
+                        await self.data_store._execute(conn, delete)  # noqa: SLF001
+
+        for row in rows:
+            event = ScheduleRemoved(schedule_id=row.id, task_id=row.task_id, finished=False)
+            await self.data_store._event_broker.publish(event)  # noqa: SLF001
+        return {row.id for row in rows}
+
+    async def set_schedules_paused(self, ids: Collection[str], *, paused: bool) -> set[str]:
+        """Pause or resume schedules by ID, with a single update statement.
+
+        The resumed schedules keep their next fire time, the fire times missed while paused are handled by their
+        misfire grace time and coalesce policy.
+
+        Returns:
+            The IDs of the existing schedules, already in that state or not.
+        """
+        if not ids:
+            return set()
+        table = self.data_store._t_schedules  # noqa: SLF001
+        columns = [table.c.id, table.c.task_id, table.c.paused, table.c.next_fire_time]
+        if not self.data_store._supports_tzaware_timestamps:  # noqa: SLF001
+            columns.append(table.c.next_fire_time_utcoffset)
+        async for attempt in self.data_store._retry():  # noqa: SLF001
+            with attempt:
+                async with self.data_store._begin_transaction() as conn:  # noqa: SLF001
+                    rows = list(await self.data_store._execute(conn, select(*columns).where(table.c.id.in_(ids))))  # noqa: SLF001
+                    updated_ids = [row.id for row in rows if row.paused != paused]
+                    if updated_ids:
+                        update = table.update().where(table.c.id.in_(updated_ids)).values(paused=paused)
+                        await self.data_store._execute(conn, update)  # noqa: SLF001
+
+        for row in rows:
+            if row.paused != paused:
+                data = self.data_store._convert_incoming_fire_times(row._asdict())  # noqa: SLF001
+                event = ScheduleUpdated(schedule_id=row.id, task_id=row.task_id, next_fire_time=data["next_fire_time"])
+                await self.data_store._event_broker.publish(event)  # noqa: SLF001
+        return {row.id for row in rows}
+
+    async def get_tasks(self, *, limit: int, offset: int = 0, cursor: str | None = None) -> Page[Task]:
+        """Get a page of tasks, ordered by ID.
+
+        The total count is only computed for the offset pages.
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid.
+        """
+        return await self._get_tasks_page(
+            self.data_store._t_tasks.select(),  # noqa: SLF001
+            self._unmarshal_tasks,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+
+    async def get_sparse_tasks(
+        self,
+        fields: Collection[str],
+        *,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> Page[Any]:
+        """Get a page of tasks like `get_tasks`, with at least the attributes of the fields.
+
+        Only the columns of the fields and the ID are read, into plain objects.
+        """
+        table = self.data_store._t_tasks  # noqa: SLF001
+        query = select(*(table.c[name] for name in sorted({"id", *fields})))
+        return await self._get_tasks_page(
+            query,
+            lambda rows: [SimpleNamespace(**row._asdict()) for row in rows],
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+
+    async def _get_tasks_page(
+        self,
+        query: Select[Any],
+        load: Callable[[list[Row[Any]]], list[T]],
+        *,
+        limit: int,
+        offset: int,
+        cursor: str | None,
+    ) -> Page[T]:
+        """Get a page of the tasks read by a query of the tasks table, without the manifest task."""
+        table = self.data_store._t_tasks  # noqa: SLF001
+        query = query.where(table.c.id != MANIFEST_TASK_ID).order_by(table.c.id)
+        if cursor is None:
+            count = select(func.count()).select_from(table).where(table.c.id != MANIFEST_TASK_ID)
+            rows, total_count = await self._fetch([query.offset(offset)], limit, count=count)
+            return get_offset_page(load(rows), offset, total_count, encode_task_cursor)
+
+        rows, _ = await self._fetch([query.where(table.c.id > decode_task_cursor(cursor))], limit + 1)
+        return get_cursor_page(load(rows), limit, encode_task_cursor)
+
+    async def get_jobs(
+        self, *, limit: int, offset: int = 0, cursor: str | None = None, filters: JobFilters | None = None
+    ) -> Page[Job]:
+        """Get a page of filtered jobs, ordered by creation time then ID.
+
+        The total count is only computed for the offset pages.
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid.
+        """
+        table = self.data_store._t_jobs  # noqa: SLF001
+        conditions = self._get_job_conditions(filters or JobFilters())
+        query = table.select().where(*conditions).order_by(table.c.created_at, table.c.id)
+        if cursor is None:
+            count = select(func.count()).select_from(table).where(*conditions)
+            rows, total_count = await self._fetch([query.offset(offset)], limit, count=count)
+            jobs = await self.data_store._deserialize_jobs(rows)  # noqa: SLF001
+            return get_offset_page(jobs, offset, total_count, encode_job_cursor)
+
+        # Unlike the fire times, the creation time column is a timestamp on all the databases
+        created_at, job_id = decode_job_cursor(cursor)
+        query = query.where(
+            or_(table.c.created_at > created_at, and_(table.c.created_at == created_at, table.c.id > job_id))
+        )
+        rows, _ = await self._fetch([query], limit + 1)
+        jobs = await self.data_store._deserialize_jobs(rows)  # noqa: SLF001
+        return get_cursor_page(jobs, limit, encode_job_cursor)
+
+    def _get_job_conditions(self, filters: JobFilters) -> list[ColumnElement[bool]]:
+        """Get the SQL conditions of the job filters."""
+        table = self.data_store._t_jobs  # noqa: SLF001
+        conditions = []
+        if filters.task_id is not None:
+            conditions.append(table.c.task_id.in_(filters.task_id))
+        if filters.acquired is not None:
+            acquired_by = table.c.acquired_by
+            conditions.append(acquired_by.is_not(None) if filters.acquired else acquired_by.is_(None))
+        return conditions
+
+    def _get_schedule_conditions(self, filters: ScheduleFilters) -> list[ColumnElement[bool]]:
+        """Get the SQL conditions of the filters, except the trigger type."""
+        table = self.data_store._t_schedules  # noqa: SLF001
+        conditions = []
+        if filters.task_id is not None:
+            conditions.append(table.c.task_id.in_(filters.task_id))
+        if filters.acquired_by is not None:
+            conditions.append(table.c.acquired_by == filters.acquired_by)
+        if filters.next_fire_time_min is not None:
+            conditions.append(table.c.next_fire_time >= self._to_fire_time_column(filters.next_fire_time_min))
+        if filters.next_fire_time_max is not None:
+            conditions.append(table.c.next_fire_time <= self._to_fire_time_column(filters.next_fire_time_max))
+        return conditions
+
+    def _get_schedule_order(self, sort: ScheduleSort) -> list[ColumnElement[Any]]:
+        """Get the SQL order of the offset pages, the exhausted schedules last."""
+        table = self.data_store._t_schedules  # noqa: SLF001
+        if sort is ScheduleSort.ID:
+            return [table.c.id]
+        if sort is ScheduleSort.ID_DESC:
+            return [table.c.id.desc()]
+        if sort is ScheduleSort.NEXT_FIRE_TIME_DESC:
+            return [table.c.next_fire_time.is_(None), table.c.next_fire_time.desc(), table.c.id.desc()]
+        return [table.c.next_fire_time.is_(None), table.c.next_fire_time, table.c.id]
+
+    def _get_schedule_queries_after(
+        self, query: Select[Any], sort: ScheduleSort, next_fire_time: datetime | None, schedule_id: str
+    ) -> list[Select[Any]]:
+        """Get the SQL queries reading the schedules after a cursor, in turn.
+
+        For the next fire time orders, the schedules with a next fire time are read first, then the exhausted ones by
+        ID, so that each query is ordered by indexed columns only.
+        """
+        table = self.data_store._t_schedules  # noqa: SLF001
+        after = operator.lt if sort.descending else operator.gt
+
+        def order(column: ColumnElement[Any]) -> ColumnElement[Any]:
+            return column.desc() if sort.descending else column
+
+        if sort in (ScheduleSort.ID, ScheduleSort.ID_DESC):
+            return [query.where(after(table.c.id, schedule_id)).order_by(order(table.c.id))]
+
+        exhausted_query = query.where(table.c.next_fire_time.is_(None)).order_by(order(table.c.id))
+        if next_fire_time is None:
+            return [exhausted_query.where(after(table.c.id, schedule_id))]
+
+        fire_time = self._to_fire_time_column(next_fire_time)
+        scheduled_query = query.where(
+            or_(
+                after(table.c.next_fire_time, fire_time),
+                and_(table.c.next_fire_time == fire_time, after(table.c.id, schedule_id)),
+            )
+        ).order_by(order(table.c.next_fire_time), order(table.c.id))
+        return [scheduled_query, exhausted_query]
+
+    async def _fetch(
+        self, queries: list[Select[Any]], limit: int | None = None, *, count: Select[Any] | None = None
+    ) -> tuple[list[Row[Any]], int]:
+        """Fetch the rows of the queries in turn until the limit is reached, and count the rows if requested.
+
+        The limit is applied to the queries, each one only fetching the rows missing to reach it.
+
+        Returns:
+            The rows and the count, 0 if not requested.
+        """
+        async for attempt in self.data_store._retry():  # noqa: SLF001
+            with attempt:
+                rows: list[Row[Any]] = []
+                total_count = 0
+                # Same transaction so that the total count matches the page
+                async with self.data_store._begin_transaction() as conn:  # noqa: SLF001
+                    if count is not None:
+                        total_count = (await self.data_store._execute(conn, count)).scalar_one()  # noqa: SLF001
+                    for query in queries:
+                        if limit is None:
+                            rows.extend(await self.data_store._execute(conn, query))  # noqa: SLF001
+                            continue
+                        if len(rows) >= limit:
+                            break
+                        rows.extend(await self.data_store._execute(conn, query.limit(limit - len(rows))))  # noqa: SLF001
+
+        return rows, total_count
+
+    def _to_fire_time_column(self, fire_time: datetime) -> datetime | int:
+        """Convert a fire time to its column value, in microseconds when the database has no timezone aware type."""
+        if self.data_store._supports_tzaware_timestamps:  # noqa: SLF001
+            return fire_time
+        return int(fire_time.timestamp() * 1000_000)
+
+    def _unmarshal_tasks(self, rows: list[Row[Any]]) -> list[Task]:
+        """Unmarshal the task rows."""
+        return [Task.unmarshal(self.data_store.serializer, row._asdict()) for row in rows]
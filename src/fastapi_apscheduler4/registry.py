@@ -0,0 +1,125 @@
+"""Schedule Registry."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, cast
+
+from apscheduler import SerializationError
+from apscheduler._marshalling import callable_to_ref
+
+from fastapi_apscheduler4.constants import SCHEDULE_PREFIX
+from fastapi_apscheduler4.dtos import ScheduleEntry, ScheduleOptions
+from fastapi_apscheduler4.errors import ScheduleAlreadyExistsError
+from fastapi_apscheduler4.utils import has_explicit_start
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from apscheduler.abc import Trigger
+    from typing_extensions import Unpack
+
+
+class ScheduleRegistry:
+    """Schedule Registry.
+
+    Holds the auto schedules indexed by schedule ID, so that registering and looking up a schedule takes constant time.
+
+    The schedule ID defaults to the callable reference, thus a function can only have several schedules when they
+    are given explicit IDs.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._entries: dict[str, ScheduleEntry] = {}
+
+    def __len__(self) -> int:
+        """Get the number of schedules."""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ScheduleEntry]:
+        """Iterate over the schedules in registration order."""
+        return iter(self._entries.values())
+
+    def __contains__(self, schedule_id: object) -> bool:
+        """Check if a schedule ID is registered."""
+        return schedule_id in self._entries
+
+    def add(
+        self,
+        func: Callable[..., Any],
+        trigger: Trigger,
+        *,
+        id: str | None = None,
+        **options: Unpack[ScheduleOptions],
+    ) -> ScheduleEntry:
+        """Register a schedule.
+
+        Args:
+            func: Function to schedule.
+            trigger: Trigger of the schedule.
+            id: Explicit schedule ID, without the auto schedule prefix. Defaults to the callable reference.
+            **options: Job execution options of the schedule.
+
+        The start times of the trigger are explicit unless they are the default instantiation time.
+
+        Raises:
+            ScheduleAlreadyExistsError: If a schedule with the same ID is already registered.
+        """
+        entry = ScheduleEntry(
+            func=func,
+            trigger=trigger,
+            id=SCHEDULE_PREFIX + (id or get_callable_ref(func)),
+            explicit_start=has_explicit_start(trigger, datetime.now(timezone.utc)),
+            **options,
+        )
+        self._register(entry)
+        return entry
+
+    def include(self, registry: ScheduleRegistry) -> None:
+        """Register all the schedules of another registry.
+
+        Raises:
+            ScheduleAlreadyExistsError: If a schedule with the same ID is already registered.
+        """
+        # Check the conflicts first so that a failing include leaves the registry unchanged
+        for entry in registry:
+            if entry.id in self:
+                raise ScheduleAlreadyExistsError(cast("str", entry.id))
+        for entry in registry:
+            self._register(entry)
+
+    def get(self, schedule_id: str) -> ScheduleEntry | None:
+        """Get a schedule by ID."""
+        return self._entries.get(schedule_id)
+
+    def _register(self, entry: ScheduleEntry) -> None:
+        """Index a schedule entry."""
+        schedule_id = cast("str", entry.id)
+        if schedule_id in self._entries:
+            raise ScheduleAlreadyExistsError(schedule_id)
+        self._entries[schedule_id] = entry
+
+
+def get_callable_ref(func: Callable[..., Any]) -> str:
+    """Get the reference of a callable.
+
+    Falls back to the qualified name for callables that cannot be referenced, such as nested functions, which are only
+    rejected by APScheduler when the schedule is added.
+    """
+    try:
+        return callable_to_ref(func)
+    except SerializationError:
+        return f"{getattr(func, '__module__', None)}:{getattr(func, '__qualname__', repr(func))}"
+
+
+def get_task_entries(entries: Iterable[ScheduleEntry]) -> dict[Callable[..., Any], ScheduleEntry]:
+    """Get the entry configuring the task of each function, which is its first entry.
+
+    The options of the task are the ones of this entry, the other entries of the function only set their own
+    schedule options.
+    """
+    task_entries: dict[Callable[..., Any], ScheduleEntry] = {}
+    for entry in entries:
+        task_entries.setdefault(entry.func, entry)
+    return task_entries
@@ -0,0 +1,75 @@
+"""JSON Responses.
+
+Serialization of the pages: the APScheduler attrs objects are validated into their schema with a cached `TypeAdapter`,
+then dumped straight into JSON bytes by pydantic-core, and returned as a raw response.
+
+The response model of the routes is only kept for the OpenAPI schema. The recent FastAPI releases dump the response
+model into JSON bytes the same way, so the raw response is not faster there, but it lets the sparse fieldsets be
+dumped with their own schema.
+
+The sparse fieldsets are dumped with a partial schema holding only the selected fields, so that the objects loaded with
+only these fields are valid, and the other fields are neither read nor dumped.
+"""
+
+from __future__ import annotations
+
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any
+
+from fastapi import Response, status
+from pydantic import TypeAdapter, create_model
+
+from fastapi_apscheduler4.constants import JSON_MEDIA_TYPE
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pydantic import BaseModel
+
+
+@cache
+def get_list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Get the type adapter of a list of models, built once per model."""
+    return TypeAdapter(list[model])
+
+
+@lru_cache(maxsize=256)
+def get_partial_model(model: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Get a model with only some of the fields of a model, built once per fieldset."""
+    partial_fields: dict[str, Any] = {
+        name: (field.annotation, field) for name, field in model.model_fields.items() if name in fields
+    }
+    return create_model(model.__name__, __doc__=model.__doc__, **partial_fields)
+
+
+def dump_json_list(model: type[BaseModel], items: Sequence[Any]) -> bytes:
+    """Dump objects into a JSON array of their schema, without the None fields.
+
+    Args:
+        model: Schema of the items, read from their attributes.
+        items: APScheduler objects or any objects with the attributes of the schema.
+    """
+    adapter = get_list_adapter(model)
+    return adapter.dump_json(adapter.validate_python(items, from_attributes=True), exclude_none=True)
+
+
+def json_list_response(
+    model: type[BaseModel], items: Sequence[Any], response: Response, fields: frozenset[str] | None = None
+) -> Response:
+    """Get a raw JSON response of objects, with the status and headers set on the response parameter.
+
+    FastAPI only applies the response parameter to the values it serializes itself, not to the returned responses.
+
+    Args:
+        model: Schema of the items.
+        items: Objects with the attributes of the schema, or of the fields if given.
+        response: Response parameter of the route.
+        fields: Fields of the schema to dump, all of them if None.
+    """
+    if fields is not None:
+        model = get_partial_model(model, fields)
+    json_response = Response(
+        dump_json_list(model, items), status_code=response.status_code or status.HTTP_200_OK, media_type=JSON_MEDIA_TYPE
+    )
+    json_response.headers.raw.extend(response.headers.raw)
+    return json_response
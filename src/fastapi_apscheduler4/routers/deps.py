@@ -4,9 +4,12 @@ from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends, Query
+from pydantic import AwareDatetime, BeforeValidator
 
 from fastapi_apscheduler4.config import SchedulerAPIEnvConfig
-from fastapi_apscheduler4.dtos import LimitOffset
+from fastapi_apscheduler4.dtos import JobFilters, LimitOffset, ScheduleFilters
+from fastapi_apscheduler4.schemas import ScheduleField, TaskField, TriggerType
+from fastapi_apscheduler4.utils import transform_comma_separated_strings_to_list
 
 
 @lru_cache
@@ -23,6 +26,12 @@ def limit_offset(
     config: Annotated[SchedulerAPIEnvConfig, Depends(get_scheduler_api_config)],
     limit: int | None = Query(None, ge=1, description="Page size limit"),
     offset: int = Query(0, ge=0, description="Page offset"),
+    cursor: Annotated[
+        str | None,
+        Query(
+            description="Cursor of the next page, from the `X-Next-Cursor` header. Takes precedence over the offset."
+        ),
+    ] = None,
 ) -> LimitOffset:
     """Limit Offset query parameters.
 
@@ -34,7 +43,78 @@ def limit_offset(
         limit = config.limit_default
     elif limit > config.limit_max:
         limit = config.limit_max
-    return LimitOffset(limit=limit, offset=offset)
+    return LimitOffset(limit=limit, offset=offset, cursor=cursor)
 
 
 LimitOffsetQueryParams = Annotated[LimitOffset, Depends(limit_offset)]
+
+
+def schedule_filters(
+    task_id: Annotated[list[str] | None, Query(description="Task IDs of the schedules.")] = None,
+    trigger: Annotated[list[TriggerType] | None, Query(description="Trigger types of the schedules.")] = None,
+    acquired_by: Annotated[str | None, Query(description="ID of the scheduler that acquired the schedules.")] = None,
+    next_fire_time_min: Annotated[
+        AwareDatetime | None,
+        Query(description="Earliest next fire time, inclusive. Excludes the exhausted schedules."),
+    ] = None,
+    next_fire_time_max: Annotated[
+        AwareDatetime | None,
+        Query(description="Latest next fire time, inclusive. Excludes the exhausted schedules."),
+    ] = None,
+) -> ScheduleFilters:
+    """Schedule filters query parameters."""
+    return ScheduleFilters(
+        task_id=task_id,
+        trigger=trigger,
+        acquired_by=acquired_by,
+        next_fire_time_min=next_fire_time_min,
+        next_fire_time_max=next_fire_time_max,
+    )
+
+
+ScheduleFiltersQueryParams = Annotated[ScheduleFilters, Depends(schedule_filters)]
+
+
+def job_filters(
+    task_id: Annotated[list[str] | None, Query(description="Task IDs of the jobs.")] = None,
+    acquired: Annotated[
+        bool | None, Query(description="True for the jobs acquired by a scheduler, false for the queued jobs.")
+    ] = None,
+) -> JobFilters:
+    """Job filters query parameters."""
+    return JobFilters(task_id=task_id, acquired=acquired)
+
+
+JobFiltersQueryParams = Annotated[JobFilters, Depends(job_filters)]
+
+
+def schedule_fields(
+    fields: Annotated[
+        list[ScheduleField] | None,
+        BeforeValidator(transform_comma_separated_strings_to_list),
+        Query(description="Fields of the schedules to return, comma separated. The ID is always returned."),
+    ] = None,
+) -> frozenset[str] | None:
+    """Schedule sparse fieldset query parameter, None for all the fields."""
+    if not fields:
+        return None
+    return frozenset({ScheduleField.ID.value, *(field.value for field in fields)})
+
+
+ScheduleFieldsQueryParam = Annotated[frozenset[str] | None, Depends(schedule_fields)]
+
+
+def task_fields(
+    fields: Annotated[
+        list[TaskField] | None,
+        BeforeValidator(transform_comma_separated_strings_to_list),
+        Query(description="Fields of the tasks to return, comma separated. The ID is always returned."),
+    ] = None,
+) -> frozenset[str] | None:
+    """Task sparse fieldset query parameter, None for all the fields."""
+    if not fields:
+        return None
+    return frozenset({TaskField.ID.value, *(field.value for field in fields)})
+
+
+TaskFieldsQueryParam = Annotated[frozenset[str] | None, Depends(task_fields)]
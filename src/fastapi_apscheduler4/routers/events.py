@@ -0,0 +1,102 @@
+"""FastAPI Router for the scheduler events."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated, Any
+
+from fastapi import APIRouter, Query, status
+from fastapi.responses import StreamingResponse
+
+from fastapi_apscheduler4.config import SchedulerAPIConfig
+from fastapi_apscheduler4.constants import EVENTS_DEFAULT_BUFFER_SIZE, EVENTS_DEFAULT_KEEPALIVE, SSE_MEDIA_TYPE
+from fastapi_apscheduler4.events import CONNECTED, EventStream
+from fastapi_apscheduler4.schemas import EventType
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from enum import Enum
+
+    import apscheduler as aps
+
+
+class EventsAPIRouter(APIRouter):
+    """Events API Router."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        apscheduler: aps.AsyncScheduler,
+        *,
+        prefix: str = "",
+        tags: list[str | Enum] | None = None,
+        responses: dict[int | str, dict[str, Any]] | None = None,
+        dependency_overrides_provider: Any = None,  # noqa: ANN401
+        include_in_schema: bool = True,
+        buffer_size: int = EVENTS_DEFAULT_BUFFER_SIZE,
+        keepalive: float = EVENTS_DEFAULT_KEEPALIVE,
+    ) -> None:
+        """Initialize the API router.
+
+        Each client buffers at most `buffer_size` events, and is sent a keepalive comment after `keepalive` seconds
+        without event.
+        """
+        super().__init__(
+            prefix=prefix,
+            tags=tags,
+            responses=responses,
+            dependency_overrides_provider=dependency_overrides_provider,
+            include_in_schema=include_in_schema,
+        )
+        self.apscheduler = apscheduler
+        self.buffer_size = buffer_size
+        self.keepalive = keepalive
+
+        self.add_api_route(
+            "/events",
+            self.stream_events,
+            methods=["GET"],
+            response_class=StreamingResponse,
+            responses={status.HTTP_200_OK: {"content": {SSE_MEDIA_TYPE: {}}}},
+        )
+
+    @classmethod
+    def from_config(cls, apscheduler: aps.AsyncScheduler, config: SchedulerAPIConfig) -> EventsAPIRouter:
+        """Create an API router from the configuration."""
+        return cls(
+            apscheduler=apscheduler,
+            prefix=config.prefix,
+            tags=config.tags,
+            include_in_schema=config.include_in_schema,
+            buffer_size=config.events_buffer_size,
+            keepalive=config.events_keepalive,
+        )
+
+    async def stream_events(
+        self,
+        event_type: Annotated[
+            list[EventType] | None, Query(alias="type", description="Types of the events, all of them if empty.")
+        ] = None,
+        task_id: Annotated[list[str] | None, Query(description="Task IDs of the events, all of them if empty.")] = None,
+    ) -> StreamingResponse:
+        """Stream the scheduler events as server-sent events (SSE), named after their type.
+
+        The events are streamed from the `connected` comment on.
+
+        A slow client does not slow down the scheduler: the events published while its buffer is full are dropped, and
+        a `dropped` event with their `count` is sent before its next event.
+        """
+        stream = EventStream(types=event_type, task_ids=task_id, buffer_size=self.buffer_size, keepalive=self.keepalive)
+        return StreamingResponse(
+            self._stream_events(stream),
+            media_type=SSE_MEDIA_TYPE,
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def _stream_events(self, stream: EventStream) -> AsyncIterator[bytes]:
+        """Stream the server-sent events while the client is connected, subscribed to the event broker meanwhile."""
+        subscription = stream.subscribe(self.apscheduler.event_broker)
+        try:
+            yield CONNECTED
+            async for chunk in stream.iter_sse():
+                yield chunk
+        finally:
+            subscription.unsubscribe()
@@ -0,0 +1,148 @@
+"""FastAPI Router for jobs."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated, Any, cast
+from uuid import UUID
+
+import apscheduler as aps
+from anyio import Event, move_on_after
+from fastapi import APIRouter, Query, Request, Response, status
+
+from fastapi_apscheduler4.config import SchedulerAPIConfig
+from fastapi_apscheduler4.constants import JOB_RESULT_DEFAULT_MAX_WAIT
+from fastapi_apscheduler4.errors import (
+    InvalidCursorAPIError,
+    InvalidCursorError,
+    NotFoundAPIError,
+    UnexpectedAPIError,
+)
+from fastapi_apscheduler4.queries import get_data_store_queries
+from fastapi_apscheduler4.responses import json_list_response
+from fastapi_apscheduler4.routers.deps import JobFiltersQueryParams, LimitOffsetQueryParams
+from fastapi_apscheduler4.schemas import Job, JobResult
+from fastapi_apscheduler4.utils import safe_error, set_page_headers
+
+if TYPE_CHECKING:
+    from enum import Enum
+
+
+class JobsAPIRouter(APIRouter):
+    """Jobs API Router."""
+
+    def __init__(
+        self,
+        apscheduler: aps.AsyncScheduler,
+        *,
+        prefix: str = "",
+        tags: list[str | Enum] | None = None,
+        responses: dict[int | str, dict[str, Any]] | None = None,
+        dependency_overrides_provider: Any = None,  # noqa: ANN401
+        include_in_schema: bool = True,
+        max_wait: float = JOB_RESULT_DEFAULT_MAX_WAIT,
+    ) -> None:
+        """Initialize the API router.
+
+        The job result requests wait at most `max_wait` seconds for the job to finish.
+        """
+        super().__init__(
+            prefix=prefix,
+            tags=tags,
+            responses=responses,
+            dependency_overrides_provider=dependency_overrides_provider,
+            include_in_schema=include_in_schema,
+        )
+        self.apscheduler = apscheduler
+        self.queries = get_data_store_queries(apscheduler.data_store)
+        self.max_wait = max_wait
+
+        self.add_api_route(
+            "/jobs", self.list_jobs, methods=["GET"], response_model=list[Job], response_model_exclude_none=True
+        )
+        self.add_api_route(
+            "/jobs/{id}", self.get_job, methods=["GET"], response_model=Job, response_model_exclude_none=True
+        )
+        self.add_api_route(
+            "/jobs/{id}/result",
+            self.get_job_result,
+            methods=["GET"],
+            response_model=JobResult,
+            responses={status.HTTP_202_ACCEPTED: {"description": "The job is not finished yet."}},
+        )
+
+    @classmethod
+    def from_config(cls, apscheduler: aps.AsyncScheduler, config: SchedulerAPIConfig) -> JobsAPIRouter:
+        """Create an API router from the configuration."""
+        return cls(
+            apscheduler=apscheduler,
+            prefix=config.prefix,
+            tags=config.tags,
+            include_in_schema=config.include_in_schema,
+            max_wait=config.job_result_max_wait,
+        )
+
+    async def list_jobs(
+        self,
+        request: Request,
+        response: Response,
+        limit_offset: LimitOffsetQueryParams,
+        filters: JobFiltersQueryParams,
+    ) -> Response:
+        """List the queued and running jobs, ordered by creation time.
+
+        Follow the `X-Next-Cursor` header (or the `Link` header) to read the next page in constant time, whatever its
+        depth. The total count is only returned for the offset pages.
+        """
+        with safe_error(UnexpectedAPIError, allow=InvalidCursorAPIError):
+            try:
+                page = await self.queries.get_jobs(
+                    limit=limit_offset.limit, offset=limit_offset.offset, cursor=limit_offset.cursor, filters=filters
+                )
+            except InvalidCursorError as error:
+                raise InvalidCursorAPIError(cast("str", limit_offset.cursor)) from error
+            set_page_headers(page, request, response)
+            return json_list_response(Job, page.items, response)
+
+    async def get_job(self, id: UUID) -> aps.Job:
+        """Get a queued or running job by ID."""
+        with safe_error(UnexpectedAPIError, allow=NotFoundAPIError):
+            jobs = await self.apscheduler.data_store.get_jobs([id])
+            if not jobs:
+                raise NotFoundAPIError(Job, str(id))
+            return jobs[0]
+
+    async def get_job_result(
+        self,
+        id: UUID,
+        wait: Annotated[
+            float, Query(ge=0, description="Number of seconds to wait for the job to finish, capped by the server.")
+        ] = 0,
+    ) -> aps.JobResult | Response:
+        """Get the result of a job, waiting for the job to finish if it is queued or running.
+
+        The results are only kept for the jobs added with a result expiration time, and are removed once read.
+
+        Responds with 202 Accepted when the job is not finished after the wait, to poll again.
+        """
+        with safe_error(UnexpectedAPIError, allow=NotFoundAPIError):
+            released = Event()
+
+            def handle_event(event: aps.Event) -> None:
+                if cast("aps.JobReleased", event).job_id == id:
+                    released.set()
+
+            # Subscribed before reading the job, not to miss its release in between
+            with self.apscheduler.event_broker.subscribe(handle_event, {aps.JobReleased}):
+                job_exists = bool(await self.apscheduler.data_store.get_jobs([id]))
+                if (result := await self.apscheduler.data_store.get_job_result(id)) is not None:
+                    return result
+                if not job_exists:
+                    raise NotFoundAPIError(JobResult, str(id))
+                with move_on_after(min(wait, self.max_wait)):
+                    await released.wait()
+
+            if not released.is_set():
+                return Response(status_code=status.HTTP_202_ACCEPTED)
+            if (result := await self.apscheduler.data_store.get_job_result(id)) is None:
+                raise NotFoundAPIError(JobResult, str(id))
+            return result
@@ -0,0 +1,81 @@
+"""FastAPI Router for the scheduler."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from fastapi import APIRouter, Response, status
+
+from fastapi_apscheduler4.config import SchedulerAPIConfig
+from fastapi_apscheduler4.schemas import CacheStats, Readiness, SchedulerPhase
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from enum import Enum
+
+    from fastapi_apscheduler4.cache import ResponseCache
+
+
+class SchedulerAPIRouter(APIRouter):
+    """Scheduler API Router."""
+
+    def __init__(
+        self,
+        get_phase: Callable[[], SchedulerPhase],
+        *,
+        prefix: str = "",
+        tags: list[str | Enum] | None = None,
+        include_in_schema: bool = True,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """Initialize the API router.
+
+        The statistics of the response cache are exposed when a cache is given.
+        """
+        super().__init__(
+            prefix=prefix,
+            tags=tags,
+            include_in_schema=include_in_schema,
+        )
+        self.get_phase = get_phase
+        self.add_api_route(
+            "/scheduler/readiness",
+            self.get_readiness,
+            methods=["GET"],
+            response_model=Readiness,
+            responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": Readiness}},
+        )
+        self.cache = cache
+        if cache is not None:
+            self.add_api_route("/scheduler/cache", self.get_cache_stats, methods=["GET"], response_model=CacheStats)
+
+    @classmethod
+    def from_config(
+        cls,
+        get_phase: Callable[[], SchedulerPhase],
+        config: SchedulerAPIConfig,
+        cache: ResponseCache | None = None,
+    ) -> SchedulerAPIRouter:
+        """Create an API router from the configuration."""
+        return cls(
+            get_phase=get_phase,
+            prefix=config.prefix,
+            tags=config.tags,
+            include_in_schema=config.include_in_schema,
+            cache=cache,
+        )
+
+    async def get_readiness(self, response: Response) -> Readiness:
+        """Get the scheduler readiness.
+
+        Responds with 503 Service Unavailable until the scheduler is ready.
+        """
+        phase = self.get_phase()
+        ready = phase is SchedulerPhase.READY
+        if not ready:
+            response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return Readiness(ready=ready, phase=phase)
+
+    async def get_cache_stats(self) -> CacheStats:
+        """Get the response cache hit and miss counters."""
+        return cast("ResponseCache", self.cache).get_stats()
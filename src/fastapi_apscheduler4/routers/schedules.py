@@ -2,22 +2,80 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import TYPE_CHECKING, Annotated, cast
+from uuid import uuid4
 
 import apscheduler as aps
-from fastapi import APIRouter, Query, Response, status
+from anyio import to_thread
+from apscheduler._utils import unset
+from fastapi import APIRouter, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from fastapi_apscheduler4 import logger
+from fastapi_apscheduler4.cache import CacheNamespace, DataStoreVersions, ResponseCache, get_or_load
 from fastapi_apscheduler4.config import SchedulerAPIConfig
-from fastapi_apscheduler4.constants import SCHEDULE_PREFIX
-from fastapi_apscheduler4.errors import DeleteNotAllowedAPIError, NotFoundAPIError, UnexpectedAPIError
-from fastapi_apscheduler4.routers.deps import LimitOffsetQueryParams
-from fastapi_apscheduler4.schemas import Schedule
-from fastapi_apscheduler4.utils import paginate, safe_error
+from fastapi_apscheduler4.constants import (
+    BULK_BATCH_SIZE,
+    EXPORT_CHUNK_SIZE,
+    HISTOGRAM_MAX_HORIZON,
+    MANIFEST_TASK_ID,
+    NDJSON_MEDIA_TYPE,
+    SCHEDULE_PREFIX,
+)
+from fastapi_apscheduler4.dtos import ScheduleSelection
+from fastapi_apscheduler4.errors import (
+    AlreadyExistsAPIError,
+    DeleteNotAllowedAPIError,
+    InvalidCursorAPIError,
+    InvalidCursorError,
+    NotFoundAPIError,
+    UnexpectedAPIError,
+    WriteNotAllowedAPIError,
+)
+from fastapi_apscheduler4.ndjson import (
+    NDJSON_REQUEST_BODY,
+    dump_lines,
+    dump_schedule,
+    iter_lines,
+    iter_pages,
+    load_schedule,
+)
+from fastapi_apscheduler4.queries import get_data_store_queries
+from fastapi_apscheduler4.responses import json_list_response
+from fastapi_apscheduler4.routers.deps import (
+    LimitOffsetQueryParams,
+    ScheduleFieldsQueryParam,
+    ScheduleFiltersQueryParams,
+)
+from fastapi_apscheduler4.schemas import (
+    BulkItemResult,
+    BulkOutcome,
+    BulkResult,
+    ConflictPolicy,
+    FireTimeBucket,
+    FireTimeHistogram,
+    ImportFailure,
+    ImportResult,
+    JobAccepted,
+    Schedule,
+    ScheduleCreate,
+    ScheduleRun,
+    ScheduleSort,
+    ScheduleUpdate,
+    Task,
+)
+from fastapi_apscheduler4.spread import get_fire_time_histogram
+from fastapi_apscheduler4.utils import get_error_message, get_not_modified_response, safe_error, set_page_headers
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
     from enum import Enum
 
+    from fastapi_apscheduler4.dtos import Page, ScheduleFilters
+
 
 class SchedulesAPIRouter(APIRouter):
     """Schedules API Router."""
@@ -29,14 +87,22 @@ class SchedulesAPIRouter(APIRouter):
         prefix: str = "",
         tags: list[str | Enum] | None = None,
         include_in_schema: bool = True,
+        cache: ResponseCache | None = None,
+        versions: DataStoreVersions | None = None,
     ) -> None:
-        """Initialize the API router."""
+        """Initialize the API router.
+
+        The read endpoints are cached when a cache is given, and return an ETag when versions are given.
+        """
         super().__init__(
             prefix=prefix,
             tags=tags,
             include_in_schema=include_in_schema,
         )
         self.apscheduler = apscheduler
+        self.queries = get_data_store_queries(apscheduler.data_store)
+        self.cache = cache
+        self.versions = versions
         self.add_api_route(
             "/schedules",
             self.list_schedules,
@@ -44,6 +110,37 @@ class SchedulesAPIRouter(APIRouter):
             response_model=list[Schedule],
             response_model_exclude_none=True,
         )
+        self.add_api_route(
+            "/schedules",
+            self.create_schedule,
+            methods=["POST"],
+            status_code=status.HTTP_201_CREATED,
+            response_model=Schedule,
+            response_model_exclude_none=True,
+        )
+        self.add_api_route(
+            "/schedules/histogram",
+            self.get_fire_time_histogram,
+            methods=["GET"],
+            response_model=FireTimeHistogram,
+        )
+        self.add_api_route(
+            "/schedules/export",
+            self.export_schedules,
+            methods=["GET"],
+            response_class=StreamingResponse,
+            responses={status.HTTP_200_OK: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+        )
+        self.add_api_route(
+            "/schedules/import",
+            self.import_schedules,
+            methods=["POST"],
+            response_model=ImportResult,
+            openapi_extra=NDJSON_REQUEST_BODY,
+        )
+        self.add_api_route("/schedules/bulk/delete", self.delete_schedules, methods=["POST"], response_model=BulkResult)
+        self.add_api_route("/schedules/bulk/pause", self.pause_schedules, methods=["POST"], response_model=BulkResult)
+        self.add_api_route("/schedules/bulk/resume", self.resume_schedules, methods=["POST"], response_model=BulkResult)
         self.add_api_route(
             "/schedules/{id}",
             self.get_schedule,
@@ -58,30 +155,373 @@ class SchedulesAPIRouter(APIRouter):
             status_code=status.HTTP_204_NO_CONTENT,
             response_model=None,
         )
+        self.add_api_route(
+            "/schedules/{id}",
+            self.update_schedule,
+            methods=["PUT"],
+            response_model=Schedule,
+            response_model_exclude_none=True,
+        )
+        self.add_api_route(
+            "/schedules/{id}/pause",
+            self.pause_schedule,
+            methods=["POST"],
+            status_code=status.HTTP_204_NO_CONTENT,
+            response_model=None,
+        )
+        self.add_api_route(
+            "/schedules/{id}/resume",
+            self.resume_schedule,
+            methods=["POST"],
+            status_code=status.HTTP_204_NO_CONTENT,
+            response_model=None,
+        )
+        self.add_api_route(
+            "/schedules/{id}/run",
+            self.run_schedule,
+            methods=["POST"],
+            status_code=status.HTTP_202_ACCEPTED,
+            response_model=JobAccepted,
+        )
 
     @classmethod
-    def from_config(cls, apscheduler: aps.AsyncScheduler, config: SchedulerAPIConfig) -> SchedulesAPIRouter:
+    def from_config(
+        cls,
+        apscheduler: aps.AsyncScheduler,
+        config: SchedulerAPIConfig,
+        cache: ResponseCache | None = None,
+        versions: DataStoreVersions | None = None,
+    ) -> SchedulesAPIRouter:
         """Create an API router from the configuration."""
         return cls(
             apscheduler=apscheduler,
             prefix=config.prefix,
             tags=config.tags,
             include_in_schema=config.include_in_schema,
+            cache=cache,
+            versions=versions,
         )
 
-    async def list_schedules(self, response: Response, limit_offset: LimitOffsetQueryParams) -> list[aps.Schedule]:
-        """List schedules."""
+    async def list_schedules(
+        self,
+        request: Request,
+        response: Response,
+        limit_offset: LimitOffsetQueryParams,
+        filters: ScheduleFiltersQueryParams,
+        sort: Annotated[
+            ScheduleSort,
+            Query(description="Order of the schedules, '-' for descending. The exhausted schedules are always last."),
+        ] = ScheduleSort.NEXT_FIRE_TIME,
+        fields: ScheduleFieldsQueryParam = None,
+    ) -> Response:
+        """List schedules matching the filters, ordered by next fire time then ID by default.
+
+        Follow the `X-Next-Cursor` header (or the `Link` header) to read the next page in constant time, whatever its
+        depth. The total count is only returned for the offset pages.
+
+        Only the selected fields are returned with `fields`, and the other columns are not read when the data store
+        supports it.
+
+        Responds with 304 Not Modified when the `If-None-Match` header matches the ETag of the schedules.
+        """
+        with safe_error(UnexpectedAPIError, allow=InvalidCursorAPIError):
+            if (not_modified := self._get_not_modified_response(request, response)) is not None:
+                return not_modified
+            load = partial(
+                self.queries.get_schedules if fields is None else partial(self.queries.get_sparse_schedules, fields),
+                limit=limit_offset.limit,
+                offset=limit_offset.offset,
+                cursor=limit_offset.cursor,
+                filters=filters,
+                sort=sort,
+            )
+            key = ("list", limit_offset.model_dump_json(), filters.model_dump_json(), sort, fields)
+            try:
+                page = await get_or_load(self.cache, CacheNamespace.SCHEDULES, key, load)
+            except InvalidCursorError as error:
+                raise InvalidCursorAPIError(cast("str", limit_offset.cursor)) from error
+            set_page_headers(page, request, response)
+            return json_list_response(Schedule, page.items, response, fields)
+
+    async def create_schedule(
+        self,
+        schedule: ScheduleCreate,
+        force: bool = Query(  # noqa: FBT001
+            False,  # noqa: FBT003
+            description=f"True will force creating auto schedules (prefixed with '{SCHEDULE_PREFIX}').",
+        ),
+    ) -> aps.Schedule:
+        """Create a schedule running an existing task, failing if the ID is taken."""
+        with safe_error(UnexpectedAPIError, allow=(AlreadyExistsAPIError, NotFoundAPIError, WriteNotAllowedAPIError)):
+            schedule_id = schedule.id or str(uuid4())
+            return await self._write_schedule(schedule_id, schedule, aps.ConflictPolicy.exception, force=force)
+
+    async def update_schedule(
+        self,
+        id: str,
+        schedule: ScheduleUpdate,
+        force: bool = Query(  # noqa: FBT001
+            False,  # noqa: FBT003
+            description=f"True will force updating auto schedules (prefixed with '{SCHEDULE_PREFIX}').",
+        ),
+    ) -> aps.Schedule:
+        """Replace a schedule by ID, or create it if it does not exist.
+
+        The next fire time is computed from the new trigger.
+        """
+        with safe_error(UnexpectedAPIError, allow=(NotFoundAPIError, WriteNotAllowedAPIError)):
+            return await self._write_schedule(id, schedule, aps.ConflictPolicy.replace, force=force)
+
+    async def _write_schedule(
+        self, id: str, schedule: ScheduleUpdate, conflict_policy: aps.ConflictPolicy, *, force: bool
+    ) -> aps.Schedule:
+        """Write a schedule of an existing task.
+
+        The auto schedules are managed by the application, so they are only written with force and are reconciled
+        again on the next startup.
+
+        Raises:
+            WriteNotAllowedAPIError: If the schedule is an auto schedule, without force.
+            NotFoundAPIError: If the task does not exist.
+            AlreadyExistsAPIError: If the schedule exists and the conflict policy is exception.
+        """
+        is_auto = id.startswith(SCHEDULE_PREFIX)
+        if is_auto and not force:
+            raise WriteNotAllowedAPIError(Schedule, id)
+        # The scheduler would create a task without function for an unknown task ID
+        if schedule.task_id == MANIFEST_TASK_ID:
+            raise NotFoundAPIError(Task, schedule.task_id)
+        try:
+            await self.apscheduler.data_store.get_task(schedule.task_id)
+        except aps.TaskLookupError as error:
+            raise NotFoundAPIError(Task, schedule.task_id) from error
+
+        try:
+            await self.apscheduler.add_schedule(
+                schedule.task_id,
+                schedule.trigger.to_apscheduler(),
+                id=id,
+                args=schedule.args,
+                kwargs=schedule.kwargs,
+                paused=schedule.paused,
+                coalesce=aps.CoalescePolicy[schedule.coalesce.value],
+                misfire_grace_time=schedule.misfire_grace_time
+                if "misfire_grace_time" in schedule.model_fields_set
+                else unset,
+                max_jitter=schedule.max_jitter,
+                conflict_policy=conflict_policy,
+            )
+        except aps.ConflictingIdError as error:
+            raise AlreadyExistsAPIError(Schedule, id) from error
+
+        if is_auto:
+            logger.warning(f"Schedule ID {id} written with force.")
+            await self._invalidate_manifest()
+        self._invalidate()
+        return await self.apscheduler.get_schedule(id)
+
+    async def get_fire_time_histogram(
+        self,
+        horizon: int = Query(
+            300,
+            ge=1,
+            le=HISTOGRAM_MAX_HORIZON,
+            description="Number of seconds from now to compute the fire times for.",
+        ),
+    ) -> FireTimeHistogram:
+        """Get the number of schedules firing in each second, to check the load is spread.
+
+        Only the seconds with at least one fire time are returned. The number of computed fire times is capped, so
+        the end of the histogram is before the horizon when the schedules fire too often.
+        """
         with safe_error(UnexpectedAPIError):
+            start = datetime.now(timezone.utc)
             schedules = await self.apscheduler.get_schedules()
-            return paginate(schedules, limit_offset, response)
+            histogram, end = await to_thread.run_sync(
+                get_fire_time_histogram, schedules, start + timedelta(seconds=horizon)
+            )
+            return FireTimeHistogram(
+                start=start,
+                end=end,
+                peak=max(histogram.values(), default=0),
+                buckets=[FireTimeBucket(time=time, count=count) for time, count in sorted(histogram.items())],
+            )
+
+    async def export_schedules(self) -> StreamingResponse:
+        """Export all the schedules as NDJSON, one schedule per line, ordered by ID.
+
+        The schedules are streamed in chunks from the data store, and can be restored with the import.
+        A schedule that cannot be serialized is exported as an error line, reported as a failure by the import.
+        """
+        return StreamingResponse(self._export_schedules(), media_type=NDJSON_MEDIA_TYPE)
+
+    async def _export_schedules(self) -> AsyncIterator[bytes]:
+        """Stream the NDJSON lines of the schedules, a chunk at a time."""
+
+        def get_page(cursor: str | None) -> Awaitable[Page[aps.Schedule]]:
+            return self.queries.get_schedules(limit=EXPORT_CHUNK_SIZE, cursor=cursor, sort=ScheduleSort.ID)
+
+        async for schedules in iter_pages(get_page):
+            yield dump_lines(schedules, dump_schedule)
+
+    async def import_schedules(
+        self,
+        request: Request,
+        conflict_policy: Annotated[
+            ConflictPolicy, Query(description="What to do when a schedule with the same ID already exists.")
+        ] = ConflictPolicy.DO_NOTHING,
+        force: bool = Query(  # noqa: FBT001
+            False,  # noqa: FBT003
+            description=f"True will import the auto schedules (prefixed with '{SCHEDULE_PREFIX}') as well.",
+        ),
+    ) -> ImportResult:
+        """Import schedules from an NDJSON body, one schedule per line as exported.
+
+        The body is streamed, and a failing line does not prevent the others from being imported. The auto schedules
+        are managed by the application, so they are only imported with force. A schedule must run an existing task,
+        and the existing schedules are skipped by the do nothing conflict policy.
+        """
+        with safe_error(UnexpectedAPIError):
+            imported = skipped = 0
+            failures: list[ImportFailure] = []
+            auto_imported = False
+            policy = aps.ConflictPolicy[conflict_policy.value]
+            task_ids: set[str] = set()
+            async for line_number, line in iter_lines(request.stream()):
+                try:
+                    schedule = load_schedule(line)
+                except (aps.DeserializationError, TypeError, ValueError) as error:
+                    failures.append(ImportFailure(line=line_number, error=get_error_message(error)))
+                    continue
+
+                if (error_message := await self._get_import_error(schedule, task_ids, force=force)) is not None:
+                    failures.append(ImportFailure(line=line_number, id=schedule.id, error=error_message))
+                    continue
+
+                if policy is aps.ConflictPolicy.do_nothing and await self.apscheduler.data_store.get_schedules(
+                    {schedule.id}
+                ):
+                    skipped += 1
+                    continue
+
+                try:
+                    await self.apscheduler.data_store.add_schedule(schedule, policy)
+                except aps.ConflictingIdError as error:
+                    failures.append(ImportFailure(line=line_number, id=schedule.id, error=get_error_message(error)))
+                    continue
+                imported += 1
+                auto_imported = auto_imported or schedule.id.startswith(SCHEDULE_PREFIX)
+
+            if auto_imported:
+                logger.warning("Auto schedules imported with force.")
+                await self._invalidate_manifest()
+            self._invalidate()
+            return ImportResult(imported=imported, skipped=skipped, failures=failures)
+
+    async def _get_import_error(self, schedule: aps.Schedule, task_ids: set[str], *, force: bool) -> str | None:
+        """Get the reason an imported schedule is rejected, None if it is allowed.
+
+        Like `_write_schedule`, the auto schedules need force and the task must exist. The IDs of the tasks found
+        are added to `task_ids`, so that each task is only looked up once per import.
+        """
+        if schedule.id.startswith(SCHEDULE_PREFIX) and not force:
+            return f"Schedule with ID {schedule.id} does not allow import."
+        if schedule.task_id in task_ids:
+            return None
+        not_found = f"Task with ID {schedule.task_id} not found."
+        # The manifest task has no function, its schedules would fail on every run
+        if schedule.task_id == MANIFEST_TASK_ID:
+            return not_found
+        try:
+            await self.apscheduler.data_store.get_task(schedule.task_id)
+        except aps.TaskLookupError:
+            return not_found
+        task_ids.add(schedule.task_id)
+        return None
+
+    async def delete_schedules(
+        self,
+        selection: ScheduleSelection,
+        force: bool = Query(  # noqa: FBT001
+            False,  # noqa: FBT003
+            description=f"True will force deleting auto schedules (prefixed with '{SCHEDULE_PREFIX}').",
+        ),
+    ) -> BulkResult:
+        """Delete schedules by ID or matching filters, in batches.
+
+        Reports the outcome of each schedule: the auto schedules are not allowed to be deleted without force.
+        """
+        with safe_error(UnexpectedAPIError):
+            ids = await self._select_schedule_ids(selection)
+            allowed_ids = [id for id in ids if force or not id.startswith(SCHEDULE_PREFIX)]
+            removed_ids = await self._run_in_batches(self.queries.remove_schedules, allowed_ids)
 
-    async def get_schedule(self, id: str) -> aps.Schedule:
-        """Get a schedule by ID."""
+            if any(id.startswith(SCHEDULE_PREFIX) for id in removed_ids):
+                logger.warning("Auto schedules deleted with force.")
+                await self._invalidate_manifest()
+            self._invalidate()
+            return get_bulk_result(ids, set(allowed_ids), removed_ids)
+
+    async def pause_schedules(self, selection: ScheduleSelection) -> BulkResult:
+        """Pause schedules by ID or matching filters, in batches.
+
+        The paused schedules do not fire until resumed. Reports the outcome of each schedule.
+        """
+        return await self._set_schedules_paused(selection, paused=True)
+
+    async def resume_schedules(self, selection: ScheduleSelection) -> BulkResult:
+        """Resume schedules by ID or matching filters, in batches.
+
+        The fire times missed while paused are handled by the misfire grace time and coalesce policy of each schedule.
+        Reports the outcome of each schedule.
+        """
+        return await self._set_schedules_paused(selection, paused=False)
+
+    async def _set_schedules_paused(self, selection: ScheduleSelection, *, paused: bool) -> BulkResult:
+        """Pause or resume the selected schedules."""
+        with safe_error(UnexpectedAPIError):
+            ids = await self._select_schedule_ids(selection)
+            done_ids = await self._run_in_batches(partial(self.queries.set_schedules_paused, paused=paused), ids)
+            self._invalidate()
+            return get_bulk_result(ids, set(ids), done_ids)
+
+    async def _select_schedule_ids(self, selection: ScheduleSelection) -> list[str]:
+        """Get the IDs of the selected schedules, without duplicates, in the given order or by ID."""
+        if selection.ids is not None:
+            return list(dict.fromkeys(selection.ids))
+        return sorted(await self.queries.get_schedule_ids(cast("ScheduleFilters", selection.filters)))
+
+    async def _run_in_batches(self, operation: Callable[[list[str]], Awaitable[set[str]]], ids: list[str]) -> set[str]:
+        """Run a bulk operation on batches of schedules, so that each data store operation stays bounded.
+
+        Returns:
+            The IDs of the schedules the operation was done on.
+        """
+        done_ids: set[str] = set()
+        for start in range(0, len(ids), BULK_BATCH_SIZE):
+            done_ids |= await operation(ids[start : start + BULK_BATCH_SIZE])
+        return done_ids
+
+    async def get_schedule(self, id: str, request: Request, response: Response) -> aps.Schedule | Response:
+        """Get a schedule by ID.
+
+        Responds with 304 Not Modified when the `If-None-Match` header matches the ETag of the schedules.
+        """
         with safe_error(UnexpectedAPIError, allow=NotFoundAPIError):
-            try:
-                return await self.apscheduler.get_schedule(id)
-            except aps.ScheduleLookupError as error:
-                raise NotFoundAPIError(Schedule, id) from error
+            if (not_modified := self._get_not_modified_response(request, response)) is not None:
+                return not_modified
+            return await get_or_load(self.cache, CacheNamespace.SCHEDULES, ("get", id), partial(self._get_schedule, id))
+
+    async def _get_schedule(self, id: str) -> aps.Schedule:
+        """Get a schedule by ID from the data store.
+
+        Raises:
+            NotFoundAPIError: If the schedule does not exist.
+        """
+        try:
+            return await self.apscheduler.get_schedule(id)
+        except aps.ScheduleLookupError as error:
+            raise NotFoundAPIError(Schedule, id) from error
 
     async def delete_schedule(
         self,
@@ -93,11 +533,85 @@ class SchedulesAPIRouter(APIRouter):
     ) -> None:
         """Delete a schedule by ID."""
         with safe_error(UnexpectedAPIError, allow=(DeleteNotAllowedAPIError, NotFoundAPIError)):
-            await self.get_schedule(id)
+            is_auto = id.startswith(SCHEDULE_PREFIX)
+            if is_auto and not force:
+                raise DeleteNotAllowedAPIError(Schedule, id)
 
-            if id.startswith(SCHEDULE_PREFIX):
-                if not force:
-                    raise DeleteNotAllowedAPIError(Schedule, id)
+            if not await self.queries.remove_schedules([id]):
+                raise NotFoundAPIError(Schedule, id)
+            if is_auto:
                 logger.warning(f"Schedule ID {id} deleted with force.")
+                await self._invalidate_manifest()
+            self._invalidate()
+
+    async def pause_schedule(self, id: str) -> None:
+        """Pause a schedule by ID, so that it does not fire until resumed.
+
+        The running jobs are not cancelled. The auto schedules stay paused across restarts, even when their
+        configuration changes.
+        """
+        await self._set_schedule_paused(id, paused=True)
+
+    async def resume_schedule(self, id: str) -> None:
+        """Resume a paused schedule by ID.
+
+        The fire times missed while paused are handled by the misfire grace time and coalesce policy of the schedule.
+        """
+        await self._set_schedule_paused(id, paused=False)
+
+    async def _set_schedule_paused(self, id: str, *, paused: bool) -> None:
+        """Pause or resume a schedule in a single data store operation."""
+        with safe_error(UnexpectedAPIError, allow=NotFoundAPIError):
+            if not await self.queries.set_schedules_paused([id], paused=paused):
+                raise NotFoundAPIError(Schedule, id)
+            self._invalidate()
+
+    async def run_schedule(self, id: str, run: ScheduleRun | None = None) -> JobAccepted:
+        """Run the task of a schedule now with its arguments, without waiting for its job to finish.
+
+        The next fire time of the schedule is unchanged. Read the result of the job from the job result endpoint, which
+        waits for the job to finish.
+        """
+        with safe_error(UnexpectedAPIError, allow=NotFoundAPIError):
+            schedule = await self._get_schedule(id)
+            run = run or ScheduleRun()
+            job_id = await self.apscheduler.add_job(
+                schedule.task_id,
+                args=schedule.args,
+                kwargs=schedule.kwargs,
+                job_executor=schedule.job_executor,
+                metadata=schedule.metadata,
+                result_expiration_time=run.result_expiration_time,
+            )
+            return JobAccepted(job_id=job_id)
+
+    def _get_not_modified_response(self, request: Request, response: Response) -> Response | None:
+        """Set the ETag of the schedules, and get a not modified response if the client already has it."""
+        if self.versions is None:
+            return None
+        return get_not_modified_response(self.versions.get_etag(CacheNamespace.SCHEDULES), request, response)
+
+    def _invalidate(self) -> None:
+        """Invalidate the cache and versions of the schedules, not to serve them until the event is delivered."""
+        for versions in (self.cache, self.versions):
+            if versions is not None:
+                versions.invalidate(CacheNamespace.SCHEDULES)
+
+    async def _invalidate_manifest(self) -> None:
+        """Invalidate the auto schedules manifest so they are reconciled on the next startup."""
+        with suppress(aps.TaskLookupError):
+            await self.apscheduler.data_store.remove_task(MANIFEST_TASK_ID)
+
 
-            await self.apscheduler.remove_schedule(id)
+def get_bulk_result(ids: list[str], allowed_ids: set[str], done_ids: set[str]) -> BulkResult:
+    """Get the result of a bulk operation, with the outcome of each schedule in order."""
+    results = []
+    for id in ids:
+        if id not in allowed_ids:
+            outcome = BulkOutcome.NOT_ALLOWED
+        elif id in done_ids:
+            outcome = BulkOutcome.DONE
+        else:
+            outcome = BulkOutcome.NOT_FOUND
+        results.append(BulkItemResult(id=id, outcome=outcome))
+    return BulkResult(done=len(done_ids), results=results)
@@ -2,25 +2,40 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from functools import partial
+from typing import TYPE_CHECKING, Any, cast
 
 import apscheduler as aps
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from fastapi_apscheduler4.cache import CacheNamespace, DataStoreVersions, ResponseCache, get_or_load
 from fastapi_apscheduler4.config import SchedulerAPIConfig
-from fastapi_apscheduler4.errors import NotFoundAPIError, UnexpectedAPIError
-from fastapi_apscheduler4.routers.deps import LimitOffsetQueryParams
-from fastapi_apscheduler4.schemas import Task
-from fastapi_apscheduler4.utils import paginate, safe_error
+from fastapi_apscheduler4.constants import EXPORT_CHUNK_SIZE, MANIFEST_TASK_ID, NDJSON_MEDIA_TYPE
+from fastapi_apscheduler4.errors import (
+    InvalidCursorAPIError,
+    InvalidCursorError,
+    NotFoundAPIError,
+    UnexpectedAPIError,
+)
+from fastapi_apscheduler4.ndjson import NDJSON_REQUEST_BODY, dump_lines, dump_task, iter_lines, iter_pages, load_task
+from fastapi_apscheduler4.queries import get_data_store_queries
+from fastapi_apscheduler4.responses import json_list_response
+from fastapi_apscheduler4.routers.deps import LimitOffsetQueryParams, TaskFieldsQueryParam
+from fastapi_apscheduler4.schemas import ImportFailure, ImportResult, JobAccepted, Task, TaskRun
+from fastapi_apscheduler4.utils import get_error_message, get_not_modified_response, safe_error, set_page_headers
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable
     from enum import Enum
 
+    from fastapi_apscheduler4.dtos import Page
+
 
 class TasksAPIRouter(APIRouter):
     """Tasks API Router."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         apscheduler: aps.AsyncScheduler,
         *,
@@ -29,8 +44,13 @@ class TasksAPIRouter(APIRouter):
         responses: dict[int | str, dict[str, Any]] | None = None,
         dependency_overrides_provider: Any = None,  # noqa: ANN401
         include_in_schema: bool = True,
+        cache: ResponseCache | None = None,
+        versions: DataStoreVersions | None = None,
     ) -> None:
-        """Initialize the API router."""
+        """Initialize the API router.
+
+        The read endpoints are cached when a cache is given, and return an ETag when versions are given.
+        """
         super().__init__(
             prefix=prefix,
             tags=tags,
@@ -39,10 +59,27 @@ class TasksAPIRouter(APIRouter):
             include_in_schema=include_in_schema,
         )
         self.apscheduler = apscheduler
+        self.queries = get_data_store_queries(apscheduler.data_store)
+        self.cache = cache
+        self.versions = versions
 
         self.add_api_route(
             "/tasks", self.list_tasks, methods=["GET"], response_model=list[Task], response_model_exclude_none=True
         )
+        self.add_api_route(
+            "/tasks/export",
+            self.export_tasks,
+            methods=["GET"],
+            response_class=StreamingResponse,
+            responses={status.HTTP_200_OK: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+        )
+        self.add_api_route(
+            "/tasks/import",
+            self.import_tasks,
+            methods=["POST"],
+            response_model=ImportResult,
+            openapi_extra=NDJSON_REQUEST_BODY,
+        )
         self.add_api_route(
             "/tasks/{id}",
             self.get_task,
@@ -50,27 +87,168 @@ class TasksAPIRouter(APIRouter):
             response_model=Task,
             response_model_exclude_none=True,
         )
+        self.add_api_route(
+            "/tasks/{id}/run",
+            self.run_task,
+            methods=["POST"],
+            status_code=status.HTTP_202_ACCEPTED,
+            response_model=JobAccepted,
+        )
 
     @classmethod
-    def from_config(cls, apscheduler: aps.AsyncScheduler, config: SchedulerAPIConfig) -> TasksAPIRouter:
+    def from_config(
+        cls,
+        apscheduler: aps.AsyncScheduler,
+        config: SchedulerAPIConfig,
+        cache: ResponseCache | None = None,
+        versions: DataStoreVersions | None = None,
+    ) -> TasksAPIRouter:
         """Create an API router from the configuration."""
         return cls(
             apscheduler=apscheduler,
             prefix=config.prefix,
             tags=config.tags,
             include_in_schema=config.include_in_schema,
+            cache=cache,
+            versions=versions,
         )
 
-    async def list_tasks(self, response: Response, limit_offset: LimitOffsetQueryParams) -> list[aps.Task]:
-        """List tasks."""
+    async def list_tasks(
+        self,
+        request: Request,
+        response: Response,
+        limit_offset: LimitOffsetQueryParams,
+        fields: TaskFieldsQueryParam = None,
+    ) -> Response:
+        """List tasks, ordered by ID.
+
+        Follow the `X-Next-Cursor` header (or the `Link` header) to read the next page in constant time, whatever its
+        depth. The total count is only returned for the offset pages.
+
+        Only the selected fields are returned with `fields`, and the other columns are not read when the data store
+        supports it.
+
+        Responds with 304 Not Modified when the `If-None-Match` header matches the ETag of the tasks.
+        """
+        with safe_error(UnexpectedAPIError, allow=InvalidCursorAPIError):
+            if (not_modified := self._get_not_modified_response(request, response)) is not None:
+                return not_modified
+            load = partial(
+                self.queries.get_tasks if fields is None else partial(self.queries.get_sparse_tasks, fields),
+                limit=limit_offset.limit,
+                offset=limit_offset.offset,
+                cursor=limit_offset.cursor,
+            )
+            key = ("list", limit_offset.model_dump_json(), fields)
+            try:
+                page = await get_or_load(self.cache, CacheNamespace.TASKS, key, load)
+            except InvalidCursorError as error:
+                raise InvalidCursorAPIError(cast("str", limit_offset.cursor)) from error
+            set_page_headers(page, request, response)
+            return json_list_response(Task, page.items, response, fields)
+
+    async def export_tasks(self) -> StreamingResponse:
+        """Export all the tasks as NDJSON, one task per line, ordered by ID.
+
+        The tasks are streamed in chunks from the data store, and can be restored with the import.
+        A task that cannot be serialized is exported as an error line, reported as a failure by the import.
+        """
+        return StreamingResponse(self._export_tasks(), media_type=NDJSON_MEDIA_TYPE)
+
+    async def _export_tasks(self) -> AsyncIterator[bytes]:
+        """Stream the NDJSON lines of the tasks, a chunk at a time."""
+
+        def get_page(cursor: str | None) -> Awaitable[Page[aps.Task]]:
+            return self.queries.get_tasks(limit=EXPORT_CHUNK_SIZE, cursor=cursor)
+
+        async for tasks in iter_pages(get_page):
+            yield dump_lines(tasks, dump_task)
+
+    async def import_tasks(self, request: Request) -> ImportResult:
+        """Import tasks from an NDJSON body, one task per line as exported.
+
+        Only the options of the existing tasks are restored: a task must already be configured by the application
+        with the same function, so that the import cannot make the scheduler run other code. The body is streamed,
+        and a failing line does not prevent the others from being imported.
+        """
         with safe_error(UnexpectedAPIError):
-            tasks = await self.apscheduler.data_store.get_tasks()
-            return paginate(tasks, limit_offset, response)
+            imported = 0
+            failures: list[ImportFailure] = []
+            async for line_number, line in iter_lines(request.stream()):
+                try:
+                    task = load_task(line)
+                except (aps.DeserializationError, TypeError, ValueError) as error:
+                    failures.append(ImportFailure(line=line_number, error=get_error_message(error)))
+                    continue
+
+                if (error_message := await self._get_import_error(task)) is not None:
+                    failures.append(ImportFailure(line=line_number, id=task.id, error=error_message))
+                    continue
+
+                await self.apscheduler.data_store.add_task(task)
+                imported += 1
+
+            self._invalidate()
+            return ImportResult(imported=imported, failures=failures)
+
+    async def _get_import_error(self, task: aps.Task) -> str | None:
+        """Get the reason an imported task is rejected, None if it matches an existing task."""
+        if task.id == MANIFEST_TASK_ID:
+            return f"Task with ID {task.id} does not allow import."
+        try:
+            existing_task = await self.apscheduler.data_store.get_task(task.id)
+        except aps.TaskLookupError:
+            return f"Task with ID {task.id} does not exist, only the existing tasks can be imported."
+        if existing_task.func != task.func:
+            return f"Task with ID {task.id} does not allow changing its function."
+        return None
+
+    async def get_task(self, id: str, request: Request, response: Response) -> aps.Task | Response:
+        """Get a task by ID.
 
-    async def get_task(self, id: str) -> aps.Task:
-        """Get a task by ID."""
+        Responds with 304 Not Modified when the `If-None-Match` header matches the ETag of the tasks.
+        """
         with safe_error(UnexpectedAPIError, allow=NotFoundAPIError):
-            try:
-                return await self.apscheduler.data_store.get_task(id)
-            except aps.TaskLookupError as error:
-                raise NotFoundAPIError(Task, id) from error
+            if id == MANIFEST_TASK_ID:
+                raise NotFoundAPIError(Task, id)
+            if (not_modified := self._get_not_modified_response(request, response)) is not None:
+                return not_modified
+            return await get_or_load(self.cache, CacheNamespace.TASKS, ("get", id), partial(self._get_task, id))
+
+    async def _get_task(self, id: str) -> aps.Task:
+        """Get a task by ID from the data store.
+
+        Raises:
+            NotFoundAPIError: If the task does not exist.
+        """
+        try:
+            return await self.apscheduler.data_store.get_task(id)
+        except aps.TaskLookupError as error:
+            raise NotFoundAPIError(Task, id) from error
+
+    async def run_task(self, id: str, run: TaskRun | None = None) -> JobAccepted:
+        """Run a task now, without waiting for its job to finish.
+
+        Read the result of the job from the job result endpoint, which waits for the job to finish.
+        """
+        with safe_error(UnexpectedAPIError, allow=NotFoundAPIError):
+            if id == MANIFEST_TASK_ID:
+                raise NotFoundAPIError(Task, id)
+            task = await self._get_task(id)
+            run = run or TaskRun()
+            job_id = await self.apscheduler.add_job(
+                task.id, args=run.args, kwargs=run.kwargs, result_expiration_time=run.result_expiration_time
+            )
+            return JobAccepted(job_id=job_id)
+
+    def _get_not_modified_response(self, request: Request, response: Response) -> Response | None:
+        """Set the ETag of the tasks, and get a not modified response if the client already has it."""
+        if self.versions is None:
+            return None
+        return get_not_modified_response(self.versions.get_etag(CacheNamespace.TASKS), request, response)
+
+    def _invalidate(self) -> None:
+        """Invalidate the cache and versions of the tasks, not to serve them until the event is delivered."""
+        for versions in (self.cache, self.versions):
+            if versions is not None:
+                versions.invalidate(CacheNamespace.TASKS)
@@ -4,16 +4,20 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, ParamSpec, TypeVar
 
+from apscheduler import CoalescePolicy
+from apscheduler._utils import unset
 from apscheduler.triggers.calendarinterval import CalendarIntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
-from fastapi_apscheduler4.errors import ScheduleAlreadyExistsError
+from fastapi_apscheduler4.registry import ScheduleRegistry
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from datetime import timedelta
 
-    from fastapi_apscheduler4.dtos import ScheduleType
+    from apscheduler._utils import UnsetValue
+    from apscheduler.abc import Trigger
 
 P = ParamSpec("P")
 RT = TypeVar("RT")
@@ -31,13 +35,17 @@ class Scheduler:
         Args:
             app: FastAPI application.
         """
-        self._schedules: list[ScheduleType] = []
+        self._schedules = ScheduleRegistry()
 
     def include(self, scheduler: Scheduler) -> None:
-        """Include the scheduler."""
-        self._schedules.extend(scheduler.schedules)
+        """Include the scheduler.
 
-    def interval(
+        Raises:
+            ScheduleAlreadyExistsError: If a schedule ID of the included scheduler is already registered.
+        """
+        self._schedules.include(scheduler.schedules)
+
+    def interval(  # noqa: PLR0913
         self,
         weeks: float = 0,
         days: float = 0,
@@ -45,9 +53,19 @@ class Scheduler:
         minutes: float = 0,
         seconds: float = 0,
         microseconds: float = 0,
+        *,
+        id: str | None = None,
+        job_executor: str | UnsetValue = unset,
+        max_running_jobs: int | UnsetValue | None = unset,
+        misfire_grace_time: float | timedelta | UnsetValue | None = unset,
+        coalesce: CoalescePolicy = CoalescePolicy.latest,
+        max_jitter: float | timedelta | None = None,
+        spread: float | None = None,
     ) -> Callable[[Callable[P, RT]], Callable[P, RT]]:
         """Decorator to schedule a task for a given interval.
 
+        The keyword-only options are the same as `add_schedule`.
+
         See: https://apscheduler.readthedocs.io/en/master/api.html#apscheduler.triggers.interval.IntervalTrigger
         """
 
@@ -62,6 +80,13 @@ class Scheduler:
                     seconds=seconds,
                     microseconds=microseconds,
                 ),
+                id=id,
+                job_executor=job_executor,
+                max_running_jobs=max_running_jobs,
+                misfire_grace_time=misfire_grace_time,
+                coalesce=coalesce,
+                max_jitter=max_jitter,
+                spread=spread,
             )
             return func
 
@@ -77,9 +102,19 @@ class Scheduler:
         hour: int | str | None = None,
         minute: int | str | None = None,
         second: int | str | None = None,
+        *,
+        id: str | None = None,
+        job_executor: str | UnsetValue = unset,
+        max_running_jobs: int | UnsetValue | None = unset,
+        misfire_grace_time: float | timedelta | UnsetValue | None = unset,
+        coalesce: CoalescePolicy = CoalescePolicy.latest,
+        max_jitter: float | timedelta | None = None,
+        spread: float | None = None,
     ) -> Callable[[Callable[P, RT]], Callable[P, RT]]:
         """Decorator to schedule a task when current time matches all specified time constraints.
 
+        The keyword-only options are the same as `add_schedule`.
+
         See: https://apscheduler.readthedocs.io/en/master/api.html#apscheduler.triggers.cron.CronTrigger
         """
 
@@ -96,13 +131,20 @@ class Scheduler:
                     minute=minute,
                     second=second,
                 ),
+                id=id,
+                job_executor=job_executor,
+                max_running_jobs=max_running_jobs,
+                misfire_grace_time=misfire_grace_time,
+                coalesce=coalesce,
+                max_jitter=max_jitter,
+                spread=spread,
             )
 
             return func
 
         return decorator
 
-    def calendar_interval(
+    def calendar_interval(  # noqa: PLR0913
         self,
         years: int = 0,
         months: int = 0,
@@ -111,9 +153,19 @@ class Scheduler:
         hour: int = 0,
         minute: int = 0,
         second: int = 0,
+        *,
+        id: str | None = None,
+        job_executor: str | UnsetValue = unset,
+        max_running_jobs: int | UnsetValue | None = unset,
+        misfire_grace_time: float | timedelta | UnsetValue | None = unset,
+        coalesce: CoalescePolicy = CoalescePolicy.latest,
+        max_jitter: float | timedelta | None = None,
+        spread: float | None = None,
     ) -> Callable[[Callable[P, RT]], Callable[P, RT]]:
         """Decorator to schedule a task on calendar-based intervals, at a specific time of day.
 
+        The keyword-only options are the same as `add_schedule`.
+
         See: https://apscheduler.readthedocs.io/en/master/api.html#apscheduler.triggers.calendarinterval.CalendarIntervalTrigger
         """
 
@@ -129,24 +181,63 @@ class Scheduler:
                     minute=minute,
                     second=second,
                 ),
+                id=id,
+                job_executor=job_executor,
+                max_running_jobs=max_running_jobs,
+                misfire_grace_time=misfire_grace_time,
+                coalesce=coalesce,
+                max_jitter=max_jitter,
+                spread=spread,
             )
             return func
 
         return decorator
 
     @property
-    def schedules(self) -> list[ScheduleType]:
+    def schedules(self) -> ScheduleRegistry:
         """Get the schedules."""
         return self._schedules
 
-    def add_schedule(
+    def add_schedule(  # noqa: PLR0913
         self,
         func: Callable[P, RT],
-        trigger: IntervalTrigger | CronTrigger | CalendarIntervalTrigger,
+        trigger: Trigger,
+        *,
+        id: str | None = None,
+        job_executor: str | UnsetValue = unset,
+        max_running_jobs: int | UnsetValue | None = unset,
+        misfire_grace_time: float | timedelta | UnsetValue | None = unset,
+        coalesce: CoalescePolicy = CoalescePolicy.latest,
+        max_jitter: float | timedelta | None = None,
+        spread: float | None = None,
     ) -> None:
-        """Add a schedule."""
-        # Cast func to NamedCallable since all Python functions have __name__
-        already_exists = any(func == schedule[0] for schedule in self._schedules)
-        if already_exists:
-            raise ScheduleAlreadyExistsError(func)
-        self._schedules.append((func, trigger))
+        """Add a schedule.
+
+        A function can have several schedules as long as each one has an explicit ID.
+
+        Args:
+            func: Function to schedule.
+            trigger: Trigger of the schedule.
+            id: Explicit schedule ID. Defaults to the function reference.
+            job_executor: Name of the executor running the jobs, such as `processpool` for CPU-bound functions.
+            max_running_jobs: Maximum number of concurrent jobs of the function, shared by all its schedules.
+            misfire_grace_time: Maximum number of seconds a job is allowed to start late.
+            coalesce: What to do when several fire times are due at once.
+            max_jitter: Maximum number of seconds randomly added to the fire times.
+            spread: Window in seconds to offset the fire times by a hash of the schedule ID, so that the schedules
+                sharing the same fire times are staggered. Defaults to the scheduler config, 0 disables it.
+
+        Raises:
+            ScheduleAlreadyExistsError: If a schedule with the same ID is already registered.
+        """
+        self._schedules.add(
+            func,
+            trigger,
+            id=id,
+            job_executor=job_executor,
+            max_running_jobs=max_running_jobs,
+            misfire_grace_time=misfire_grace_time,
+            coalesce=coalesce,
+            max_jitter=max_jitter,
+            spread=spread,
+        )
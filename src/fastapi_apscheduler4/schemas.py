@@ -5,14 +5,21 @@ The data structures are almost the same as the APSchedulers translated to pydant
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Annotated, Any, Literal
-
-from pydantic import BaseModel, BeforeValidator, Discriminator, Tag
+from typing import Annotated, Any, ClassVar, Literal
+from uuid import UUID
+
+from apscheduler.abc import Trigger as APSchedulerTrigger
+from apscheduler.triggers.calendarinterval import CalendarIntervalTrigger as APSCalendarIntervalTrigger
+from apscheduler.triggers.cron import CronTrigger as APSCronTrigger
+from apscheduler.triggers.interval import IntervalTrigger as APSIntervalTrigger
+from pydantic import BaseModel, BeforeValidator, Discriminator, Field, Tag, field_validator
 from pydantic_extra_types.timezone_name import TimeZoneName as _TimeZoneName
 
-from fastapi_apscheduler4.utils import enforce_enum_name, transform_tzinfo_to_str
+from fastapi_apscheduler4.constants import JOB_RUN_DEFAULT_RESULT_EXPIRATION
+from fastapi_apscheduler4.utils import enforce_enum_name, transform_exception_to_str, transform_tzinfo_to_str
 
 TimeZoneName = Annotated[_TimeZoneName, BeforeValidator(transform_tzinfo_to_str)]
 """Timezone in string format."""
@@ -26,6 +33,46 @@ class CoalescePolicy(str, Enum):
     ALL = "all"
 
 
+class ConflictPolicy(str, Enum):
+    """Conflict Policy.
+
+    What to do when a schedule with the same ID already exists.
+    """
+
+    REPLACE = "replace"
+    DO_NOTHING = "do_nothing"
+    EXCEPTION = "exception"
+
+
+class JobOutcome(str, Enum):
+    """Job Outcome."""
+
+    SUCCESS = "success"
+    ERROR = "error"
+    MISSED_START_DEADLINE = "missed_start_deadline"
+    DESERIALIZATION_FAILED = "deserialization_failed"
+    CANCELLED = "cancelled"
+    ABANDONED = "abandoned"
+
+
+class BulkOutcome(str, Enum):
+    """Outcome of a bulk operation on a single schedule."""
+
+    DONE = "done"
+    NOT_FOUND = "not_found"
+    NOT_ALLOWED = "not_allowed"
+
+
+class SchedulerPhase(str, Enum):
+    """Scheduler Phase."""
+
+    STOPPED = "stopped"
+    INITIALIZING = "initializing"
+    RECONCILING = "reconciling"
+    READY = "ready"
+    FAILED = "failed"
+
+
 class TriggerType(str, Enum):
     """Trigger Type."""
 
@@ -35,20 +82,113 @@ class TriggerType(str, Enum):
     UNKNOWN = "UnknownTrigger"
 
 
+class ScheduleSort(str, Enum):
+    """Schedule Sort.
+
+    Prefixed with `-` for the descending order. The exhausted schedules, without next fire time, always come last.
+    """
+
+    NEXT_FIRE_TIME = "next_fire_time"
+    NEXT_FIRE_TIME_DESC = "-next_fire_time"
+    ID = "id"
+    ID_DESC = "-id"
+
+    @property
+    def descending(self) -> bool:
+        """Check if the order is descending."""
+        return self.value.startswith("-")
+
+
+class ScheduleField(str, Enum):
+    """Schedule Field.
+
+    Field of the schedule schema, to return only some of them.
+    """
+
+    ID = "id"
+    TASK_ID = "task_id"
+    TRIGGER = "trigger"
+    ARGS = "args"
+    KWARGS = "kwargs"
+    COALESCE = "coalesce"
+    MISFIRE_GRACE_TIME = "misfire_grace_time"
+    MAX_JITTER = "max_jitter"
+    PAUSED = "paused"
+    NEXT_FIRE_TIME = "next_fire_time"
+    LAST_FIRE_TIME = "last_fire_time"
+    ACQUIRED_BY = "acquired_by"
+    ACQUIRED_UNTIL = "acquired_until"
+
+
+class TaskField(str, Enum):
+    """Task Field.
+
+    Field of the task schema, to return only some of them.
+    """
+
+    ID = "id"
+    FUNC = "func"
+    JOB_EXECUTOR = "job_executor"
+    MAX_RUNNING_JOBS = "max_running_jobs"
+    MISFIRE_GRACE_TIME = "misfire_grace_time"
+
+
+class EventType(str, Enum):
+    """Event Type.
+
+    Name of the APScheduler event class.
+    """
+
+    TASK_ADDED = "TaskAdded"
+    TASK_UPDATED = "TaskUpdated"
+    TASK_REMOVED = "TaskRemoved"
+    SCHEDULE_ADDED = "ScheduleAdded"
+    SCHEDULE_UPDATED = "ScheduleUpdated"
+    SCHEDULE_REMOVED = "ScheduleRemoved"
+    JOB_ADDED = "JobAdded"
+    JOB_REMOVED = "JobRemoved"
+    JOB_ACQUIRED = "JobAcquired"
+    JOB_RELEASED = "JobReleased"
+    SCHEDULER_STARTED = "SchedulerStarted"
+    SCHEDULER_STOPPED = "SchedulerStopped"
+
+
+_KNOWN_TRIGGER_TYPES = {
+    trigger_type.value: trigger_type.value
+    for trigger_type in (TriggerType.INTERVAL, TriggerType.CRON, TriggerType.CALENDAR_INTERVAL)
+}
+"""Tag of each known trigger type, looked up by name or enum member without going through the enum per trigger."""
+_UNKNOWN_TRIGGER_TYPE = TriggerType.UNKNOWN.value
+
+
 def model_trigger_discriminator(v: Any) -> str:  # noqa: ANN401
     """Model Trigger Discriminator."""
     type_ = v.get("type", None) if isinstance(v, dict) else v.__class__.__name__
-
-    if type_ in (TriggerType.INTERVAL.value, TriggerType.CRON.value, TriggerType.CALENDAR_INTERVAL.value):
-        return TriggerType(type_).value
-
-    return TriggerType.UNKNOWN.value
+    if not isinstance(type_, str):
+        return _UNKNOWN_TRIGGER_TYPE
+    return _KNOWN_TRIGGER_TYPES.get(type_, _UNKNOWN_TRIGGER_TYPE)
 
 
 class BaseTrigger(BaseModel):
     """Base Trigger."""
 
     type: TriggerType
+    apscheduler_class: ClassVar[Callable[..., APSchedulerTrigger] | None] = None
+    """APScheduler trigger class built from the fields, none when the trigger cannot be converted."""
+
+    def to_apscheduler(self) -> APSchedulerTrigger:
+        """Convert into an APScheduler trigger, the unset fields falling back to the APScheduler defaults.
+
+        Raises:
+            ValueError: If the trigger is invalid or has no APScheduler trigger class.
+        """
+        if self.apscheduler_class is None:
+            msg = f"{self.type.value} cannot be converted into an APScheduler trigger"
+            raise ValueError(msg)
+        try:
+            return self.apscheduler_class(**self.model_dump(exclude={"type"}, exclude_none=True))
+        except (TypeError, ValueError) as error:
+            raise ValueError(str(error)) from error
 
 
 class UnknownTrigger(BaseTrigger):
@@ -61,9 +201,10 @@ class UnknownTrigger(BaseTrigger):
 
 
 class CalendarIntervalTrigger(BaseTrigger):
-    """Calendar Interval Trigger."""
+    """Calendar Interval Trigger, starting today in the local timezone by default."""
 
     type: Literal[TriggerType.CALENDAR_INTERVAL] = TriggerType.CALENDAR_INTERVAL
+    apscheduler_class: ClassVar[Callable[..., APSchedulerTrigger] | None] = APSCalendarIntervalTrigger
     years: int = 0
     months: int = 0
     weeks: int = 0
@@ -71,28 +212,31 @@ class CalendarIntervalTrigger(BaseTrigger):
     hour: int = 0
     minute: int = 0
     second: int = 0
-    start_date: date
+    start_date: date | None = None
     end_date: date | None = None
-    timezone: TimeZoneName
+    timezone: TimeZoneName | None = None
 
 
 class IntervalTrigger(BaseTrigger):
-    """Interval Trigger."""
+    """Interval Trigger, starting now by default."""
 
     type: Literal[TriggerType.INTERVAL] = TriggerType.INTERVAL
+    apscheduler_class: ClassVar[Callable[..., APSchedulerTrigger] | None] = APSIntervalTrigger
     weeks: float = 0
     days: float = 0
     hours: float = 0
     minutes: float = 0
     seconds: float = 0
     microseconds: float = 0
-    start_time: datetime
+    start_time: datetime | None = None
+    end_time: datetime | None = None
 
 
 class CronTrigger(BaseTrigger):
-    """Cron Trigger."""
+    """Cron Trigger, starting now in the local timezone by default."""
 
     type: Literal[TriggerType.CRON] = TriggerType.CRON
+    apscheduler_class: ClassVar[Callable[..., APSchedulerTrigger] | None] = APSCronTrigger
     year: int | str | None = None
     month: int | str | None = None
     day: int | str | None = None
@@ -101,9 +245,9 @@ class CronTrigger(BaseTrigger):
     hour: int | str | None = None
     minute: int | str | None = None
     second: int | str | None = None
-    start_time: datetime
+    start_time: datetime | None = None
     end_time: datetime | None = None
-    timezone: TimeZoneName
+    timezone: TimeZoneName | None = None
 
 
 class Schedule(BaseModel):
@@ -124,12 +268,45 @@ class Schedule(BaseModel):
     coalesce: Annotated[CoalescePolicy, BeforeValidator(enforce_enum_name)]
     misfire_grace_time: timedelta | None = None
     max_jitter: timedelta | None = None
+    paused: bool = False
     next_fire_time: datetime | None = None
     last_fire_time: datetime | None = None
     acquired_by: str | None = None
     acquired_until: datetime | None = None
 
 
+TriggerInput = Annotated[IntervalTrigger | CronTrigger | CalendarIntervalTrigger, Field(discriminator="type")]
+"""Trigger of a schedule written from the API."""
+
+
+class ScheduleUpdate(BaseModel):
+    """Schedule to write from the API, running an existing task."""
+
+    task_id: str = Field(description="ID of an existing task.")
+    trigger: TriggerInput
+    args: list[Any] = Field(default_factory=list)
+    kwargs: dict[str, Any] = Field(default_factory=dict)
+    coalesce: CoalescePolicy = CoalescePolicy.LATEST
+    misfire_grace_time: timedelta | None = Field(
+        default=None, description="Maximum lateness of the jobs, defaults to the task one when not given."
+    )
+    max_jitter: timedelta | None = None
+    paused: bool = False
+
+    @field_validator("trigger")
+    @classmethod
+    def validate_trigger(cls, trigger: BaseTrigger) -> BaseTrigger:
+        """Validate that the trigger converts into an APScheduler trigger."""
+        trigger.to_apscheduler()
+        return trigger
+
+
+class ScheduleCreate(ScheduleUpdate):
+    """Schedule to add from the API. A random ID is assigned if none is given."""
+
+    id: str | None = None
+
+
 class Task(BaseModel):
     """Task."""
 
@@ -138,3 +315,123 @@ class Task(BaseModel):
     job_executor: str
     max_running_jobs: int | None = None
     misfire_grace_time: timedelta | None = None
+
+
+class Job(BaseModel):
+    """Job.
+
+    Queued until acquired by a scheduler, then running until released.
+    """
+
+    id: UUID
+    task_id: str
+    args: list[Any] | None = None
+    kwargs: dict[str, Any] | None = None
+    schedule_id: str | None = None
+    scheduled_fire_time: datetime | None = None
+    executor: str
+    jitter: timedelta
+    start_deadline: datetime | None = None
+    result_expiration_time: timedelta
+    created_at: datetime
+    acquired_by: str | None = None
+    acquired_until: datetime | None = None
+
+
+class JobResult(BaseModel):
+    """Job Result."""
+
+    job_id: UUID
+    outcome: Annotated[JobOutcome, BeforeValidator(enforce_enum_name)]
+    started_at: datetime | None = None
+    finished_at: datetime
+    expires_at: datetime
+    exception: Annotated[str | None, BeforeValidator(transform_exception_to_str)] = None
+    return_value: Any = None
+
+
+class ScheduleRun(BaseModel):
+    """Run of a schedule now, with its arguments."""
+
+    result_expiration_time: timedelta = Field(
+        default=timedelta(seconds=JOB_RUN_DEFAULT_RESULT_EXPIRATION),
+        description="Minimum time to keep the result of the job, not recorded if zero.",
+    )
+
+
+class TaskRun(ScheduleRun):
+    """Run of a task now."""
+
+    args: list[Any] = Field(default_factory=list)
+    kwargs: dict[str, Any] = Field(default_factory=dict)
+
+
+class JobAccepted(BaseModel):
+    """Job accepted to run, whose result is read from the job result endpoint."""
+
+    job_id: UUID
+
+
+class Readiness(BaseModel):
+    """Readiness."""
+
+    ready: bool
+    phase: SchedulerPhase
+
+
+class FireTimeBucket(BaseModel):
+    """Number of schedules firing in the same second."""
+
+    time: datetime
+    count: int
+
+
+class FireTimeHistogram(BaseModel):
+    """Fire times of the schedules per second, within a time range."""
+
+    start: datetime
+    end: datetime
+    peak: int
+    buckets: list[FireTimeBucket]
+
+
+class CacheStats(BaseModel):
+    """Response cache statistics."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class ImportFailure(BaseModel):
+    """Line that failed to be imported."""
+
+    line: int
+    id: str | None = None
+    error: str
+
+
+class ImportResult(BaseModel):
+    """Result of an import.
+
+    The skipped lines hold objects that already exist and are left unchanged by the conflict policy.
+    """
+
+    imported: int
+    skipped: int = 0
+    failures: list[ImportFailure]
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of a bulk operation on a single schedule."""
+
+    id: str
+    outcome: BulkOutcome
+
+
+class BulkResult(BaseModel):
+    """Result of a bulk operation, with the outcome of each selected schedule."""
+
+    done: int
+    results: list[BulkItemResult]
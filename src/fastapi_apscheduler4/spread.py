@@ -0,0 +1,129 @@
+"""Schedule Spread.
+
+Staggers the schedules sharing the same fire times with a deterministic offset, derived from the schedule ID, so that
+they do not all fire in the same second.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import Counter
+from copy import deepcopy
+from datetime import datetime, timedelta
+from heapq import heapify, heappop, heapreplace
+from typing import TYPE_CHECKING
+
+import attrs
+from apscheduler.triggers.calendarinterval import CalendarIntervalTrigger
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.cron.fields import DEFAULT_VALUES
+from apscheduler.triggers.interval import IntervalTrigger
+
+from fastapi_apscheduler4.constants import HISTOGRAM_MAX_FIRE_TIMES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from apscheduler import Schedule
+    from apscheduler.abc import Trigger
+
+CRON_MAX_SPREAD = 60
+"""Cron triggers are spread with their second field, so at most within a minute."""
+DAY_SECONDS = 86400
+
+
+def get_spread_offset(schedule_id: str, window: float) -> float:
+    """Get the deterministic offset of a schedule, in seconds within `[0, window)`."""
+    digest = hashlib.sha256(schedule_id.encode()).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64 * window
+
+
+def spread_trigger(trigger: Trigger, schedule_id: str, window: float) -> Trigger | None:
+    """Spread a trigger by the offset of its schedule.
+
+    - Interval: the start time is shifted, within the interval.
+    - Cron: the second field is set, only when it is not explicitly given. The unset fields less significant than the
+      explicit ones are pinned to their default, as they would become wildcards once the second field is set.
+    - Calendar interval: the time of day is shifted.
+
+    Returns:
+        The spread trigger, the trigger itself if it must not be spread, or None if the trigger type is unsupported.
+    """
+    if isinstance(trigger, IntervalTrigger):
+        interval = timedelta(
+            weeks=trigger.weeks,
+            days=trigger.days,
+            hours=trigger.hours,
+            minutes=trigger.minutes,
+            seconds=trigger.seconds,
+            microseconds=trigger.microseconds,
+        )
+        offset = get_spread_offset(schedule_id, min(window, interval.total_seconds()))
+        return attrs.evolve(trigger, start_time=trigger.start_time + timedelta(seconds=offset))
+
+    if isinstance(trigger, CronTrigger):
+        if trigger.second is not None:
+            return trigger
+        second = int(get_spread_offset(schedule_id, min(window, CRON_MAX_SPREAD)))
+        return attrs.evolve(trigger, **get_cron_pinned_fields(trigger), second=second)
+
+    if isinstance(trigger, CalendarIntervalTrigger):
+        offset = int(get_spread_offset(schedule_id, min(window, DAY_SECONDS)))
+        time_of_day = (trigger.hour * 3600 + trigger.minute * 60 + trigger.second + offset) % DAY_SECONDS
+        return attrs.evolve(
+            trigger,
+            hour=time_of_day // 3600,
+            minute=time_of_day % 3600 // 60,
+            second=time_of_day % 60,
+        )
+
+    return None
+
+
+def get_cron_pinned_fields(trigger: CronTrigger) -> dict[str, int | str]:
+    """Get the unset fields of a cron trigger less significant than its explicit ones, with their default value.
+
+    APScheduler defaults the unset fields to a wildcard when a less significant field is set, and to their minimum
+    otherwise, so these fields must be set explicitly to keep the fire times when setting the second field.
+    """
+    names = [name for name, _ in CronTrigger.FIELDS_MAP]
+    explicit_indexes = [index for index, name in enumerate(names) if getattr(trigger, name) is not None]
+    start = explicit_indexes[-1] + 1 if explicit_indexes else 0
+    return {name: DEFAULT_VALUES[name] for name in names[start:] if name != "second"}
+
+
+def get_fire_time_histogram(
+    schedules: Iterable[Schedule], end: datetime, *, max_fire_times: int = HISTOGRAM_MAX_FIRE_TIMES
+) -> tuple[Counter[datetime], datetime]:
+    """Count the fire times of the schedules per second, until the end time.
+
+    The paused schedules are skipped. The fire times of all the schedules are computed in chronological order, and at
+    most `max_fire_times` of them, beyond which the end time is moved back to the last complete second.
+
+    Returns:
+        Number of fire times per second, and the end time they are counted until.
+    """
+    heap: list[tuple[datetime, int, Trigger]] = [
+        (schedule.next_fire_time, index, deepcopy(schedule.trigger))
+        for index, schedule in enumerate(schedules)
+        if not schedule.paused and schedule.next_fire_time is not None and schedule.next_fire_time <= end
+    ]
+    heapify(heap)
+    histogram: Counter[datetime] = Counter()
+    for _ in range(max_fire_times):
+        if not heap:
+            return histogram, end
+        fire_time, index, trigger = heap[0]
+        histogram[fire_time.replace(microsecond=0)] += 1
+        next_fire_time = trigger.next()
+        if next_fire_time is None or next_fire_time > end:
+            heappop(heap)
+        else:
+            heapreplace(heap, (next_fire_time, index, trigger))
+
+    if not heap:
+        return histogram, end
+    # The second of the first uncounted fire time may be partly counted
+    second = heap[0][0].replace(microsecond=0)
+    histogram.pop(second, None)
+    return histogram, second - timedelta(microseconds=1)
@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import inspect
 from collections.abc import Iterable as ABCIterable
 from contextlib import contextmanager
-from datetime import tzinfo
+from datetime import date, datetime, timedelta, tzinfo
 from enum import Enum
-from typing import TYPE_CHECKING, ParamSpec, TypeVar, overload
+from functools import partial
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, overload
+from zoneinfo import ZoneInfo
 
-from fastapi import Response, status
+from apscheduler.abc import Trigger
+from fastapi import Request, Response, status
+
+from fastapi_apscheduler4.constants import TRIGGER_DEFAULT_START_TOLERANCE
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Callable, Generator, Iterable
 
-    from fastapi_apscheduler4.dtos import LimitOffset
+    from fastapi_apscheduler4.dtos import Page
     from fastapi_apscheduler4.errors import UnexpectedErrorProtocol
 
 T = TypeVar("T")
@@ -22,6 +28,11 @@ T = TypeVar("T")
 RT = TypeVar("RT")
 P = ParamSpec("P")
 
+TRIGGER_RUNTIME_STATE = frozenset({"last_fire_time", "last_fire_date", "next_fire_times"})
+"""Trigger state keys that change at runtime."""
+TRIGGER_START_STATE = frozenset({"start_time", "start_date"})
+"""Trigger state keys defaulting to the instantiation time."""
+
 
 @contextmanager
 def safe_error(
@@ -61,6 +72,17 @@ def enforce_enum_name(value: Enum | T) -> str | T:
     return value
 
 
+@overload
+def transform_exception_to_str(value: BaseException) -> str: ...
+@overload
+def transform_exception_to_str(value: T) -> str | T: ...
+def transform_exception_to_str(value: BaseException | T) -> str | T:
+    """Transform exception to its type name and message if exception else return value."""
+    if isinstance(value, BaseException):
+        return f"{type(value).__name__}: {value}"
+    return value
+
+
 @overload
 def transform_comma_separated_string_to_list(value: str) -> list[str]: ...
 @overload
@@ -72,30 +94,141 @@ def transform_comma_separated_string_to_list(value: str | T) -> list[str] | T:
     return value
 
 
+@overload
+def transform_comma_separated_strings_to_list(value: list[str]) -> list[str]: ...
+@overload
+def transform_comma_separated_strings_to_list(value: T) -> list[str] | T: ...
+def transform_comma_separated_strings_to_list(value: list[str] | T) -> list[str] | T:
+    """Transform repeated and comma separated strings to a flat list."""
+    if isinstance(value, list):
+        return [v.strip() for item in value for v in str(item).split(",")]
+    return value
+
+
 @overload
 def transform_tzinfo_to_str(value: tzinfo) -> str: ...
 @overload
 def transform_tzinfo_to_str(value: T) -> str | T: ...
 def transform_tzinfo_to_str(value: tzinfo | T) -> str | T:
-    """Transform tzinfo to string."""
+    """Transform tzinfo to string.
+
+    The zones are transformed to their key, such as `Europe/Zurich`, since their name depends on the date.
+    """
+    if isinstance(value, ZoneInfo):
+        return value.key or str(value)
     if isinstance(value, tzinfo):
-        return value.tzname(None) or "UTC"
+        return value.tzname(None) or str(value)
     return value
 
 
-def paginate(items: list[T], limit_offset: LimitOffset, response: Response) -> list[T]:
-    """Paginate items."""
-    total_count = len(items)
-    paginated = items[limit_offset.offset : limit_offset.offset + limit_offset.limit]
+def set_page_headers(page: Page[Any], request: Request, response: Response) -> None:
+    """Set the pagination headers of a page.
 
-    response.headers["X-Total-Count"] = str(total_count)
-    if total_count != len(paginated):
+    - `X-Total-Count`: Total number of items, only for the offset pages.
+    - `X-Next-Cursor` and `Link`: Cursor and URL of the next page, if any.
+
+    The status is partial content if the page does not hold all the items.
+    """
+    if page.total_count is not None:
+        response.headers["X-Total-Count"] = str(page.total_count)
+    if page.next_cursor is not None:
+        next_url = request.url.remove_query_params("offset").include_query_params(cursor=page.next_cursor)
+        response.headers["X-Next-Cursor"] = page.next_cursor
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+
+    if page.next_cursor is not None or (page.total_count is not None and page.total_count != len(page.items)):
         response.status_code = status.HTTP_206_PARTIAL_CONTENT
 
-    return paginated
+
+def get_not_modified_response(etag: str, request: Request, response: Response) -> Response | None:
+    """Set the ETag of a response, and get a not modified response if the client already has it.
+
+    The ETags are compared with the weak comparison of `If-None-Match`.
+    """
+    response.headers["ETag"] = etag
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is None:
+        return None
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
+def get_error_message(error: BaseException) -> str:
+    """Get the message of an error, from its cause when it is a wrapper without message."""
+    message = str(error)
+    if not message and error.__cause__ is not None:
+        return get_error_message(error.__cause__)
+    return message or type(error).__name__
 
 
 def dict_add_if_not_none(data: dict[str, T], key: str, value: T | None) -> None:
     """Add key-value pair to dictionary if value is not None."""
     if value is not None:
         data[key] = value
+
+
+def get_trigger_params(trigger: Trigger, *, keep_start: bool = False) -> dict[str, Any]:
+    """Get the trigger type and parameters without its runtime state.
+
+    Two triggers with the same parameters will fire at the same times once started, even if they were not
+    created at the same time. Nested triggers (e.g. `OrTrigger`) are handled recursively.
+
+    Args:
+        trigger: Trigger to get the parameters of.
+        keep_start: Whether to keep the start times, which default to the instantiation time and are only comparable
+            when explicitly given.
+    """
+    stripped = TRIGGER_RUNTIME_STATE if keep_start else TRIGGER_RUNTIME_STATE | TRIGGER_START_STATE
+    return {"type": type(trigger).__name__, **_strip_trigger_state(trigger.__getstate__(), stripped)}
+
+
+def _strip_trigger_state(value: Any, stripped: frozenset[str]) -> Any:  # noqa: ANN401
+    """Strip the given keys of a trigger state value."""
+    if isinstance(value, Trigger):
+        return _strip_trigger_state(value.__getstate__(), stripped) | {"type": type(value).__name__}
+    if isinstance(value, dict):
+        return {key: _strip_trigger_state(item, stripped) for key, item in value.items() if key not in stripped}
+    if isinstance(value, (list, tuple)):
+        return [_strip_trigger_state(item, stripped) for item in value]
+    return value
+
+
+def has_explicit_start(trigger: Trigger, registered_at: datetime) -> bool:
+    """Check if a trigger, or one of its nested triggers, was given an explicit start time.
+
+    The start times default to the instantiation time of the trigger, so the ones within a second before the
+    registration are taken as the default, as are the start dates of the registration day.
+    """
+    return _has_explicit_start(trigger.__getstate__(), registered_at)
+
+
+def _has_explicit_start(value: Any, registered_at: datetime) -> bool:  # noqa: ANN401
+    """Check if a trigger state value holds an explicit start time."""
+    if isinstance(value, Trigger):
+        return _has_explicit_start(value.__getstate__(), registered_at)
+    if isinstance(value, dict):
+        return any(
+            _is_explicit_start(key, item, registered_at) or _has_explicit_start(item, registered_at)
+            for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return any(_has_explicit_start(item, registered_at) for item in value)
+    return False
+
+
+def _is_explicit_start(key: str, value: Any, registered_at: datetime) -> bool:  # noqa: ANN401
+    """Check if a trigger state item is a start time other than its default."""
+    if key == "start_time" and isinstance(value, datetime):
+        return not registered_at - timedelta(seconds=TRIGGER_DEFAULT_START_TOLERANCE) <= value <= registered_at
+    if key == "start_date" and isinstance(value, date):
+        return value != registered_at.astimezone().date()
+    return False
+
+
+def is_async_callable(func: Callable[..., Any]) -> bool:
+    """Check if a callable is a coroutine function, including partials and objects with an async `__call__`."""
+    while isinstance(func, partial):
+        func = func.func
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(type(func).__call__)
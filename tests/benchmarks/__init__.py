@@ -0,0 +1 @@
+"""Benchmarks - compare the performance of alternative implementations."""
@@ -0,0 +1,98 @@
+"""Benchmark the bulk schedule registration."""
+# ruff: noqa: T201
+
+import time
+
+import pytest
+from anyio import sleep
+from apscheduler import AsyncScheduler, ConflictPolicy, Schedule
+from apscheduler.datastores.memory import MemoryDataStore
+from apscheduler.triggers.interval import IntervalTrigger
+
+from fastapi_apscheduler4.app import SchedulerApp
+from fastapi_apscheduler4.dtos import ScheduleEntry
+
+SCHEDULE_COUNT = 10_000
+REMOTE_SCHEDULE_COUNT = 1_000
+REMOTE_WRITE_LATENCY = 0.001
+
+
+class RemoteDataStore(MemoryDataStore):
+    """Memory store waiting a network round trip on each schedule write, like a database store."""
+
+    async def add_schedule(self, schedule: Schedule, conflict_policy: ConflictPolicy) -> None:
+        """Add the schedule after the round trip."""
+        await sleep(REMOTE_WRITE_LATENCY)
+        await super().add_schedule(schedule, conflict_policy)
+
+
+def customer_task(customer_id: int) -> None:
+    """Per-customer task."""
+    print(customer_id)
+
+
+def build_entries(count: int) -> list[ScheduleEntry]:
+    """Build one schedule entry per customer."""
+    return [
+        ScheduleEntry(
+            func=customer_task,
+            trigger=IntervalTrigger(minutes=5),
+            id=f"customer-{customer_id}",
+            kwargs={"customer_id": customer_id},
+        )
+        for customer_id in range(count)
+    ]
+
+
+async def compare_add_schedules(loop_app: SchedulerApp, bulk_app: SchedulerApp, count: int) -> None:
+    """Compare the bulk registration against awaiting `add_schedule` in a loop, and check both add every schedule."""
+    loop_entries = build_entries(count)
+    bulk_entries = build_entries(count)
+
+    async with loop_app.apscheduler:
+        start = time.perf_counter()
+        for entry in loop_entries:
+            await loop_app.apscheduler.add_schedule(entry.func, entry.trigger, id=entry.id, kwargs=entry.kwargs)
+        loop_duration = time.perf_counter() - start
+        loop_schedules = await loop_app.apscheduler.get_schedules()
+
+    async with bulk_app.apscheduler:
+        start = time.perf_counter()
+        results = await bulk_app.add_schedules(bulk_entries)
+        bulk_duration = time.perf_counter() - start
+        bulk_schedules = await bulk_app.apscheduler.get_schedules()
+
+    print(f"add_schedule loop: {loop_duration:.3f}s, add_schedules bulk: {bulk_duration:.3f}s")
+
+    assert all(result.success for result in results)
+    assert len(loop_schedules) == len(bulk_schedules) == count
+
+
+@pytest.mark.benchmark
+@pytest.mark.anyio
+async def test_add_schedules_benchmark() -> None:
+    """Compare the bulk registration against an `add_schedule` loop on the memory store.
+
+    The memory store writes without waiting, so the concurrent writes gain nothing there and both take about as long.
+    """
+    # Arrange
+    loop_app = SchedulerApp(_apscheduler=AsyncScheduler())
+    bulk_app = SchedulerApp(_apscheduler=AsyncScheduler())
+
+    # Act & Assert
+    await compare_add_schedules(loop_app, bulk_app, SCHEDULE_COUNT)
+
+
+@pytest.mark.benchmark
+@pytest.mark.anyio
+async def test_add_schedules_remote_benchmark() -> None:
+    """Compare the bulk registration against an `add_schedule` loop on a store with a write round trip.
+
+    The loop waits for each round trip in turn, while the bulk registration overlaps them up to its concurrency.
+    """
+    # Arrange
+    loop_app = SchedulerApp(_apscheduler=AsyncScheduler(RemoteDataStore()))
+    bulk_app = SchedulerApp(_apscheduler=AsyncScheduler(RemoteDataStore()))
+
+    # Act & Assert
+    await compare_add_schedules(loop_app, bulk_app, REMOTE_SCHEDULE_COUNT)
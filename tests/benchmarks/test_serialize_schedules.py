@@ -0,0 +1,81 @@
+"""Benchmark the serialization of the schedule pages."""
+# ruff: noqa: T201
+
+import json
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from apscheduler import Schedule as APSSchedule
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from fastapi_apscheduler4.responses import json_list_response
+from fastapi_apscheduler4.schemas import Schedule
+
+SCHEDULE_COUNT = 10_000
+REPEAT_COUNT = 7
+
+
+def build_schedules() -> list[APSSchedule]:
+    """Build schedules alternating interval and cron triggers, as read from the data store."""
+    start_time = datetime(2100, 1, 1, tzinfo=timezone.utc)
+    schedules = []
+    for index in range(SCHEDULE_COUNT):
+        trigger = IntervalTrigger(minutes=5, start_time=start_time) if index % 2 else CronTrigger(minute="*/5")
+        schedule = APSSchedule(
+            id=f"customer-{index}",
+            task_id="tests.benchmarks:customer_task",
+            trigger=trigger,
+            kwargs={"customer_id": index},
+            job_executor="async",
+            misfire_grace_time=timedelta(seconds=30),
+        )
+        schedule.next_fire_time = start_time + timedelta(seconds=index)
+        schedules.append(schedule)
+    return schedules
+
+
+def build_app(schedules: list[APSSchedule]) -> FastAPI:
+    """Build an app listing the schedules with the response model of FastAPI, and with the raw JSON response."""
+    app = FastAPI()
+
+    @app.get("/response-model", response_model=list[Schedule], response_model_exclude_none=True)
+    async def list_with_response_model() -> list[APSSchedule]:
+        return schedules
+
+    @app.get("/raw", response_model=list[Schedule])
+    async def list_with_raw_response(response: Response) -> Response:
+        return json_list_response(Schedule, schedules, response)
+
+    return app
+
+
+@pytest.mark.benchmark
+def test_serialize_schedules_benchmark() -> None:
+    """Compare the raw JSON response against the response model of FastAPI, through the endpoints.
+
+    The recent FastAPI releases already dump the response model into JSON bytes with pydantic-core, so both take
+    about as long there. The raw response is kept for the sparse fieldsets, which the response model cannot dump.
+    """
+    # Arrange
+    app = build_app(build_schedules())
+    durations: dict[str, list[float]] = {"/response-model": [], "/raw": []}
+
+    # Act
+    with TestClient(app) as client:
+        bodies = {path: client.get(path).content for path in durations}
+        for _ in range(REPEAT_COUNT):
+            for path, path_durations in durations.items():
+                start = time.perf_counter()
+                client.get(path)
+                path_durations.append(time.perf_counter() - start)
+
+    for path, path_durations in durations.items():
+        print(f"{path}: min {min(path_durations):.3f}s, median {statistics.median(path_durations):.3f}s")
+
+    # Assert
+    assert json.loads(bodies["/raw"]) == json.loads(bodies["/response-model"])
@@ -1,8 +1,11 @@
 """Tests Config."""
 
 import pytest
+from apscheduler.datastores.sqlalchemy import SQLAlchemyDataStore
 from fastapi import FastAPI
 from pydantic import SecretStr
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from fastapi_apscheduler4.app import SchedulerApp
 from fastapi_apscheduler4.config import PostgresConfig, RedisConfig
@@ -36,6 +39,13 @@ def postgres_config() -> PostgresConfig:
     )
 
 
+@pytest.fixture
+def sqlite_data_store() -> SQLAlchemyDataStore:
+    """SQLAlchemy data store on an in-memory SQLite database, shared by the threads running the sync queries."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    return SQLAlchemyDataStore(engine)
+
+
 @pytest.fixture
 def scheduler_app() -> SchedulerApp:
     """Create a scheduler app instance."""
@@ -165,7 +165,7 @@ def test_task_retrieval_workflow(scheduler_app_with_three_tasks: SchedulerApp) -
 
     assert specific_response.status_code == status.HTTP_200_OK
     assert task.id.startswith(task_id_prefix)
-    assert task.job_executor == "async"
+    assert task.job_executor == "threadpool"
 
 
 @pytest.mark.e2e
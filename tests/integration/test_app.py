@@ -1,16 +1,25 @@
 """Test FastAPI-APScheduler4 App."""
 # ruff: noqa: T201
 
+import logging
+import time
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, timezone
+
+import anyio
 import pytest
-from apscheduler import RunState
+from apscheduler import AsyncScheduler, CoalescePolicy, ConflictPolicy, RunState
+from apscheduler.abc import EventBroker
 from apscheduler.datastores.memory import MemoryDataStore
 from apscheduler.datastores.sqlalchemy import SQLAlchemyDataStore
 from apscheduler.eventbrokers.asyncpg import AsyncpgEventBroker
 from apscheduler.eventbrokers.local import LocalEventBroker
 from apscheduler.eventbrokers.redis import RedisEventBroker
+from apscheduler.triggers.interval import IntervalTrigger
 from fastapi import FastAPI, Request, status
 from fastapi.responses import PlainTextResponse
 from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
 
 from fastapi_apscheduler4.app import SchedulerApp
 from fastapi_apscheduler4.config import (
@@ -21,7 +30,10 @@ from fastapi_apscheduler4.config import (
     SchedulerAPIConfig,
     SchedulerConfig,
 )
+from fastapi_apscheduler4.dtos import ScheduleEntry
 from fastapi_apscheduler4.errors import AlreadySetupError, ConfigNotFoundError
+from fastapi_apscheduler4.locks import ReconcileLock
+from fastapi_apscheduler4.schemas import SchedulerPhase
 
 
 async def route_test(request: Request) -> PlainTextResponse:  # noqa: ARG001
@@ -173,3 +185,482 @@ def test_already_setup_error() -> None:
     app_scheduler.setup(app)
     with pytest.raises(AlreadySetupError):
         app_scheduler.setup(app)
+
+
+@pytest.mark.integration
+def test_app_lifespan_reconcile_auto_schedules(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that only new, outdated and unconfigured auto schedules are written on startup."""
+    # Arrange
+    data_store = MemoryDataStore()
+    first_app = SchedulerApp(_apscheduler=AsyncScheduler(data_store))
+    first_app.interval(hours=1)(echo_test1)
+    first_app.interval(hours=1)(echo_test2)
+    first_app.interval(hours=1)(echo_test3)
+
+    second_app = SchedulerApp(_apscheduler=AsyncScheduler(data_store), scheduler=SchedulerConfig(auto_start=False))
+    second_app.interval(hours=1)(echo_test1)
+    second_app.interval(hours=2)(echo_test2)
+    second_app.interval(hours=1)(echo_test4)
+
+    # Act
+    with TestClient(FastAPI(lifespan=first_app.lifespan)):
+        unchanged_schedule = data_store._schedules_by_id["auto:tests.integration.test_app:echo_test1"]
+    with (
+        caplog.at_level(logging.INFO, logger="fastapi_apscheduler4"),
+        TestClient(FastAPI(lifespan=second_app.lifespan)),
+    ):
+        schedules = {schedule.id: schedule for schedule in data_store._schedules}
+
+    # Assert
+    assert set(schedules) == {
+        "auto:tests.integration.test_app:echo_test1",
+        "auto:tests.integration.test_app:echo_test2",
+        "auto:tests.integration.test_app:echo_test4",
+    }
+    assert schedules["auto:tests.integration.test_app:echo_test1"] is unchanged_schedule
+    assert schedules["auto:tests.integration.test_app:echo_test2"].trigger.hours == 2  # noqa: PLR2004
+    assert "added=1, updated=1, removed=1, unchanged=1" in caplog.text
+
+
+@pytest.mark.integration
+def test_app_lifespan_reconcile_explicit_start_time(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the explicit start times are compared on startup, unlike the default ones."""
+    # Arrange
+    data_store = MemoryDataStore()
+    start_time = datetime.now(timezone.utc) + timedelta(days=1)
+    apps = []
+    for explicit_start_time in (start_time, start_time + timedelta(hours=3)):
+        scheduler_app = SchedulerApp(
+            _apscheduler=AsyncScheduler(data_store), scheduler=SchedulerConfig(auto_start=False)
+        )
+        scheduler_app.add_schedule(echo_test1, IntervalTrigger(hours=24, start_time=explicit_start_time))
+        scheduler_app.interval(hours=1)(echo_test2)
+        apps.append(scheduler_app)
+
+    # Act
+    with TestClient(FastAPI(lifespan=apps[0].lifespan)):
+        default_start_schedule = data_store._schedules_by_id["auto:tests.integration.test_app:echo_test2"]
+    with (
+        caplog.at_level(logging.INFO, logger="fastapi_apscheduler4"),
+        TestClient(FastAPI(lifespan=apps[1].lifespan)),
+    ):
+        schedules = {schedule.id: schedule for schedule in data_store._schedules}
+
+    # Assert
+    explicit_start_schedule = schedules["auto:tests.integration.test_app:echo_test1"]
+    assert explicit_start_schedule.trigger.start_time == start_time + timedelta(hours=3)
+    assert schedules["auto:tests.integration.test_app:echo_test2"] is default_start_schedule
+    assert "added=0, updated=1, removed=0, unchanged=1" in caplog.text
+
+
+@pytest.mark.integration
+def test_app_lifespan_reconcile_spread(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that enabling, changing or disabling the spread updates the interval schedules on startup."""
+    # Arrange
+    data_store = MemoryDataStore()
+    schedule_id = "auto:tests.integration.test_app:echo_test1"
+    apps = []
+    for spread in (0, 600, 300, 300, 0):
+        scheduler_app = SchedulerApp(
+            _apscheduler=AsyncScheduler(data_store), scheduler=SchedulerConfig(auto_start=False, spread=spread)
+        )
+        scheduler_app.interval(hours=1)(echo_test1)
+        apps.append(scheduler_app)
+
+    # Act
+    windows = []
+    with caplog.at_level(logging.INFO, logger="fastapi_apscheduler4"):
+        for scheduler_app in apps:
+            with TestClient(FastAPI(lifespan=scheduler_app.lifespan)):
+                windows.append(data_store._schedules_by_id[schedule_id].metadata.get("spread"))
+
+    # Assert
+    assert windows == [None, 600, 300, 300, None]
+    assert caplog.text.count("added=0, updated=1, removed=0, unchanged=0") == 3  # noqa: PLR2004
+    assert caplog.text.count("Auto schedules manifest unchanged, skip reconciliation") == 1
+
+
+@pytest.mark.integration
+def test_app_lifespan_reconcile_keeps_paused_schedules() -> None:
+    """Test that the auto schedules paused from the API stay paused when reconciled, updated or not."""
+    # Arrange
+    data_store = MemoryDataStore()
+    first_app = SchedulerApp(_apscheduler=AsyncScheduler(data_store), scheduler=SchedulerConfig(auto_start=False))
+    first_app.interval(hours=1)(echo_test1)
+    first_app.interval(hours=1)(echo_test2)
+
+    second_app = SchedulerApp(_apscheduler=AsyncScheduler(data_store), scheduler=SchedulerConfig(auto_start=False))
+    second_app.interval(hours=1)(echo_test1)
+    second_app.interval(hours=2)(echo_test2)
+    second_app.interval(hours=1)(echo_test3)
+    first_fastapi_app = FastAPI(lifespan=first_app.lifespan)
+    first_app.setup(first_fastapi_app)
+
+    # Act
+    with TestClient(first_fastapi_app) as client:
+        responses = [
+            client.post(f"{first_app.api.prefix}/schedules/auto:tests.integration.test_app:{name}/pause")
+            for name in ("echo_test1", "echo_test2")
+        ]
+    with TestClient(FastAPI(lifespan=second_app.lifespan)):
+        schedules = {schedule.id: schedule for schedule in data_store._schedules}
+
+    # Assert
+    assert [response.status_code for response in responses] == [status.HTTP_204_NO_CONTENT] * 2
+    assert schedules["auto:tests.integration.test_app:echo_test1"].paused
+    assert schedules["auto:tests.integration.test_app:echo_test2"].paused
+    assert schedules["auto:tests.integration.test_app:echo_test2"].trigger.hours == 2  # noqa: PLR2004
+    assert not schedules["auto:tests.integration.test_app:echo_test3"].paused
+
+
+class FakeReconcileLock(ReconcileLock):
+    """Fake distributed lock shared between scheduler apps."""
+
+    holder: ReconcileLock | None = None
+    acquired_count = 0
+    rejected_count = 0
+
+    async def _try_acquire(self) -> bool:
+        """Try to acquire the lock without waiting."""
+        if FakeReconcileLock.holder is not None:
+            FakeReconcileLock.rejected_count += 1
+            return False
+        FakeReconcileLock.holder = self
+        FakeReconcileLock.acquired_count += 1
+        await anyio.sleep(0.05)  # Hold the lock long enough for the other apps to wait for it
+        return True
+
+    async def _release(self) -> None:
+        """Release the lock."""
+        FakeReconcileLock.holder = None
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_app_lifespan_reconcile_lock(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the apps sharing a data store reconcile one at a time and only the first one writes."""
+    # Arrange
+    data_store = MemoryDataStore()
+    apps = []
+    for _ in range(3):
+        scheduler_app = SchedulerApp(
+            _apscheduler=AsyncScheduler(data_store), scheduler=SchedulerConfig(auto_start=False)
+        )
+        scheduler_app._reconcile_lock = FakeReconcileLock(poll_interval=0.01)
+        scheduler_app.interval(hours=1)(echo_test1)
+        scheduler_app.interval(hours=1)(echo_test2)
+        apps.append(scheduler_app)
+
+    async def start(scheduler_app: SchedulerApp) -> None:
+        async with scheduler_app.lifespan(FastAPI()):
+            pass
+
+    # Act
+    with caplog.at_level(logging.INFO, logger="fastapi_apscheduler4"):
+        async with anyio.create_task_group() as tg:
+            for scheduler_app in apps:
+                tg.start_soon(start, scheduler_app)
+
+    # Assert
+    assert FakeReconcileLock.acquired_count == 3  # noqa: PLR2004
+    assert FakeReconcileLock.rejected_count > 0
+    assert FakeReconcileLock.holder is None
+    assert len(data_store._schedules) == 2  # noqa: PLR2004
+    assert caplog.text.count("added=2, updated=0, removed=0, unchanged=0") == 1
+    assert caplog.text.count("Auto schedules reconciled by another process") == 2  # noqa: PLR2004
+
+
+@pytest.mark.integration
+def test_app_lifespan_skip_unchanged_manifest(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the reconciliation is skipped when the manifest fingerprint is unchanged."""
+    # Arrange
+    data_store = MemoryDataStore()
+    apps = []
+    for _ in range(2):
+        scheduler_app = SchedulerApp(_apscheduler=AsyncScheduler(data_store))
+        scheduler_app.interval(hours=1)(echo_test1)
+        scheduler_app.cron(minute="*/5")(echo_test2)
+        apps.append(scheduler_app)
+
+    # Act
+    with TestClient(FastAPI(lifespan=apps[0].lifespan)):
+        pass
+    get_schedules_spy = mocker.spy(MemoryDataStore, "get_schedules")
+    with (
+        caplog.at_level(logging.INFO, logger="fastapi_apscheduler4"),
+        TestClient(FastAPI(lifespan=apps[1].lifespan)),
+    ):
+        pass
+
+    # Assert
+    assert get_schedules_spy.call_count == 0
+    assert "Auto schedules manifest unchanged, skip reconciliation" in caplog.text
+    assert len(data_store._schedules) == 2  # noqa: PLR2004
+
+
+class SlowMemoryDataStore(MemoryDataStore):
+    """Memory data store taking a while to start."""
+
+    startup_delay: float = 0.5
+
+    async def start(self, exit_stack: AsyncExitStack, event_broker: EventBroker, logger: logging.Logger) -> None:
+        """Start the data store after the startup delay."""
+        await anyio.sleep(self.startup_delay)
+        await super().start(exit_stack, event_broker, logger)
+
+
+def wait_for_phase(scheduler_app: SchedulerApp, phase: SchedulerPhase, timeout: float = 5) -> None:
+    """Wait until the scheduler app reaches the phase."""
+    deadline = time.monotonic() + timeout
+    while scheduler_app.phase is not phase and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.mark.integration
+def test_app_lifespan_readiness() -> None:
+    """Test that the scheduler is ready once the application started."""
+    # Arrange
+    scheduler_app = SchedulerApp()
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+
+    # Act
+    phase_before = scheduler_app.phase
+    with TestClient(app) as client:
+        response = client.get(f"{api_prefix}/scheduler/readiness")
+    phase_after = scheduler_app.phase
+
+    # Assert
+    assert phase_before == SchedulerPhase.STOPPED
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"ready": True, "phase": "ready"}
+    assert phase_after == SchedulerPhase.STOPPED
+
+
+@pytest.mark.integration
+def test_app_lifespan_background_startup() -> None:
+    """Test that the application serves requests while the scheduler starts in the background."""
+    # Arrange
+    scheduler_app = SchedulerApp(
+        scheduler=SchedulerConfig(background_startup=True),
+        _apscheduler=AsyncScheduler(SlowMemoryDataStore()),
+    )
+    scheduler_app.interval(hours=1)(echo_test1)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+
+    # Act
+    with TestClient(app) as client:
+        readiness_starting = client.get(f"{api_prefix}/scheduler/readiness")
+        schedules_starting = client.get(f"{api_prefix}/schedules")
+        wait_for_phase(scheduler_app, SchedulerPhase.READY)
+        readiness_ready = client.get(f"{api_prefix}/scheduler/readiness")
+        schedules_ready = client.get(f"{api_prefix}/schedules")
+    phase_after = scheduler_app.phase
+
+    # Assert
+    assert readiness_starting.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert readiness_starting.json() == {"ready": False, "phase": "initializing"}
+    assert schedules_starting.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert readiness_ready.status_code == status.HTTP_200_OK
+    assert readiness_ready.json() == {"ready": True, "phase": "ready"}
+    assert schedules_ready.status_code == status.HTTP_200_OK
+    assert len(schedules_ready.json()) == 1
+    assert phase_after == SchedulerPhase.STOPPED
+
+
+@pytest.mark.integration
+def test_app_lifespan_background_startup_timeout(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the scheduler fails when it does not start within the startup timeout."""
+    # Arrange
+    data_store = SlowMemoryDataStore()
+    data_store.startup_delay = 10
+    scheduler_app = SchedulerApp(
+        scheduler=SchedulerConfig(background_startup=True, startup_timeout=0.1),
+        _apscheduler=AsyncScheduler(data_store),
+    )
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+
+    # Act
+    with caplog.at_level(logging.ERROR, logger="fastapi_apscheduler4"), TestClient(app) as client:
+        wait_for_phase(scheduler_app, SchedulerPhase.FAILED)
+        response = client.get(f"{api_prefix}/scheduler/readiness")
+
+    # Assert
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json() == {"ready": False, "phase": "failed"}
+    assert "Background startup timeout after 0.1s" in caplog.text
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_add_schedules() -> None:
+    """Test that the schedules are added in bulk with a result per entry."""
+    # Arrange
+    scheduler_app = SchedulerApp(_apscheduler=AsyncScheduler())
+    entries = [
+        ScheduleEntry(func=echo_test1, trigger=IntervalTrigger(hours=1), id="first"),
+        ScheduleEntry(func=echo_test2, trigger=IntervalTrigger(hours=1), id="first"),
+        ScheduleEntry(func=lambda: None, trigger=IntervalTrigger(hours=1), id="lambda"),
+        ScheduleEntry(func=echo_test1, trigger=IntervalTrigger(hours=2)),
+    ]
+
+    # Act
+    async with scheduler_app.apscheduler:
+        results = await scheduler_app.add_schedules(
+            entries, conflict_policy=ConflictPolicy.exception, max_concurrency=1
+        )
+        schedules = await scheduler_app.apscheduler.get_schedules()
+
+    # Assert
+    assert [result.success for result in results] == [True, False, False, True]
+    assert [result.id for result in results[:3]] == ["first", "first", "lambda"]
+    assert results[1].error is not None
+    assert results[2].error is not None
+    assert {schedule.id for schedule in schedules} == {"first", results[3].id}
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_add_schedules_not_initialized() -> None:
+    """Test that adding schedules in bulk before the scheduler is initialized is rejected up front."""
+    # Arrange
+    data_store = MemoryDataStore()
+    scheduler_app = SchedulerApp(_apscheduler=AsyncScheduler(data_store))
+    entries = [ScheduleEntry(func=echo_test1, trigger=IntervalTrigger(hours=1), id="first")]
+
+    # Act & Assert
+    with pytest.raises(RuntimeError, match="not been initialized"):
+        await scheduler_app.add_schedules(entries)
+    assert data_store._schedules == []
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_app_lifespan_schedule_options() -> None:
+    """Test that the job execution options of the decorators are applied to the task and schedule."""
+    # Arrange
+    data_store = MemoryDataStore()
+    scheduler_app = SchedulerApp(_apscheduler=AsyncScheduler(data_store))
+    scheduler_app.interval(
+        hours=1,
+        job_executor="processpool",
+        max_running_jobs=3,
+        misfire_grace_time=30,
+        coalesce=CoalescePolicy.all,
+        max_jitter=5,
+    )(echo_test1)
+    updated_app = SchedulerApp(_apscheduler=AsyncScheduler(data_store))
+    updated_app.interval(hours=1, job_executor="threadpool", max_running_jobs=1)(echo_test1)
+
+    # Act
+    async with scheduler_app.lifespan(FastAPI()):
+        task = await data_store.get_task("tests.integration.test_app:echo_test1")
+        (schedule,) = await data_store.get_schedules()
+    async with updated_app.lifespan(FastAPI()):
+        updated_task = await data_store.get_task("tests.integration.test_app:echo_test1")
+        (updated_schedule,) = await data_store.get_schedules()
+
+    # Assert
+    assert task.job_executor == "processpool"
+    assert task.max_running_jobs == 3  # noqa: PLR2004
+    assert schedule.job_executor == "processpool"
+    assert schedule.misfire_grace_time == timedelta(seconds=30)
+    assert schedule.coalesce == CoalescePolicy.all
+    assert schedule.max_jitter == timedelta(seconds=5)
+    assert updated_task.job_executor == "threadpool"
+    assert updated_task.max_running_jobs == 1
+    assert updated_schedule.job_executor == "threadpool"
+    assert updated_schedule.misfire_grace_time is None
+    assert updated_schedule.coalesce == CoalescePolicy.latest
+    assert updated_schedule.max_jitter is None
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_app_lifespan_reconcile_task_options() -> None:
+    """Test that changing only the task options of a schedule reconfigures its task on startup."""
+    # Arrange
+    data_store = MemoryDataStore()
+    apps = []
+    for max_running_jobs in (3, 1):
+        scheduler_app = SchedulerApp(
+            _apscheduler=AsyncScheduler(data_store), scheduler=SchedulerConfig(auto_start=False)
+        )
+        scheduler_app.interval(hours=1, max_running_jobs=max_running_jobs)(echo_test1)
+        apps.append(scheduler_app)
+
+    # Act
+    async with apps[0].lifespan(FastAPI()):
+        task = await data_store.get_task("tests.integration.test_app:echo_test1")
+    async with apps[1].lifespan(FastAPI()):
+        updated_task = await data_store.get_task("tests.integration.test_app:echo_test1")
+
+    # Assert
+    assert task.max_running_jobs == 3  # noqa: PLR2004
+    assert updated_task.max_running_jobs == 1
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_app_lifespan_reconcile_task_options_multiple_entries(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the schedules inheriting the task options of the first entry of their function stay unchanged."""
+    # Arrange
+    data_store = MemoryDataStore()
+    apps = []
+    for extra_schedule in (False, True):
+        scheduler_app = SchedulerApp(
+            _apscheduler=AsyncScheduler(data_store), scheduler=SchedulerConfig(auto_start=False)
+        )
+        scheduler_app.interval(hours=1, id="first", job_executor="processpool", misfire_grace_time=5)(echo_test1)
+        scheduler_app.interval(hours=2, id="second")(echo_test1)
+        if extra_schedule:
+            scheduler_app.interval(hours=1)(echo_test2)
+        apps.append(scheduler_app)
+
+    # Act
+    async with apps[0].lifespan(FastAPI()):
+        pass
+    with caplog.at_level(logging.INFO, logger="fastapi_apscheduler4"):
+        async with apps[1].lifespan(FastAPI()):
+            second = await data_store.get_schedules({"auto:second"})
+
+    # Assert
+    assert "Reconciled auto schedules (added=1, updated=0, removed=0, unchanged=2)" in caplog.text
+    assert second[0].job_executor == "processpool"
+    assert second[0].misfire_grace_time == timedelta(seconds=5)
+
+
+async def async_echo_test() -> None:
+    """Async test function."""
+    print("async")
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+@pytest.mark.parametrize(("thread_pool_sync_jobs", "sync_job_executor"), [(True, "threadpool"), (False, "async")])
+async def test_app_lifespan_sync_jobs_thread_pool(thread_pool_sync_jobs: bool, sync_job_executor: str) -> None:
+    """Test that the sync functions are routed to the thread pool unless they have an explicit job executor."""
+    # Arrange
+    scheduler_app = SchedulerApp(
+        scheduler=SchedulerConfig(thread_pool_sync_jobs=thread_pool_sync_jobs, auto_start=False),
+    )
+    scheduler_app.interval(hours=1)(echo_test1)
+    scheduler_app.interval(hours=1, job_executor="processpool")(echo_test2)
+    scheduler_app.interval(hours=1)(async_echo_test)
+    data_store = scheduler_app.apscheduler.data_store
+
+    # Act
+    async with scheduler_app.lifespan(FastAPI()):
+        sync_task = await data_store.get_task("tests.integration.test_app:echo_test1")
+        explicit_task = await data_store.get_task("tests.integration.test_app:echo_test2")
+        async_task = await data_store.get_task("tests.integration.test_app:async_echo_test")
+
+    # Assert
+    assert sync_task.job_executor == sync_job_executor
+    assert explicit_task.job_executor == "processpool"
+    assert async_task.job_executor == "async"
@@ -0,0 +1,42 @@
+"""Test Job Executors."""
+
+import os
+import sys
+
+import pytest
+
+from fastapi_apscheduler4.apscheduler_builder import APSSchedulerBuilder
+from fastapi_apscheduler4.config import SchedulerConfig
+
+
+def get_worker_info() -> tuple[int, bool]:
+    """Get the worker process ID and whether the preloaded module is imported."""
+    return os.getpid(), "decimal" in sys.modules
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="max_jobs_per_child requires Python 3.11+")
+@pytest.mark.parametrize("forkserver", [False, True])
+async def test_process_pool_job_executor(forkserver: bool) -> None:
+    """Test the process pool runs the jobs in preloaded workers, recycled after each job."""
+    # Arrange
+    scheduler_config = SchedulerConfig(
+        process_pool_max_workers=1,
+        process_pool_forkserver=forkserver,
+        process_pool_preload_modules=["decimal"],
+        process_pool_max_jobs_per_child=1,
+    )
+    apscheduler = APSSchedulerBuilder(scheduler=scheduler_config, redis=None, postgres=None).build()
+
+    # Act
+    async with apscheduler:
+        await apscheduler.start_in_background()
+        first_pid, first_preloaded = await apscheduler.run_job(get_worker_info, job_executor="processpool")
+        second_pid, second_preloaded = await apscheduler.run_job(get_worker_info, job_executor="processpool")
+
+    # Assert
+    assert os.getpid() not in {first_pid, second_pid}
+    assert first_pid != second_pid
+    assert first_preloaded
+    assert second_preloaded
@@ -0,0 +1,450 @@
+"""Test Data Store Queries."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from apscheduler import AsyncScheduler, ConflictPolicy, Event, Schedule, ScheduleRemoved, ScheduleUpdated
+from apscheduler.abc import DataStore
+from apscheduler.datastores.memory import MemoryDataStore
+from apscheduler.datastores.sqlalchemy import SQLAlchemyDataStore
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from fastapi_apscheduler4.constants import MANIFEST_TASK_ID
+from fastapi_apscheduler4.dtos import JobFilters, ScheduleFilters
+from fastapi_apscheduler4.errors import InvalidCursorError
+from fastapi_apscheduler4.queries import (
+    DataStoreQueries,
+    MemoryDataStoreQueries,
+    encode_cursor,
+    get_data_store_queries,
+)
+from fastapi_apscheduler4.queries.sqlalchemy import SQLAlchemyDataStoreQueries
+from fastapi_apscheduler4.schemas import ScheduleSort, TriggerType
+
+
+# Module-level task functions (required by APScheduler)
+def query_task() -> None:
+    """Test task."""
+
+
+def other_query_task() -> None:
+    """Other test task."""
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def data_store(request: pytest.FixtureRequest, sqlite_data_store: SQLAlchemyDataStore) -> DataStore:
+    """Memory and SQLAlchemy data stores."""
+    if request.param == "memory":
+        return MemoryDataStore()
+    return sqlite_data_store
+
+
+@pytest.fixture(params=["generic", "specific"])
+def queries(request: pytest.FixtureRequest, data_store: DataStore) -> DataStoreQueries:
+    """Generic and data store specific queries."""
+    if request.param == "generic":
+        return DataStoreQueries(data_store)
+    return get_data_store_queries(data_store)
+
+
+async def add_schedules(scheduler: AsyncScheduler) -> list[str]:
+    """Add two schedules per fire time in reverse order, then two exhausted schedules.
+
+    Returns:
+        The schedule IDs in the expected order.
+    """
+    start_time = datetime.now(timezone.utc) + timedelta(hours=1)
+    for index in reversed(range(10)):
+        trigger = IntervalTrigger(hours=1, start_time=start_time + timedelta(minutes=index // 2))
+        await scheduler.add_schedule(query_task, trigger, id=f"schedule-{index}")
+
+    task_id = (await scheduler.get_schedule("schedule-0")).task_id
+    for schedule_id in ("exhausted-b", "exhausted-a"):
+        exhausted = Schedule(
+            id=schedule_id, task_id=task_id, trigger=IntervalTrigger(hours=1), job_executor="async", next_fire_time=None
+        )
+        await scheduler.data_store.add_schedule(exhausted, ConflictPolicy.exception)
+
+    return [f"schedule-{index}" for index in range(10)] + ["exhausted-a", "exhausted-b"]
+
+
+@pytest.mark.integration
+def test_get_data_store_queries(sqlite_data_store: SQLAlchemyDataStore) -> None:
+    """Test the queries use the indexes of the memory data store, and are pushed down to SQL for SQLAlchemy."""
+    # Act
+    memory_queries = get_data_store_queries(MemoryDataStore())
+    sqlalchemy_queries = get_data_store_queries(sqlite_data_store)
+
+    # Assert
+    assert isinstance(memory_queries, MemoryDataStoreQueries)
+    assert isinstance(sqlalchemy_queries, SQLAlchemyDataStoreQueries)
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_get_schedules_offset_page(data_store: DataStore) -> None:
+    """Test get a page of schedules at an offset, with the total count and the next cursor."""
+    # Arrange
+    queries = get_data_store_queries(data_store)
+    async with AsyncScheduler(data_store) as scheduler:
+        expected_ids = await add_schedules(scheduler)
+
+        # Act
+        first_page = await queries.get_schedules(limit=4)
+        last_page = await queries.get_schedules(limit=4, offset=8)
+        out_of_range_page = await queries.get_schedules(limit=4, offset=20)
+
+    # Assert
+    assert [schedule.id for schedule in first_page.items] == expected_ids[:4]
+    assert first_page.total_count == len(expected_ids)
+    assert first_page.next_cursor is not None
+    assert [schedule.id for schedule in last_page.items] == expected_ids[8:]
+    assert last_page.next_cursor is None
+    assert out_of_range_page.items == []
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_get_schedules_cursor_pages(data_store: DataStore) -> None:
+    """Test follow the cursors through all the schedules, including the ones sharing a fire time or exhausted."""
+    # Arrange
+    queries = get_data_store_queries(data_store)
+    async with AsyncScheduler(data_store) as scheduler:
+        expected_ids = await add_schedules(scheduler)
+        page = await queries.get_schedules(limit=3)
+        ids = [schedule.id for schedule in page.items]
+
+        # Act
+        while page.next_cursor is not None:
+            page = await queries.get_schedules(limit=3, cursor=page.next_cursor)
+            ids.extend(schedule.id for schedule in page.items)
+            assert page.total_count is None
+
+        # Assert
+        assert ids == expected_ids
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_get_tasks_pages(data_store: DataStore) -> None:
+    """Test get pages of tasks ordered by ID, without the manifest task."""
+    # Arrange
+    queries = get_data_store_queries(data_store)
+    async with AsyncScheduler(data_store) as scheduler:
+        await scheduler.configure_task(other_query_task)
+        await scheduler.configure_task(query_task)
+        await scheduler.configure_task(MANIFEST_TASK_ID, func=query_task)
+
+        # Act
+        first_page = await queries.get_tasks(limit=1)
+        second_page = await queries.get_tasks(limit=1, cursor=first_page.next_cursor)
+
+    # Assert
+    assert [task.id for task in first_page.items] == ["tests.integration.test_queries:other_query_task"]
+    assert first_page.total_count == 2  # noqa: PLR2004
+    assert [task.id for task in second_page.items] == ["tests.integration.test_queries:query_task"]
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_get_sparse_schedules(queries: DataStoreQueries) -> None:
+    """Test follow the cursors through the schedules loaded with some fields, matching the whole schedules."""
+    # Arrange
+    fields = {"task_id", "last_fire_time", "paused"}
+    async with AsyncScheduler(queries.data_store) as scheduler:
+        await add_schedules(scheduler)
+        expected = [
+            (schedule.id, schedule.task_id, schedule.next_fire_time, schedule.last_fire_time, schedule.paused)
+            for schedule in (await queries.get_schedules(limit=20)).items
+        ]
+
+        # Act
+        page = await queries.get_sparse_schedules(fields, limit=5)
+        items = list(page.items)
+        while page.next_cursor is not None:
+            page = await queries.get_sparse_schedules(fields, limit=5, cursor=page.next_cursor)
+            items.extend(page.items)
+
+    # Assert
+    assert [
+        (item.id, item.task_id, item.next_fire_time, item.last_fire_time, item.paused) for item in items
+    ] == expected
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_get_sparse_tasks(queries: DataStoreQueries) -> None:
+    """Test get a page of tasks loaded with some fields, without the manifest task."""
+    # Arrange
+    async with AsyncScheduler(queries.data_store) as scheduler:
+        await scheduler.configure_task(query_task, max_running_jobs=2)
+        await scheduler.configure_task(MANIFEST_TASK_ID, func=query_task)
+
+        # Act
+        page = await queries.get_sparse_tasks({"max_running_jobs"}, limit=10)
+
+    # Assert
+    assert [(task.id, task.max_running_jobs) for task in page.items] == [
+        ("tests.integration.test_queries:query_task", 2)
+    ]
+    assert page.total_count == 1
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64!",
+        encode_cursor(["next_fire_time", "not-a-date", "id"]),
+        encode_cursor(["next_fire_time", "2025-01-01T00:00:00", "id"]),
+        encode_cursor(["-next_fire_time", "2025-01-01T00:00:00+00:00", "id"]),
+        encode_cursor([1]),
+    ],
+)
+async def test_get_schedules_invalid_cursor(data_store: DataStore, cursor: str) -> None:
+    """Test get schedules with an invalid cursor."""
+    # Arrange
+    queries = get_data_store_queries(data_store)
+
+    # Act & Assert
+    async with AsyncScheduler(data_store):
+        with pytest.raises(InvalidCursorError):
+            await queries.get_schedules(limit=1, cursor=cursor)
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+@pytest.mark.parametrize("sort", list(ScheduleSort))
+async def test_get_schedules_sorted_cursor_pages(data_store: DataStore, sort: ScheduleSort) -> None:
+    """Test follow the cursors through all the schedules in each sort, the exhausted ones last by next fire time."""
+    # Arrange
+    queries = get_data_store_queries(data_store)
+    async with AsyncScheduler(data_store) as scheduler:
+        scheduled_ids = (await add_schedules(scheduler))[:10]
+        expected_ids = {
+            ScheduleSort.NEXT_FIRE_TIME: [*scheduled_ids, "exhausted-a", "exhausted-b"],
+            ScheduleSort.NEXT_FIRE_TIME_DESC: [*reversed(scheduled_ids), "exhausted-b", "exhausted-a"],
+            ScheduleSort.ID: ["exhausted-a", "exhausted-b", *scheduled_ids],
+            ScheduleSort.ID_DESC: [*reversed(scheduled_ids), "exhausted-b", "exhausted-a"],
+        }[sort]
+
+        # Act
+        offset_page = await queries.get_schedules(limit=5, offset=2, sort=sort)
+        page = await queries.get_schedules(limit=5, sort=sort)
+        ids = [schedule.id for schedule in page.items]
+        while page.next_cursor is not None:
+            page = await queries.get_schedules(limit=5, cursor=page.next_cursor, sort=sort)
+            ids.extend(schedule.id for schedule in page.items)
+
+    # Assert
+    assert [schedule.id for schedule in offset_page.items] == expected_ids[2:7]
+    assert ids == expected_ids
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_get_schedules_cursor_other_sort(data_store: DataStore) -> None:
+    """Test a cursor returned for a sort is rejected for another sort."""
+    # Arrange
+    queries = get_data_store_queries(data_store)
+    async with AsyncScheduler(data_store) as scheduler:
+        await add_schedules(scheduler)
+        page = await queries.get_schedules(limit=1, sort=ScheduleSort.ID)
+
+        # Act & Assert
+        with pytest.raises(InvalidCursorError):
+            await queries.get_schedules(limit=1, cursor=page.next_cursor)
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("filters", "expected_ids"),
+    [
+        (ScheduleFilters(), ["interval-0", "cron-0", "interval-1", "cron-1", "exhausted"]),
+        (
+            ScheduleFilters(task_id=["tests.integration.test_queries:other_query_task"]),
+            ["cron-0", "cron-1"],
+        ),
+        (ScheduleFilters(trigger=[TriggerType.CRON]), ["cron-0", "cron-1"]),
+        (ScheduleFilters(trigger=[TriggerType.INTERVAL]), ["interval-0", "interval-1", "exhausted"]),
+        (ScheduleFilters(acquired_by="other-scheduler"), []),
+        (
+            ScheduleFilters(
+                next_fire_time_min=datetime(2100, 1, 1, 1, tzinfo=timezone.utc),
+                next_fire_time_max=datetime(2100, 1, 2, 0, tzinfo=timezone.utc),
+            ),
+            ["cron-0", "interval-1"],
+        ),
+        (
+            ScheduleFilters(
+                task_id=["tests.integration.test_queries:query_task"],
+                next_fire_time_min=datetime(2100, 1, 1, 1, tzinfo=timezone.utc),
+            ),
+            ["interval-1"],
+        ),
+    ],
+)
+async def test_get_schedules_filters(data_store: DataStore, filters: ScheduleFilters, expected_ids: list[str]) -> None:
+    """Test get the schedules matching the filters, paginated with a cursor."""
+    # Arrange
+    queries = get_data_store_queries(data_store)
+    start_time = datetime(2100, 1, 1, tzinfo=timezone.utc)
+    async with AsyncScheduler(data_store) as scheduler:
+        for index in range(2):
+            await scheduler.add_schedule(
+                query_task,
+                IntervalTrigger(days=1, start_time=start_time + timedelta(days=index)),
+                id=f"interval-{index}",
+            )
+            await scheduler.add_schedule(
+                other_query_task,
+                CronTrigger(day=index + 1, hour=1, month=1, start_time=start_time),
+                id=f"cron-{index}",
+            )
+        task_id = (await scheduler.get_schedule("interval-0")).task_id
+        exhausted = Schedule(
+            id="exhausted", task_id=task_id, trigger=IntervalTrigger(days=1), job_executor="async", next_fire_time=None
+        )
+        await scheduler.data_store.add_schedule(exhausted, ConflictPolicy.exception)
+
+        # Act
+        offset_page = await queries.get_schedules(limit=100, filters=filters)
+        page = await queries.get_schedules(limit=1, filters=filters)
+        ids = [schedule.id for schedule in page.items]
+        while page.next_cursor is not None:
+            page = await queries.get_schedules(limit=1, cursor=page.next_cursor, filters=filters)
+            ids.extend(schedule.id for schedule in page.items)
+
+    # Assert
+    assert [schedule.id for schedule in offset_page.items] == expected_ids
+    assert offset_page.total_count == len(expected_ids)
+    assert ids == expected_ids
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_get_jobs_pages(data_store: DataStore) -> None:
+    """Test follow the cursors through all the jobs, ordered by creation time then ID."""
+    # Arrange
+    queries = get_data_store_queries(data_store)
+    async with AsyncScheduler(data_store) as scheduler:
+        for index in range(5):
+            await scheduler.add_job(query_task if index % 2 else other_query_task)
+        jobs = await data_store.get_jobs()
+        expected_ids = [job.id for job in sorted(jobs, key=lambda job: (job.created_at, job.id))]
+
+        # Act
+        first_page = await queries.get_jobs(limit=2)
+        page = first_page
+        ids = [job.id for job in page.items]
+        while page.next_cursor is not None:
+            page = await queries.get_jobs(limit=2, cursor=page.next_cursor)
+            ids.extend(job.id for job in page.items)
+
+    # Assert
+    assert first_page.total_count == len(expected_ids)
+    assert ids == expected_ids
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_get_jobs_filters(data_store: DataStore) -> None:
+    """Test get the jobs filtered by task and acquired state."""
+    # Arrange
+    queries = get_data_store_queries(data_store)
+    task_id = "tests.integration.test_queries:query_task"
+    async with AsyncScheduler(data_store) as scheduler:
+        query_job_ids = {await scheduler.add_job(query_task) for _ in range(2)}
+        other_job_id = await scheduler.add_job(other_query_task)
+        (acquired_job,) = await data_store.acquire_jobs("scheduler", timedelta(minutes=1), limit=1)
+
+        # Act
+        task_page = await queries.get_jobs(limit=10, filters=JobFilters(task_id=[task_id]))
+        acquired_page = await queries.get_jobs(limit=10, filters=JobFilters(acquired=True))
+        queued_page = await queries.get_jobs(limit=10, filters=JobFilters(acquired=False))
+
+    # Assert
+    assert {job.id for job in task_page.items} == query_job_ids
+    assert task_page.total_count == len(query_job_ids)
+    assert [job.id for job in acquired_page.items] == [acquired_job.id]
+    assert {job.id for job in queued_page.items} == (query_job_ids | {other_job_id}) - {acquired_job.id}
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        encode_cursor(["not-a-date", str(uuid4())]),
+        encode_cursor(["2025-01-01T00:00:00", str(uuid4())]),
+        encode_cursor(["2025-01-01T00:00:00+00:00", "not-a-uuid"]),
+        encode_cursor(["2025-01-01T00:00:00+00:00"]),
+    ],
+)
+async def test_get_jobs_invalid_cursor(data_store: DataStore, cursor: str) -> None:
+    """Test get jobs with an invalid cursor."""
+    # Arrange
+    queries = get_data_store_queries(data_store)
+
+    # Act & Assert
+    async with AsyncScheduler(data_store):
+        with pytest.raises(InvalidCursorError):
+            await queries.get_jobs(limit=1, cursor=cursor)
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_remove_schedules(queries: DataStoreQueries) -> None:
+    """Test remove schedules by ID, reporting the removed ones and publishing their events."""
+    # Arrange
+    events: list[Event] = []
+    async with AsyncScheduler(queries.data_store) as scheduler:
+        for index in range(3):
+            await scheduler.add_schedule(query_task, IntervalTrigger(hours=1), id=f"schedule-{index}")
+        scheduler.subscribe(events.append, {ScheduleRemoved})
+        filters = ScheduleFilters(task_id=["tests.integration.test_queries:query_task"])
+
+        # Act
+        removed_ids = await queries.remove_schedules(["schedule-0", "schedule-2", "unknown"])
+        no_removed_ids = await queries.remove_schedules([])
+        remaining_ids = await queries.get_schedule_ids(filters)
+
+    # Assert
+    assert removed_ids == {"schedule-0", "schedule-2"}
+    assert no_removed_ids == set()
+    assert remaining_ids == ["schedule-1"]
+    assert {event.schedule_id for event in events if isinstance(event, ScheduleRemoved)} == removed_ids
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_set_schedules_paused(queries: DataStoreQueries) -> None:
+    """Test pause then resume schedules by ID, keeping their next fire time and publishing their events."""
+    # Arrange
+    events: list[Event] = []
+    trigger = IntervalTrigger(hours=1, start_time=datetime(2100, 1, 1, tzinfo=timezone.utc))
+    async with AsyncScheduler(queries.data_store) as scheduler:
+        for index in range(2):
+            await scheduler.add_schedule(query_task, trigger, id=f"schedule-{index}")
+        scheduler.subscribe(events.append, {ScheduleUpdated})
+
+        # Act
+        paused_ids = await queries.set_schedules_paused(["schedule-0", "unknown"], paused=True)
+        paused_again_ids = await queries.set_schedules_paused(["schedule-0"], paused=True)
+        paused = [schedule.paused for schedule in await scheduler.get_schedules()]
+        resumed_ids = await queries.set_schedules_paused(["schedule-0"], paused=False)
+        schedule = await scheduler.get_schedule("schedule-0")
+
+    # Assert
+    assert paused_ids == paused_again_ids == resumed_ids == {"schedule-0"}
+    assert sorted(paused) == [False, True]
+    assert not schedule.paused
+    assert schedule.next_fire_time == datetime(2100, 1, 1, tzinfo=timezone.utc)
+    assert [(event.schedule_id, event.next_fire_time) for event in events if isinstance(event, ScheduleUpdated)] == [
+        ("schedule-0", datetime(2100, 1, 1, tzinfo=timezone.utc))
+    ] * 2
@@ -0,0 +1,133 @@
+"""Test Events API Router."""
+
+# ruff: noqa: T201
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from anyio import Event, create_task_group, fail_after
+from apscheduler.triggers.interval import IntervalTrigger
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from fastapi_apscheduler4.app import SchedulerApp
+from fastapi_apscheduler4.config import SchedulerAPIConfig
+from fastapi_apscheduler4.constants import SSE_MEDIA_TYPE
+from fastapi_apscheduler4.events import CONNECTED
+
+
+# Module-level task functions (required by APScheduler)
+def event_task1() -> None:
+    """First test task."""
+    print("task1")
+
+
+def event_task2() -> None:
+    """Second test task."""
+    print("task2")
+
+
+async def read_sse(
+    app: FastAPI, path: str, query_string: bytes, on_connected: Callable[[], Awaitable[None]], count: int
+) -> tuple[dict[str, Any], list[bytes]]:
+    """Read a number of server-sent events after the connected comment, then disconnect.
+
+    The ASGI app is called directly, as the test client waits for the end of the streamed responses.
+    """
+    start: dict[str, Any] = {}
+    chunks: list[bytes] = []
+    disconnected = Event()
+
+    async def receive() -> dict[str, Any]:
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            start.update(message)
+        elif message.get("body"):
+            if message["body"] == CONNECTED:
+                tg.start_soon(on_connected)
+            else:
+                chunks.append(message["body"])
+            if len(chunks) == count:
+                disconnected.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string,
+        "root_path": "",
+        "headers": [],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    with fail_after(5):
+        async with create_task_group() as tg:
+            tg.start_soon(app, scope, receive, send)
+    return start, chunks
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_stream_events() -> None:
+    """Test the events of the filtered types and tasks are streamed once connected."""
+    # Arrange
+    scheduler_app = SchedulerApp(api=SchedulerAPIConfig(events_enabled=True))
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    task_id = "tests.integration.test_router_events:event_task1"
+
+    async def add_schedules() -> None:
+        await scheduler_app.apscheduler.add_schedule(event_task2, IntervalTrigger(hours=1), id="other")
+        await scheduler_app.apscheduler.add_schedule(event_task1, IntervalTrigger(hours=1), id="added")
+
+    # Act
+    async with scheduler_app.lifespan(app):
+        start, chunks = await read_sse(
+            app,
+            f"{scheduler_app.api.prefix}/events",
+            f"type=ScheduleAdded&type=ScheduleRemoved&task_id={task_id}".encode(),
+            add_schedules,
+            1,
+        )
+
+    # Assert
+    assert start["status"] == status.HTTP_200_OK
+    assert (b"content-type", f"{SSE_MEDIA_TYPE}; charset=utf-8".encode()) in start["headers"]
+    event, data = chunks[0].decode().removesuffix("\n\n").split("\n")
+    assert event == "event: ScheduleAdded"
+    assert json.loads(data.removeprefix("data: "))["schedule_id"] == "added"
+
+
+@pytest.mark.integration
+def test_stream_events_invalid_type() -> None:
+    """Test an unknown event type is rejected."""
+    # Arrange
+    scheduler_app = SchedulerApp(api=SchedulerAPIConfig(events_enabled=True))
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+
+    # Act
+    with TestClient(app) as client:
+        response = client.get(f"{scheduler_app.api.prefix}/events", params={"type": "Unknown"})
+
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.integration
+def test_stream_events_disabled(scheduler_app: SchedulerApp, fastapi_app: FastAPI) -> None:
+    """Test the events are not streamed by default."""
+    # Act
+    with TestClient(fastapi_app) as client:
+        response = client.get(f"{scheduler_app.api.prefix}/events")
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,108 @@
+"""Test Jobs API Router."""
+
+from functools import partial
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from fastapi_apscheduler4.app import SchedulerApp
+from fastapi_apscheduler4.config import SchedulerAPIConfig, SchedulerConfig
+from fastapi_apscheduler4.schemas import Job, JobOutcome, JobResult
+
+
+# Module-level task functions (required by APScheduler)
+def job_task() -> int:
+    """Test task."""
+    return 42
+
+
+def other_job_task() -> None:
+    """Other test task."""
+
+
+def create_client(scheduler_app: SchedulerApp) -> TestClient:
+    """Test client of a scheduler app."""
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    return TestClient(app)
+
+
+@pytest.mark.integration
+def test_list_and_get_jobs() -> None:
+    """Test list the queued jobs filtered by task, and get a job by ID."""
+    # Arrange
+    scheduler_app = SchedulerApp(scheduler=SchedulerConfig(auto_start=False))
+    api_prefix = scheduler_app.api.prefix
+    task_id = "tests.integration.test_router_jobs:job_task"
+
+    # Act
+    with create_client(scheduler_app) as client:
+        job_id = client.portal.call(scheduler_app.apscheduler.add_job, job_task)
+        client.portal.call(scheduler_app.apscheduler.add_job, other_job_task)
+        list_response = client.get(f"{api_prefix}/jobs", params={"task_id": task_id, "acquired": False})
+        get_response = client.get(f"{api_prefix}/jobs/{job_id}")
+        not_found_response = client.get(f"{api_prefix}/jobs/{uuid4()}")
+
+    # Assert
+    assert list_response.status_code == status.HTTP_200_OK
+    assert [job.id for job in TypeAdapter(list[Job]).validate_json(list_response.text)] == [job_id]
+    assert list_response.headers["X-Total-Count"] == "1"
+    assert get_response.status_code == status.HTTP_200_OK
+    assert Job.model_validate_json(get_response.text).task_id == task_id
+    assert not_found_response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.integration
+def test_get_job_result() -> None:
+    """Test wait for the result of a job, removed once read."""
+    # Arrange
+    scheduler_app = SchedulerApp()
+    api_prefix = scheduler_app.api.prefix
+
+    # Act
+    with create_client(scheduler_app) as client:
+        add_job = partial(scheduler_app.apscheduler.add_job, job_task, result_expiration_time=60)
+        job_id = client.portal.call(add_job)
+        response = client.get(f"{api_prefix}/jobs/{job_id}/result", params={"wait": 5})
+        read_again_response = client.get(f"{api_prefix}/jobs/{job_id}/result")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    result = JobResult.model_validate_json(response.text)
+    assert (result.job_id, result.outcome, result.return_value) == (job_id, JobOutcome.SUCCESS, 42)
+    assert read_again_response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.integration
+def test_get_job_result_pending() -> None:
+    """Test the result of a job not finished after the wait is accepted, and the wait capped by the server."""
+    # Arrange
+    scheduler_app = SchedulerApp(
+        scheduler=SchedulerConfig(auto_start=False), api=SchedulerAPIConfig(job_result_max_wait=0.05)
+    )
+    api_prefix = scheduler_app.api.prefix
+
+    # Act
+    with create_client(scheduler_app) as client:
+        job_id = client.portal.call(scheduler_app.apscheduler.add_job, job_task)
+        response = client.get(f"{api_prefix}/jobs/{job_id}/result", params={"wait": 60})
+
+    # Assert
+    assert response.status_code == status.HTTP_202_ACCEPTED
+
+
+@pytest.mark.integration
+def test_jobs_disabled() -> None:
+    """Test the jobs routes are not added when disabled."""
+    # Arrange
+    scheduler_app = SchedulerApp(api=SchedulerAPIConfig(jobs_enabled=False))
+
+    # Act
+    with create_client(scheduler_app) as client:
+        response = client.get(f"{scheduler_app.api.prefix}/jobs")
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,7 +1,14 @@
 """Test Scheduler API Router."""
 
 # ruff: noqa: T201
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from zoneinfo import ZoneInfo
+
 import pytest
+from anyio import Event
+from apscheduler import AsyncScheduler, ScheduleAdded
+from apscheduler.datastores.sqlalchemy import SQLAlchemyDataStore
 from apscheduler.triggers.combining import OrTrigger
 from apscheduler.triggers.interval import IntervalTrigger as APSIntervalTrigger
 from fastapi import FastAPI, status
@@ -9,10 +16,14 @@ from fastapi.testclient import TestClient
 from pydantic import TypeAdapter
 
 from fastapi_apscheduler4.app import SchedulerApp
+from fastapi_apscheduler4.config import SchedulerAPIConfig, SchedulerConfig
+from fastapi_apscheduler4.constants import MANIFEST_TASK_ID
 from fastapi_apscheduler4.schemas import (
     CalendarIntervalTrigger,
     CronTrigger,
     IntervalTrigger,
+    JobAccepted,
+    JobResult,
     Schedule,
     UnknownTrigger,
 )
@@ -39,6 +50,11 @@ def schedule_task4() -> None:
     print("test4")
 
 
+def sum_task(a: int, b: int) -> int:
+    """Test task with a result."""
+    return a + b
+
+
 @pytest.fixture
 def scheduler_app_with_schedules(scheduler_app: SchedulerApp) -> SchedulerApp:
     """Scheduler app with multiple schedule types."""
@@ -46,7 +62,7 @@ def scheduler_app_with_schedules(scheduler_app: SchedulerApp) -> SchedulerApp:
     scheduler_app.cron(day_of_week=1)(schedule_task2)
     scheduler_app.calendar_interval(days=1)(schedule_task3)
     unknown_trigger = OrTrigger([APSIntervalTrigger(seconds=1), APSIntervalTrigger(minutes=1)])
-    scheduler_app.schedules.append((schedule_task4, unknown_trigger))
+    scheduler_app.add_schedule(schedule_task4, unknown_trigger)
     return scheduler_app
 
 
@@ -193,6 +209,10 @@ def test_delete_schedule_with_force(scheduler_app: SchedulerApp) -> None:
         schedules = TypeAdapter(list[Schedule]).validate_json(response.text)
         assert len(schedules) == expected_schedules_count_after
 
+        # Verify the manifest is invalidated to restore the schedule on the next startup
+        manifest_fingerprint = client.portal.call(scheduler_app._get_stored_manifest_fingerprint)
+        assert manifest_fingerprint is None
+
 
 @pytest.mark.integration
 def test_delete_schedule_not_found(scheduler_app: SchedulerApp) -> None:
@@ -233,6 +253,349 @@ def test_list_schedules_pagination(scheduler_app: SchedulerApp) -> None:
     assert len(schedules) == expected_limit
 
 
+@pytest.mark.integration
+def test_list_schedules_pagination_sqlalchemy(sqlite_data_store: SQLAlchemyDataStore) -> None:
+    """Test list schedules pagination pushed down to the SQLAlchemy data store."""
+    # Arrange
+    scheduler_app = SchedulerApp(_apscheduler=AsyncScheduler(sqlite_data_store))
+    scheduler_app.interval(hours=1)(schedule_task1)
+    scheduler_app.interval(hours=2)(schedule_task2)
+    scheduler_app.interval(hours=3)(schedule_task3)
+
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+
+    # Act
+    with TestClient(app) as client:
+        response = client.get(f"{scheduler_app.api.prefix}/schedules?limit=2&offset=1")
+        schedules = TypeAdapter(list[Schedule]).validate_json(response.text)
+
+    # Assert
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert response.headers["X-Total-Count"] == "3"
+    assert [schedule.task_id for schedule in schedules] == [
+        "tests.integration.test_router_schedules:schedule_task2",
+        "tests.integration.test_router_schedules:schedule_task3",
+    ]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("data_store", ["memory", "sqlite"])
+def test_list_schedules_fields(data_store: str, sqlite_data_store: SQLAlchemyDataStore) -> None:
+    """Test list schedules returns only the selected fields and the ID, with or without the serialized columns."""
+    # Arrange
+    apscheduler = AsyncScheduler(sqlite_data_store) if data_store == "sqlite" else AsyncScheduler()
+    scheduler_app = SchedulerApp(_apscheduler=apscheduler)
+    scheduler_app.interval(hours=1, id="hourly")(schedule_task1)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+
+    # Act
+    with TestClient(app) as client:
+        all_response = client.get(f"{api_prefix}/schedules")
+        response = client.get(f"{api_prefix}/schedules", params={"fields": "next_fire_time,paused"})
+        trigger_response = client.get(f"{api_prefix}/schedules", params=[("fields", "task_id"), ("fields", "trigger")])
+
+    # Assert
+    schedule = all_response.json()[0]
+    assert response.status_code == status.HTTP_200_OK
+    [sparse_schedule] = response.json()
+    assert sparse_schedule.keys() == {"id", "next_fire_time", "paused"}
+    assert (sparse_schedule["id"], sparse_schedule["paused"]) == (schedule["id"], schedule["paused"])
+    assert trigger_response.json() == [{key: schedule[key] for key in ("id", "task_id", "trigger")}]
+
+
+@pytest.mark.integration
+def test_list_schedules_cursor_pagination(scheduler_app_with_schedules: SchedulerApp) -> None:
+    """Test list all the schedules by following the next page cursors from an offset page."""
+    # Arrange
+    app = FastAPI(lifespan=scheduler_app_with_schedules.lifespan)
+    scheduler_app_with_schedules.setup(app)
+    api_prefix = scheduler_app_with_schedules.api.prefix
+
+    # Act
+    with TestClient(app) as client:
+        all_response = client.get(f"{api_prefix}/schedules")
+        response = client.get(f"{api_prefix}/schedules?limit=2&offset=1")
+        ids = [schedule.id for schedule in TypeAdapter(list[Schedule]).validate_json(response.text)]
+        next_cursor = response.headers["X-Next-Cursor"]
+        next_response = client.get(f"{api_prefix}/schedules?limit=2&cursor={next_cursor}")
+        ids.extend(schedule.id for schedule in TypeAdapter(list[Schedule]).validate_json(next_response.text))
+        all_ids = [schedule.id for schedule in TypeAdapter(list[Schedule]).validate_json(all_response.text)]
+
+    # Assert
+    assert "X-Next-Cursor" not in all_response.headers
+    assert response.headers["X-Total-Count"] == "4"
+    assert ids == all_ids[1:]
+    assert next_response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.integration
+def test_list_schedules_invalid_cursor(client_with_schedules: TestClient, scheduler_app: SchedulerApp) -> None:
+    """Test list schedules returns 400 for an invalid cursor."""
+    # Act
+    with client_with_schedules as client:
+        response = client.get(f"{scheduler_app.api.prefix}/schedules?cursor=invalid")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.integration
+def test_list_schedules_filters_and_sort(scheduler_app: SchedulerApp) -> None:
+    """Test list schedules filtered by task ID and trigger type, in descending next fire time order."""
+    # Arrange
+    scheduler_app.interval(hours=1, id="task1-hourly")(schedule_task1)
+    scheduler_app.interval(hours=2, id="task1-two-hourly")(schedule_task1)
+    scheduler_app.cron(minute=0, id="task1-cron")(schedule_task1)
+    scheduler_app.interval(hours=1, id="task2-hourly")(schedule_task2)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+
+    # Act
+    with TestClient(app) as client:
+        response = client.get(
+            f"{scheduler_app.api.prefix}/schedules",
+            params={
+                "task_id": "tests.integration.test_router_schedules:schedule_task1",
+                "trigger": "IntervalTrigger",
+                "sort": "-next_fire_time",
+            },
+        )
+        schedules = TypeAdapter(list[Schedule]).validate_json(response.text)
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Total-Count"] == "2"
+    assert [schedule.id for schedule in schedules] == ["auto:task1-two-hourly", "auto:task1-hourly"]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"sort": "task_id"},
+        {"trigger": "DateTrigger"},
+        {"next_fire_time_min": "2025-01-01T00:00:00"},
+        {"fields": "id,unknown"},
+    ],
+)
+def test_list_schedules_invalid_filters(
+    client_with_schedules: TestClient, scheduler_app: SchedulerApp, params: dict
+) -> None:
+    """Test list schedules returns 422 for an unknown sort, trigger type or field, or a naive fire time."""
+    # Act
+    with client_with_schedules as client:
+        response = client.get(f"{scheduler_app.api.prefix}/schedules", params=params)
+
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def add_schedule_and_wait_event(apscheduler: AsyncScheduler, schedule_id: str) -> None:
+    """Add a schedule and wait for its event to be delivered."""
+    added = Event()
+    apscheduler.subscribe(lambda _: added.set(), ScheduleAdded, one_shot=True)
+    await apscheduler.add_schedule(schedule_task2, APSIntervalTrigger(hours=1), id=schedule_id)
+    await added.wait()
+
+
+@pytest.mark.integration
+def test_list_schedules_cache() -> None:
+    """Test the cached schedules are served until an event or a deletion invalidates them."""
+    # Arrange
+    scheduler_app = SchedulerApp(api=SchedulerAPIConfig(cache_enabled=True))
+    scheduler_app.interval(hours=1)(schedule_task1)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+
+    # Act
+    with TestClient(app) as client:
+        first = client.get(f"{api_prefix}/schedules")
+        second = client.get(f"{api_prefix}/schedules")
+        client.portal.call(partial(add_schedule_and_wait_event, scheduler_app.apscheduler, "added"))
+        after_event = client.get(f"{api_prefix}/schedules")
+        client.delete(f"{api_prefix}/schedules/added")
+        after_delete = client.get(f"{api_prefix}/schedules")
+        stats = client.get(f"{api_prefix}/scheduler/cache").json()
+
+    # Assert
+    assert first.json() == second.json()
+    assert len(after_event.json()) == 2  # noqa: PLR2004
+    assert after_delete.json() == first.json()
+    assert stats == {"hits": 1, "misses": 3, "size": 1, "max_size": 1024}
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("cache_enabled", [False, True])
+def test_list_schedules_etag(cache_enabled: bool) -> None:
+    """Test the schedules are not modified until an event or a deletion changes their ETag."""
+    # Arrange
+    scheduler_app = SchedulerApp(api=SchedulerAPIConfig(etag_enabled=True, cache_enabled=cache_enabled))
+    scheduler_app.interval(hours=1)(schedule_task1)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+
+    # Act
+    with TestClient(app) as client:
+        first = client.get(f"{api_prefix}/schedules")
+        etag = first.headers["ETag"]
+        not_modified = client.get(f"{api_prefix}/schedules", headers={"If-None-Match": etag})
+        schedule_not_modified = client.get(
+            f"{api_prefix}/schedules/{first.json()[0]['id']}", headers={"If-None-Match": etag}
+        )
+        client.portal.call(partial(add_schedule_and_wait_event, scheduler_app.apscheduler, "added"))
+        after_event = client.get(f"{api_prefix}/schedules", headers={"If-None-Match": etag})
+        client.delete(f"{api_prefix}/schedules/added")
+        after_delete = client.get(f"{api_prefix}/schedules", headers={"If-None-Match": after_event.headers["ETag"]})
+
+    # Assert
+    assert etag.startswith('W/"')
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.content == b""
+    assert schedule_not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert after_event.status_code == status.HTTP_200_OK
+    assert len(after_event.json()) == 2  # noqa: PLR2004
+    assert after_delete.status_code == status.HTTP_200_OK
+    assert after_delete.json() == first.json()
+
+
+@pytest.mark.integration
+def test_list_schedules_etag_disabled(client_with_schedules: TestClient, scheduler_app: SchedulerApp) -> None:
+    """Test the schedules have no ETag by default."""
+    # Act
+    with client_with_schedules as client:
+        response = client.get(f"{scheduler_app.api.prefix}/schedules", headers={"If-None-Match": "*"})
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert "ETag" not in response.headers
+
+
+@pytest.mark.integration
+def test_cache_stats_disabled(client_with_schedules: TestClient, scheduler_app: SchedulerApp) -> None:
+    """Test the cache statistics are not exposed when the cache is disabled."""
+    # Act
+    with client_with_schedules as client:
+        response = client.get(f"{scheduler_app.api.prefix}/scheduler/cache")
+
+    # Assert
+    assert scheduler_app.cache is None
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.integration
+def test_export_import_schedules(scheduler_app_with_schedules: SchedulerApp, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the exported schedules are restored by the import, with force for the auto schedules.
+
+    The restored application has the tasks of the schedules, and the schedules already restored are skipped.
+    """
+    # Arrange
+    monkeypatch.setattr("fastapi_apscheduler4.routers.schedules.EXPORT_CHUNK_SIZE", 1)
+    app = FastAPI(lifespan=scheduler_app_with_schedules.lifespan)
+    scheduler_app_with_schedules.setup(app)
+    restored_scheduler_app = SchedulerApp()
+    restored_app = FastAPI(lifespan=restored_scheduler_app.lifespan)
+    restored_scheduler_app.setup(restored_app)
+    api_prefix = scheduler_app_with_schedules.api.prefix
+    configure_task = restored_scheduler_app.apscheduler.configure_task
+
+    # Act
+    with TestClient(app) as client:
+        export = client.get(f"{api_prefix}/schedules/export")
+        schedules = client.get(f"{api_prefix}/schedules").json()
+    with TestClient(restored_app) as client:
+        for func in (schedule_task1, schedule_task2, schedule_task3, schedule_task4):
+            client.portal.call(configure_task, func)
+        not_forced = client.post(f"{api_prefix}/schedules/import", content=export.content)
+        forced = client.post(f"{api_prefix}/schedules/import", params={"force": True}, content=export.content)
+        forced_again = client.post(f"{api_prefix}/schedules/import", params={"force": True}, content=export.content)
+        restored_schedules = client.get(f"{api_prefix}/schedules").json()
+
+    # Assert
+    assert export.headers["content-type"] == "application/x-ndjson"
+    assert len(export.content.splitlines()) == 4  # noqa: PLR2004
+    assert not_forced.json()["imported"] == 0
+    assert [failure["line"] for failure in not_forced.json()["failures"]] == [1, 2, 3, 4]
+    assert forced.json() == {"imported": 4, "skipped": 0, "failures": []}
+    assert forced_again.json() == {"imported": 0, "skipped": 4, "failures": []}
+    assert [(schedule["id"], schedule["next_fire_time"]) for schedule in restored_schedules] == [
+        (schedule["id"], schedule["next_fire_time"]) for schedule in schedules
+    ]
+
+
+@pytest.mark.integration
+def test_export_schedules_unserializable(scheduler_app: SchedulerApp) -> None:
+    """Test an unserializable schedule is exported as an error line, without truncating the export."""
+    # Arrange
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+    trigger = APSIntervalTrigger(hours=1)
+
+    # Act
+    with TestClient(app) as client:
+        for schedule_id, kwargs in (("a", {}), ("b", {"c": {(1, 2): 3}}), ("d", {})):
+            add_schedule = partial(
+                scheduler_app.apscheduler.add_schedule, schedule_task2, trigger, id=schedule_id, kwargs=kwargs
+            )
+            client.portal.call(add_schedule)
+        export = client.get(f"{api_prefix}/schedules/export")
+        response = client.post(f"{api_prefix}/schedules/import", params={"force": True}, content=export.content)
+
+    # Assert
+    assert export.status_code == status.HTTP_200_OK
+    assert len(export.content.splitlines()) == 3  # noqa: PLR2004
+    assert (response.json()["imported"], response.json()["skipped"]) == (0, 2)
+    assert [failure["line"] for failure in response.json()["failures"]] == [2]
+
+
+@pytest.mark.integration
+def test_import_schedules_failures(scheduler_app: SchedulerApp) -> None:
+    """Test the failing lines are reported without preventing the others from being imported.
+
+    The schedules of an unknown task or of the manifest task are rejected.
+    """
+    # Arrange
+    scheduler_app.interval(hours=1, id="existing")(schedule_task1)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+
+    # Act
+    with TestClient(app) as client:
+        export = client.get(f"{api_prefix}/schedules/export").content
+        line = export.replace(b"auto:existing", b"imported")
+        task_id = b"tests.integration.test_router_schedules:schedule_task1"
+        unknown_task_line = line.replace(b"imported", b"unknown-task").replace(task_id, b"tests:missing")
+        manifest_task_line = line.replace(b"imported", b"manifest-task").replace(task_id, MANIFEST_TASK_ID.encode())
+        body = b"\n".join([line, b"not json", export, b"[1]", unknown_task_line, manifest_task_line])
+        response = client.post(
+            f"{api_prefix}/schedules/import", params={"conflict_policy": "exception", "force": True}, content=body
+        )
+        schedule_ids = [schedule["id"] for schedule in client.get(f"{api_prefix}/schedules").json()]
+
+    # Assert
+    result = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert result["imported"] == 1
+    assert [(failure["line"], failure.get("id")) for failure in result["failures"]] == [
+        (3, None),
+        (4, "auto:existing"),
+        (6, None),
+        (7, "unknown-task"),
+        (9, "manifest-task"),
+    ]
+    assert [failure["error"] for failure in result["failures"][3:]] == [
+        "Task with ID tests:missing not found.",
+        f"Task with ID {MANIFEST_TASK_ID} not found.",
+    ]
+    assert sorted(schedule_ids) == ["auto:existing", "imported"]
+
+
 @pytest.mark.integration
 def test_list_schedules_empty(scheduler_app: SchedulerApp) -> None:
     """Test list schedules when no schedules are registered."""
@@ -248,3 +611,309 @@ def test_list_schedules_empty(scheduler_app: SchedulerApp) -> None:
     # Assert
     assert response.status_code == status.HTTP_200_OK
     assert len(schedules) == 0
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(("spread", "max_peak"), [(0, 20), (60, 5)])
+def test_get_fire_time_histogram(spread: float, max_peak: int) -> None:
+    """Test the fire time histogram shows the spread schedules."""
+    # Arrange
+    scheduler_app = SchedulerApp(scheduler=SchedulerConfig(spread=spread, auto_start=False))
+    for i in range(20):
+        scheduler_app.cron(minute="*/5", id=f"job-{i}")(schedule_task1)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+
+    # Act
+    with TestClient(app) as client:
+        response = client.get(f"{scheduler_app.api.prefix}/schedules/histogram", params={"horizon": 600})
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    histogram = response.json()
+    assert histogram["peak"] <= max_peak
+    assert sum(bucket["count"] for bucket in histogram["buckets"]) >= 20  # noqa: PLR2004
+
+
+@pytest.mark.integration
+def test_run_schedule(scheduler_app: SchedulerApp) -> None:
+    """Test run a schedule now with its arguments, then wait for its result, without changing its next fire time."""
+    # Arrange
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+    trigger = APSIntervalTrigger(hours=1, start_time=datetime.now(timezone.utc) + timedelta(hours=1))
+    add_schedule = partial(scheduler_app.apscheduler.add_schedule, sum_task, trigger, id="sum", args=(1, 2))
+
+    # Act
+    with TestClient(app) as client:
+        client.portal.call(add_schedule)
+        next_fire_time = client.portal.call(scheduler_app.apscheduler.get_schedule, "sum").next_fire_time
+        response = client.post(f"{api_prefix}/schedules/sum/run")
+        job_id = JobAccepted.model_validate_json(response.text).job_id
+        result_response = client.get(f"{api_prefix}/jobs/{job_id}/result", params={"wait": 5})
+        schedule = client.portal.call(scheduler_app.apscheduler.get_schedule, "sum")
+
+    # Assert
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert JobResult.model_validate_json(result_response.text).return_value == 3  # noqa: PLR2004
+    assert schedule.next_fire_time == next_fire_time
+
+
+@pytest.mark.integration
+def test_run_schedule_not_found(client_with_schedules: TestClient, scheduler_app: SchedulerApp) -> None:
+    """Test run an unknown schedule."""
+    # Act
+    with client_with_schedules as client:
+        response = client.post(f"{scheduler_app.api.prefix}/schedules/unknown/run")
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.integration
+def test_bulk_delete_schedules(scheduler_app: SchedulerApp) -> None:
+    """Test delete schedules by ID, reporting the unknown and the auto schedules not allowed without force."""
+    # Arrange
+    scheduler_app.interval(hours=1)(schedule_task1)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+    auto_id = "auto:tests.integration.test_router_schedules:schedule_task1"
+    trigger = APSIntervalTrigger(hours=1, start_time=datetime.now(timezone.utc) + timedelta(hours=1))
+
+    # Act
+    with TestClient(app) as client:
+        for index in range(2):
+            add_schedule = partial(scheduler_app.apscheduler.add_schedule, schedule_task2, trigger, id=f"bulk-{index}")
+            client.portal.call(add_schedule)
+        ids = ["bulk-0", auto_id, "unknown", "bulk-1", "bulk-0"]
+        response = client.post(f"{api_prefix}/schedules/bulk/delete", json={"ids": ids})
+        list_response = client.get(f"{api_prefix}/schedules")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "done": 2,
+        "results": [
+            {"id": "bulk-0", "outcome": "done"},
+            {"id": auto_id, "outcome": "not_allowed"},
+            {"id": "unknown", "outcome": "not_found"},
+            {"id": "bulk-1", "outcome": "done"},
+        ],
+    }
+    assert [schedule["id"] for schedule in list_response.json()] == [auto_id]
+
+
+@pytest.mark.integration
+def test_bulk_delete_schedules_by_filters_with_force(scheduler_app: SchedulerApp) -> None:
+    """Test delete the auto schedules matching the filters with force, invalidating the manifest."""
+    # Arrange
+    scheduler_app.interval(hours=1)(schedule_task1)
+    scheduler_app.interval(hours=1)(schedule_task2)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+    selection = {"filters": {"task_id": ["tests.integration.test_router_schedules:schedule_task1"]}}
+
+    # Act
+    with TestClient(app) as client:
+        response = client.post(f"{api_prefix}/schedules/bulk/delete", params={"force": True}, json=selection)
+        list_response = client.get(f"{api_prefix}/schedules")
+        manifest_fingerprint = client.portal.call(scheduler_app._get_stored_manifest_fingerprint)
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "done": 1,
+        "results": [{"id": "auto:tests.integration.test_router_schedules:schedule_task1", "outcome": "done"}],
+    }
+    assert [schedule["id"] for schedule in list_response.json()] == [
+        "auto:tests.integration.test_router_schedules:schedule_task2"
+    ]
+    assert manifest_fingerprint is None
+
+
+@pytest.mark.integration
+def test_bulk_pause_and_resume_schedules(scheduler_app: SchedulerApp) -> None:
+    """Test pause then resume the schedules matching the filters."""
+    # Arrange
+    scheduler_app.interval(hours=1)(schedule_task1)
+    scheduler_app.interval(hours=1)(schedule_task2)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+    selection = {"filters": {"task_id": ["tests.integration.test_router_schedules:schedule_task1"]}}
+    get_schedules = scheduler_app.apscheduler.get_schedules
+
+    # Act
+    with TestClient(app) as client:
+        pause_response = client.post(f"{api_prefix}/schedules/bulk/pause", json=selection)
+        paused = {schedule.id: schedule.paused for schedule in client.portal.call(get_schedules)}
+        resume_response = client.post(f"{api_prefix}/schedules/bulk/resume", json=selection)
+        resumed = {schedule.id: schedule.paused for schedule in client.portal.call(get_schedules)}
+
+    # Assert
+    assert pause_response.status_code == resume_response.status_code == status.HTTP_200_OK
+    assert pause_response.json()["done"] == resume_response.json()["done"] == 1
+    assert paused == {
+        "auto:tests.integration.test_router_schedules:schedule_task1": True,
+        "auto:tests.integration.test_router_schedules:schedule_task2": False,
+    }
+    assert not any(resumed.values())
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("selection", [{}, {"ids": ["schedule"], "filters": {}}])
+def test_bulk_schedules_invalid_selection(
+    scheduler_app: SchedulerApp, fastapi_app: FastAPI, selection: dict[str, object]
+) -> None:
+    """Test the selection of a bulk operation requires either the IDs or the filters."""
+    # Act
+    with TestClient(fastapi_app) as client:
+        response = client.post(f"{scheduler_app.api.prefix}/schedules/bulk/pause", json=selection)
+
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.integration
+def test_pause_and_resume_schedule(scheduler_app: SchedulerApp) -> None:
+    """Test pause then resume an auto schedule without force, keeping its next fire time."""
+    # Arrange
+    scheduler_app.interval(hours=1)(schedule_task1)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    schedule_url = f"{scheduler_app.api.prefix}/schedules/auto:tests.integration.test_router_schedules:schedule_task1"
+
+    # Act
+    with TestClient(app) as client:
+        initial = Schedule.model_validate_json(client.get(schedule_url).text)
+        pause_response = client.post(f"{schedule_url}/pause")
+        paused = Schedule.model_validate_json(client.get(schedule_url).text)
+        resume_response = client.post(f"{schedule_url}/resume")
+        resumed = Schedule.model_validate_json(client.get(schedule_url).text)
+
+    # Assert
+    assert pause_response.status_code == resume_response.status_code == status.HTTP_204_NO_CONTENT
+    assert (initial.paused, paused.paused, resumed.paused) == (False, True, False)
+    assert resumed.next_fire_time == initial.next_fire_time
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("action", ["pause", "resume"])
+def test_pause_schedule_not_found(scheduler_app: SchedulerApp, fastapi_app: FastAPI, action: str) -> None:
+    """Test pause and resume return 404 for a non-existent schedule."""
+    # Act
+    with TestClient(fastapi_app) as client:
+        response = client.post(f"{scheduler_app.api.prefix}/schedules/non-existent-schedule/{action}")
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.integration
+def test_create_and_update_schedule(scheduler_app: SchedulerApp) -> None:
+    """Test create a schedule of an existing task from a typed trigger, then replace its trigger."""
+    # Arrange
+    scheduler_app.interval(hours=1)(sum_task)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+    body = {
+        "id": "created",
+        "task_id": "tests.integration.test_router_schedules:sum_task",
+        "trigger": {"type": "IntervalTrigger", "hours": 2, "start_time": "2100-01-01T00:00:00Z"},
+        "args": [1, 2],
+        "paused": True,
+    }
+    update_body = {
+        "task_id": "tests.integration.test_router_schedules:sum_task",
+        "trigger": {"type": "CronTrigger", "hour": 6, "start_time": "2100-01-01T00:00:00Z", "timezone": "UTC"},
+    }
+
+    # Act
+    with TestClient(app) as client:
+        create_response = client.post(f"{api_prefix}/schedules", json=body)
+        conflict_response = client.post(f"{api_prefix}/schedules", json=body)
+        update_response = client.put(f"{api_prefix}/schedules/created", json=update_body)
+        stored = client.portal.call(scheduler_app.apscheduler.get_schedule, "created")
+
+    # Assert
+    assert create_response.status_code == status.HTTP_201_CREATED
+    created = Schedule.model_validate_json(create_response.text)
+    assert (created.id, created.args, created.paused) == ("created", [1, 2], True)
+    assert isinstance(created.trigger, IntervalTrigger)
+    assert created.next_fire_time == datetime(2100, 1, 1, tzinfo=timezone.utc)
+    assert conflict_response.status_code == status.HTTP_409_CONFLICT
+    assert update_response.status_code == status.HTTP_200_OK
+    updated = Schedule.model_validate_json(update_response.text)
+    assert isinstance(updated.trigger, CronTrigger)
+    assert updated.next_fire_time == datetime(2100, 1, 1, 6, tzinfo=timezone.utc)
+    assert (stored.args, stored.paused) == ((), False)
+
+
+@pytest.mark.integration
+def test_update_schedule_round_trip_timezone(scheduler_app: SchedulerApp) -> None:
+    """Test a schedule read then written back keeps the timezone of its trigger."""
+    # Arrange
+    scheduler_app.interval(hours=1)(sum_task)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+    body = {
+        "id": "zurich",
+        "task_id": "tests.integration.test_router_schedules:sum_task",
+        "trigger": {"type": "CronTrigger", "hour": 6, "timezone": "Europe/Zurich"},
+        "args": [1, 2],
+    }
+
+    # Act
+    with TestClient(app) as client:
+        client.post(f"{api_prefix}/schedules", json=body)
+        read = client.get(f"{api_prefix}/schedules/zurich").json()
+        update_body = {key: read[key] for key in ("task_id", "trigger", "args")}
+        update_response = client.put(f"{api_prefix}/schedules/zurich", json=update_body)
+        stored = client.portal.call(scheduler_app.apscheduler.get_schedule, "zurich")
+
+    # Assert
+    assert read["trigger"]["timezone"] == "Europe/Zurich"
+    assert update_response.status_code == status.HTTP_200_OK
+    assert update_response.json()["trigger"]["timezone"] == "Europe/Zurich"
+    assert stored.trigger.timezone == ZoneInfo("Europe/Zurich")
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("path", "body", "params", "expected_status"),
+    [
+        ("", {"task_id": "unknown"}, {}, status.HTTP_404_NOT_FOUND),
+        ("", {"task_id": "auto:manifest"}, {}, status.HTTP_404_NOT_FOUND),
+        ("", {"id": "auto:created"}, {}, status.HTTP_405_METHOD_NOT_ALLOWED),
+        ("/auto:created", {}, {}, status.HTTP_405_METHOD_NOT_ALLOWED),
+        ("/auto:created", {}, {"force": True}, status.HTTP_200_OK),
+        ("", {"trigger": {"type": "IntervalTrigger"}}, {}, status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ],
+    ids=["unknown_task", "manifest_task", "auto_create", "auto_update", "auto_update_force", "invalid_trigger"],
+)
+def test_write_schedule_errors(
+    scheduler_app: SchedulerApp, path: str, body: dict[str, object], params: dict[str, object], expected_status: int
+) -> None:
+    """Test the schedules of unknown tasks, with invalid triggers, or auto without force are not written."""
+    # Arrange
+    scheduler_app.interval(hours=1)(schedule_task1)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    body = {
+        "task_id": "tests.integration.test_router_schedules:schedule_task1",
+        "trigger": {"type": "IntervalTrigger", "hours": 1},
+        **body,
+    }
+
+    # Act
+    with TestClient(app) as client:
+        method = client.put if path else client.post
+        response = method(f"{scheduler_app.api.prefix}/schedules{path}", json=body, params=params)
+
+    # Assert
+    assert response.status_code == expected_status
@@ -8,7 +8,9 @@ from fastapi.testclient import TestClient
 from pydantic import TypeAdapter
 
 from fastapi_apscheduler4.app import SchedulerApp
-from fastapi_apscheduler4.schemas import Task
+from fastapi_apscheduler4.config import SchedulerAPIConfig
+from fastapi_apscheduler4.constants import MANIFEST_TASK_ID
+from fastapi_apscheduler4.schemas import JobAccepted, JobResult, Task
 
 
 # Module-level task functions (required by APScheduler)
@@ -22,6 +24,11 @@ def task2() -> None:
     print("task2")
 
 
+def sum_task(a: int = 0, b: int = 0) -> int:
+    """Test task with a result."""
+    return a + b
+
+
 @pytest.fixture
 def scheduler_app_with_tasks(scheduler_app: SchedulerApp) -> SchedulerApp:
     """Scheduler app with two registered tasks."""
@@ -77,7 +84,7 @@ def test_get_task(scheduler_app: SchedulerApp) -> None:
     # Assert
     assert response.status_code == status.HTTP_200_OK
     assert task.id == task_id
-    assert task.job_executor == "async"
+    assert task.job_executor == "threadpool"
 
 
 @pytest.mark.integration
@@ -98,6 +105,23 @@ def test_get_task_not_found(scheduler_app: SchedulerApp) -> None:
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.integration
+def test_get_task_manifest_hidden(scheduler_app: SchedulerApp) -> None:
+    """Test get task returns 404 for the auto schedules manifest task."""
+    # Arrange
+    scheduler_app.interval(hours=1)(task1)
+
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+
+    # Act
+    with TestClient(app) as client:
+        response = client.get(f"{scheduler_app.api.prefix}/tasks/{MANIFEST_TASK_ID}")
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.integration
 def test_list_tasks_pagination(scheduler_app_with_tasks: SchedulerApp, client_with_tasks: TestClient) -> None:
     """Test list tasks with pagination."""
@@ -137,6 +161,64 @@ def test_list_tasks_pagination_offset(scheduler_app_with_tasks: SchedulerApp, cl
     assert len(tasks) == expected_limit
 
 
+@pytest.mark.integration
+def test_list_tasks_cursor_pagination(scheduler_app_with_tasks: SchedulerApp, client_with_tasks: TestClient) -> None:
+    """Test list tasks by following the next page cursor."""
+    # Arrange
+    api_prefix = scheduler_app_with_tasks.api.prefix
+
+    # Act
+    with client_with_tasks as client:
+        first_response = client.get(f"{api_prefix}/tasks?limit=1")
+        next_cursor = first_response.headers["X-Next-Cursor"]
+        second_response = client.get(f"{api_prefix}/tasks?limit=1&cursor={next_cursor}")
+        first_tasks = TypeAdapter(list[Task]).validate_json(first_response.text)
+        second_tasks = TypeAdapter(list[Task]).validate_json(second_response.text)
+
+    # Assert
+    assert first_response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert first_response.headers["Link"] == (
+        f'<http://testserver{api_prefix}/tasks?limit=1&cursor={next_cursor}>; rel="next"'
+    )
+    assert [task.id for task in first_tasks] == ["tests.integration.test_router_tasks:task1"]
+    assert second_response.status_code == status.HTTP_200_OK
+    assert "X-Next-Cursor" not in second_response.headers
+    assert "X-Total-Count" not in second_response.headers
+    assert [task.id for task in second_tasks] == ["tests.integration.test_router_tasks:task2"]
+
+
+@pytest.mark.integration
+def test_list_tasks_invalid_cursor(scheduler_app_with_tasks: SchedulerApp, client_with_tasks: TestClient) -> None:
+    """Test list tasks returns 400 for an invalid cursor."""
+    # Arrange
+    api_prefix = scheduler_app_with_tasks.api.prefix
+
+    # Act
+    with client_with_tasks as client:
+        response = client.get(f"{api_prefix}/tasks?cursor=invalid")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.integration
+def test_list_tasks_fields(scheduler_app_with_tasks: SchedulerApp, client_with_tasks: TestClient) -> None:
+    """Test list tasks returns only the selected fields and the ID, and 422 for an unknown field."""
+    # Arrange
+    api_prefix = scheduler_app_with_tasks.api.prefix
+
+    # Act
+    with client_with_tasks as client:
+        response = client.get(f"{api_prefix}/tasks", params={"fields": "func", "limit": 1})
+        invalid_response = client.get(f"{api_prefix}/tasks", params={"fields": "unknown"})
+
+    # Assert
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    task_id = "tests.integration.test_router_tasks:task1"
+    assert response.json() == [{"id": task_id, "func": task_id}]
+    assert invalid_response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest.mark.integration
 def test_list_tasks_empty(scheduler_app: SchedulerApp) -> None:
     """Test list tasks when no tasks are registered."""
@@ -152,3 +234,95 @@ def test_list_tasks_empty(scheduler_app: SchedulerApp) -> None:
     # Assert
     assert response.status_code == status.HTTP_200_OK
     assert len(tasks) == 0
+
+
+@pytest.mark.integration
+def test_get_task_etag() -> None:
+    """Test the tasks respond with 304 Not Modified to their ETag."""
+    # Arrange
+    scheduler_app = SchedulerApp(api=SchedulerAPIConfig(etag_enabled=True))
+    scheduler_app.interval(hours=1)(task1)
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+
+    # Act
+    with TestClient(app) as client:
+        tasks = client.get(f"{api_prefix}/tasks")
+        etag = tasks.headers["ETag"]
+        tasks_not_modified = client.get(f"{api_prefix}/tasks", headers={"If-None-Match": etag})
+        task_not_modified = client.get(f"{api_prefix}/tasks/{tasks.json()[0]['id']}", headers={"If-None-Match": etag})
+        task_modified = client.get(f"{api_prefix}/tasks/{tasks.json()[0]['id']}", headers={"If-None-Match": 'W/"0"'})
+
+    # Assert
+    assert tasks_not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert task_not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert task_modified.status_code == status.HTTP_200_OK
+    assert task_modified.headers["ETag"] == etag
+
+
+@pytest.mark.integration
+def test_export_import_tasks(client_with_tasks: TestClient, scheduler_app_with_tasks: SchedulerApp) -> None:
+    """Test the exported options of the existing tasks are restored by the import, and the other tasks rejected."""
+    # Arrange
+    restored_scheduler_app = SchedulerApp()
+    restored_scheduler_app.interval(hours=1, max_running_jobs=5)(task1)
+    restored_scheduler_app.interval(hours=2, max_running_jobs=5)(task2)
+    restored_app = FastAPI(lifespan=restored_scheduler_app.lifespan)
+    restored_scheduler_app.setup(restored_app)
+    api_prefix = scheduler_app_with_tasks.api.prefix
+    rejected_lines = [
+        b'{"id": "x", "func": "os:system", "job_executor": "async"}',
+        b'{"id": "tests.integration.test_router_tasks:task1", "func": "os:system", "job_executor": "async"}',
+    ]
+
+    # Act
+    with client_with_tasks as client:
+        export = client.get(f"{api_prefix}/tasks/export")
+        tasks = client.get(f"{api_prefix}/tasks").json()
+    with TestClient(restored_app) as client:
+        manifest_line = export.content.splitlines()[0].replace(tasks[0]["id"].encode(), MANIFEST_TASK_ID.encode())
+        content = b"\n".join([*export.content.splitlines(), manifest_line, *rejected_lines])
+        response = client.post(f"{api_prefix}/tasks/import", content=content)
+        restored_tasks = client.get(f"{api_prefix}/tasks").json()
+
+    # Assert
+    assert len(export.content.splitlines()) == 2  # noqa: PLR2004
+    assert response.json()["imported"] == 2  # noqa: PLR2004
+    failure_ids = [failure["id"] for failure in response.json()["failures"]]
+    assert failure_ids == [MANIFEST_TASK_ID, "x", "tests.integration.test_router_tasks:task1"]
+    assert restored_tasks == tasks
+
+
+@pytest.mark.integration
+def test_run_task(scheduler_app: SchedulerApp) -> None:
+    """Test run a task now with arguments, then wait for its result."""
+    # Arrange
+    scheduler_app.interval(hours=1)(sum_task)
+    task_id = "tests.integration.test_router_tasks:sum_task"
+    app = FastAPI(lifespan=scheduler_app.lifespan)
+    scheduler_app.setup(app)
+    api_prefix = scheduler_app.api.prefix
+
+    # Act
+    with TestClient(app) as client:
+        response = client.post(f"{api_prefix}/tasks/{task_id}/run", json={"args": [1], "kwargs": {"b": 2}})
+        job_id = JobAccepted.model_validate_json(response.text).job_id
+        result_response = client.get(f"{api_prefix}/jobs/{job_id}/result", params={"wait": 5})
+
+    # Assert
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert result_response.status_code == status.HTTP_200_OK
+    assert JobResult.model_validate_json(result_response.text).return_value == 3  # noqa: PLR2004
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("task_id", ["unknown", MANIFEST_TASK_ID])
+def test_run_task_not_found(scheduler_app: SchedulerApp, fastapi_app: FastAPI, task_id: str) -> None:
+    """Test run an unknown or hidden task."""
+    # Act
+    with TestClient(fastapi_app) as client:
+        response = client.post(f"{scheduler_app.api.prefix}/tasks/{task_id}/run")
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,18 +1,29 @@
 """Test APScheduler Builder."""
 
+import sys
 from unittest.mock import patch
 
 import pytest
+from apscheduler.datastores.sqlalchemy import SQLAlchemyDataStore
+from apscheduler.executors.thread import ThreadPoolJobExecutor
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
 
 from fastapi_apscheduler4.apscheduler_builder import APSSchedulerBuilder
 from fastapi_apscheduler4.config import (
     DataStoreType,
     EventBrokerType,
     PostgresConfig,
+    ReconcileLockType,
     RedisConfig,
     SchedulerConfig,
 )
 from fastapi_apscheduler4.errors import ConfigNotFoundError, MissingDependencyError
+from fastapi_apscheduler4.eventbrokers import PooledAsyncpgEventBroker
+from fastapi_apscheduler4.executors import ProcessPoolJobExecutor
+from fastapi_apscheduler4.locks import MemoryReconcileLock
+from fastapi_apscheduler4.locks.postgres import PostgresReconcileLock
+from fastapi_apscheduler4.locks.redis import RedisReconcileLock
 
 
 @pytest.mark.unit
@@ -226,3 +237,153 @@ def test_build_data_store_postgres_missing_dependency(postgres_config: PostgresC
         assert "Postgres data store" in str(exc_info.value)
         assert "postgres" in str(exc_info.value)
         assert isinstance(exc_info.value, ImportError)
+
+
+@pytest.mark.unit
+def test_computed_reconcile_lock_type_auto(redis_config: RedisConfig, postgres_config: PostgresConfig) -> None:
+    """Test compute reconcile lock type with auto discovery."""
+    # Arrange
+    default_builder = APSSchedulerBuilder()
+    redis_builder = APSSchedulerBuilder(redis=redis_config)
+    postgres_builder = APSSchedulerBuilder(postgres=postgres_config)
+    memory_store_builder = APSSchedulerBuilder(
+        scheduler=SchedulerConfig(data_store=DataStoreType.MEMORY), postgres=postgres_config
+    )
+
+    # Act
+    default_result = default_builder.computed_reconcile_lock_type
+    redis_result = redis_builder.computed_reconcile_lock_type
+    postgres_result = postgres_builder.computed_reconcile_lock_type
+    memory_store_result = memory_store_builder.computed_reconcile_lock_type
+
+    # Assert
+    assert default_result is ReconcileLockType.MEMORY
+    assert redis_result is ReconcileLockType.MEMORY
+    assert postgres_result is ReconcileLockType.POSTGRES
+    assert memory_store_result is ReconcileLockType.MEMORY
+
+
+@pytest.mark.unit
+def test_computed_reconcile_lock_type_explicit(redis_config: RedisConfig, postgres_config: PostgresConfig) -> None:
+    """Test compute reconcile lock type when explicitly configured."""
+    # Arrange
+    redis_scheduler = SchedulerConfig(reconcile_lock=ReconcileLockType.REDIS)
+    postgres_scheduler = SchedulerConfig(reconcile_lock=ReconcileLockType.POSTGRES)
+
+    # Act
+    with pytest.raises(ConfigNotFoundError):
+        APSSchedulerBuilder(scheduler=redis_scheduler, postgres=postgres_config).computed_reconcile_lock_type  # noqa: B018
+    with pytest.raises(ConfigNotFoundError):
+        APSSchedulerBuilder(scheduler=postgres_scheduler, redis=redis_config).computed_reconcile_lock_type  # noqa: B018
+    redis_result = APSSchedulerBuilder(scheduler=redis_scheduler, redis=redis_config).computed_reconcile_lock_type
+    postgres_result = APSSchedulerBuilder(
+        scheduler=postgres_scheduler, postgres=postgres_config
+    ).computed_reconcile_lock_type
+
+    # Assert
+    assert redis_result is ReconcileLockType.REDIS
+    assert postgres_result is ReconcileLockType.POSTGRES
+
+
+@pytest.mark.unit
+def test_build_reconcile_lock(redis_config: RedisConfig, postgres_config: PostgresConfig) -> None:
+    """Test build reconcile lock for each type."""
+    # Arrange
+    memory_builder = APSSchedulerBuilder(scheduler=SchedulerConfig(reconcile_lock_timeout=5))
+    redis_builder = APSSchedulerBuilder(
+        scheduler=SchedulerConfig(reconcile_lock=ReconcileLockType.REDIS), redis=redis_config
+    )
+    postgres_builder = APSSchedulerBuilder(postgres=postgres_config)
+
+    # Act
+    memory_lock = memory_builder.build_reconcile_lock()
+    redis_lock = redis_builder.build_reconcile_lock()
+    postgres_lock = postgres_builder.build_reconcile_lock()
+
+    # Assert
+    assert isinstance(memory_lock, MemoryReconcileLock)
+    assert memory_lock.timeout == 5  # noqa: PLR2004
+    assert isinstance(redis_lock, RedisReconcileLock)
+    assert isinstance(postgres_lock, PostgresReconcileLock)
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="max_jobs_per_child requires Python 3.11+")
+def test_build_job_executors() -> None:
+    """Test build job executors with a configured process pool."""
+    # Arrange
+    scheduler_config = SchedulerConfig(
+        thread_pool_max_workers=8,
+        process_pool_max_workers=2,
+        process_pool_forkserver=True,
+        process_pool_preload_modules=["json", "decimal"],
+        process_pool_max_jobs_per_child=10,
+    )
+    builder = APSSchedulerBuilder(scheduler=scheduler_config)
+
+    # Act
+    job_executors = builder.build_job_executors()
+    apscheduler = builder.build()
+
+    # Assert
+    assert list(job_executors) == ["async", "threadpool", "processpool"]
+    thread_pool = job_executors["threadpool"]
+    assert isinstance(thread_pool, ThreadPoolJobExecutor)
+    assert thread_pool.max_workers == 8  # noqa: PLR2004
+    process_pool = job_executors["processpool"]
+    assert isinstance(process_pool, ProcessPoolJobExecutor)
+    assert process_pool.max_workers == 2  # noqa: PLR2004
+    assert process_pool.forkserver is True
+    assert process_pool.preload_modules == ["json", "decimal"]
+    assert process_pool.max_jobs_per_child == 10  # noqa: PLR2004
+    assert isinstance(apscheduler.job_executors["processpool"], ProcessPoolJobExecutor)
+    assert apscheduler.task_defaults.job_executor == "async"
+
+
+@pytest.mark.unit
+def test_build_shared_engine(postgres_config: PostgresConfig) -> None:
+    """Test the Postgres data store and event broker share the same pooled engine."""
+    # Arrange
+    postgres_config = postgres_config.model_copy(
+        update={"pool_size": 3, "max_overflow": 2, "pool_pre_ping": True, "pool_recycle": 600}
+    )
+    builder = APSSchedulerBuilder(postgres=postgres_config)
+
+    # Act
+    engine = builder.engine
+    data_store = builder.build_data_store()
+    event_broker = builder.build_event_broker()
+
+    # Assert
+    assert isinstance(engine, AsyncEngine)
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == 3  # noqa: PLR2004
+    assert engine.pool._max_overflow == 2  # noqa: PLR2004
+    assert engine.pool._pre_ping is True
+    assert engine.pool._recycle == 600  # noqa: PLR2004
+    assert isinstance(data_store, SQLAlchemyDataStore)
+    assert data_store.engine_or_url is engine
+    assert isinstance(event_broker, PooledAsyncpgEventBroker)
+    assert event_broker.engine is engine
+    assert "password" not in repr(event_broker)
+
+
+@pytest.mark.unit
+def test_build_shared_engine_not_used(redis_config: RedisConfig, postgres_config: PostgresConfig) -> None:
+    """Test no engine is built when neither the data store nor the event broker is Postgres."""
+    # Arrange
+    default_builder = APSSchedulerBuilder()
+    memory_builder = APSSchedulerBuilder(
+        scheduler=SchedulerConfig(data_store=DataStoreType.MEMORY), postgres=postgres_config, redis=redis_config
+    )
+    redis_broker_builder = APSSchedulerBuilder(postgres=postgres_config, redis=redis_config)
+
+    # Act
+    default_engine = default_builder.engine
+    memory_engine = memory_builder.engine
+    redis_broker_engine = redis_broker_builder.engine
+
+    # Assert
+    assert default_engine is None
+    assert memory_engine is None
+    assert isinstance(redis_broker_engine, AsyncEngine)
@@ -0,0 +1,187 @@
+"""Test Response Cache."""
+
+import pytest
+from apscheduler import ScheduleAdded, TaskUpdated
+
+from fastapi_apscheduler4.cache import CacheNamespace, DataStoreVersions, ResponseCache, get_or_load
+
+
+class FakeClock:
+    """Fake monotonic clock."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+
+class Loader:
+    """Loader counting its calls."""
+
+    def __init__(self, value: str = "value") -> None:
+        """Initialize the loader."""
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        """Load the value."""
+        self.calls += 1
+        return self.value
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_cache_hit_and_miss() -> None:
+    """Test the results are loaded once per key and counted."""
+    # Arrange
+    cache = ResponseCache()
+    loader = Loader()
+
+    # Act
+    first = await cache.get_or_load(CacheNamespace.SCHEDULES, "key", loader)
+    second = await cache.get_or_load(CacheNamespace.SCHEDULES, "key", loader)
+    await cache.get_or_load(CacheNamespace.TASKS, "key", loader)
+
+    # Assert
+    assert first == second == "value"
+    assert loader.calls == 2  # noqa: PLR2004
+    assert cache.get_stats().model_dump() == {"hits": 1, "misses": 2, "size": 2, "max_size": 1024}
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_cache_ttl() -> None:
+    """Test the results expire after the TTL."""
+    # Arrange
+    clock = FakeClock()
+    cache = ResponseCache(ttl=10, clock=clock)
+    loader = Loader()
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "key", loader)
+
+    # Act
+    clock.now = 9.9
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "key", loader)
+    clock.now = 10
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "key", loader)
+
+    # Assert
+    assert loader.calls == 2  # noqa: PLR2004
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_cache_max_size() -> None:
+    """Test the least recently used results are evicted beyond the maximum size."""
+    # Arrange
+    cache = ResponseCache(max_size=2)
+    loader = Loader()
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "a", loader)
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "b", loader)
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "a", loader)
+
+    # Act
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "c", loader)
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "a", loader)
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "b", loader)
+
+    # Assert
+    assert loader.calls == 4  # noqa: PLR2004
+    assert cache.get_stats().size == 2  # noqa: PLR2004
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_cache_invalidated_by_event() -> None:
+    """Test a data store event only invalidates the results of its namespace and bumps its version."""
+    # Arrange
+    cache = ResponseCache()
+    loader = Loader()
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "key", loader)
+    await cache.get_or_load(CacheNamespace.TASKS, "key", loader)
+
+    # Act
+    cache.handle_event(TaskUpdated(task_id="task"))
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "key", loader)
+    await cache.get_or_load(CacheNamespace.TASKS, "key", loader)
+
+    # Assert
+    assert loader.calls == 3  # noqa: PLR2004
+    assert cache.get_version(CacheNamespace.TASKS) == 1
+    assert cache.get_version(CacheNamespace.SCHEDULES) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_cache_invalidated_while_loading() -> None:
+    """Test a result loaded while its namespace is invalidated is not cached."""
+    # Arrange
+    cache = ResponseCache()
+    loader = Loader()
+
+    async def load_and_invalidate() -> str:
+        cache.handle_event(ScheduleAdded(schedule_id="schedule", task_id="task", next_fire_time=None))
+        return await loader()
+
+    # Act
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "key", load_and_invalidate)
+    await cache.get_or_load(CacheNamespace.SCHEDULES, "key", loader)
+
+    # Assert
+    assert loader.calls == 2  # noqa: PLR2004
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_cache_errors_not_cached() -> None:
+    """Test the errors raised while loading are not cached."""
+    # Arrange
+    cache = ResponseCache()
+
+    async def fail() -> str:
+        raise LookupError
+
+    # Act
+    with pytest.raises(LookupError):
+        await cache.get_or_load(CacheNamespace.SCHEDULES, "key", fail)
+    value = await cache.get_or_load(CacheNamespace.SCHEDULES, "key", Loader())
+
+    # Assert
+    assert value == "value"
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_get_or_load_without_cache() -> None:
+    """Test the results are always loaded without cache."""
+    # Arrange
+    loader = Loader()
+
+    # Act
+    await get_or_load(None, CacheNamespace.SCHEDULES, "key", loader)
+    await get_or_load(None, CacheNamespace.SCHEDULES, "key", loader)
+
+    # Assert
+    assert loader.calls == 2  # noqa: PLR2004
+
+
+@pytest.mark.unit
+def test_versions_etag() -> None:
+    """Test the ETag of a namespace changes with its version, and differs between processes."""
+    # Arrange
+    versions = DataStoreVersions()
+    other_versions = DataStoreVersions()
+    etag = versions.get_etag(CacheNamespace.SCHEDULES)
+
+    # Act
+    versions.handle_event(TaskUpdated(task_id="task"))
+    unchanged_etag = versions.get_etag(CacheNamespace.SCHEDULES)
+    versions.handle_event(ScheduleAdded(schedule_id="schedule", task_id="task", next_fire_time=None))
+    changed_etag = versions.get_etag(CacheNamespace.SCHEDULES)
+
+    # Assert
+    assert etag == unchanged_etag == f'W/"{versions.epoch}-0"'
+    assert changed_etag == f'W/"{versions.epoch}-1"'
+    assert other_versions.get_etag(CacheNamespace.SCHEDULES) != etag
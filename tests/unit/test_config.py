@@ -1,5 +1,7 @@
 """Test configuration."""
 
+import sys
+
 import pytest
 from pydantic import SecretStr, ValidationError
 
@@ -71,6 +73,15 @@ def test_config_api(monkeypatch: pytest.MonkeyPatch) -> None:
         include_in_schema=False,
         limit_default=50,
         limit_max=500,
+        cache_enabled=True,
+        cache_max_size=100,
+        cache_ttl=5,
+        etag_enabled=True,
+        jobs_enabled=False,
+        job_result_max_wait=10,
+        events_enabled=True,
+        events_buffer_size=10,
+        events_keepalive=1,
     )
 
     monkeypatch.setenv("SCHEDULER_API_PREFIX", "api/v2")
@@ -78,6 +89,15 @@ def test_config_api(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("SCHEDULER_API_INCLUDE_IN_SCHEMA", "false")
     monkeypatch.setenv("SCHEDULER_API_LIMIT_DEFAULT", "50")
     monkeypatch.setenv("SCHEDULER_API_LIMIT_MAX", "500")
+    monkeypatch.setenv("SCHEDULER_API_CACHE_ENABLED", "true")
+    monkeypatch.setenv("SCHEDULER_API_CACHE_MAX_SIZE", "100")
+    monkeypatch.setenv("SCHEDULER_API_CACHE_TTL", "5")
+    monkeypatch.setenv("SCHEDULER_API_ETAG_ENABLED", "true")
+    monkeypatch.setenv("SCHEDULER_API_JOBS_ENABLED", "false")
+    monkeypatch.setenv("SCHEDULER_API_JOB_RESULT_MAX_WAIT", "10")
+    monkeypatch.setenv("SCHEDULER_API_EVENTS_ENABLED", "true")
+    monkeypatch.setenv("SCHEDULER_API_EVENTS_BUFFER_SIZE", "10")
+    monkeypatch.setenv("SCHEDULER_API_EVENTS_KEEPALIVE", "1")
 
     # Act
     config = SchedulerAPIEnvConfig()
@@ -143,3 +163,46 @@ def test_config_api_limit_validation_succeeds_when_default_less_than_max(monkeyp
     # Assert
     assert config.limit_default == custom_default
     assert config.limit_max == custom_max
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="max_jobs_per_child requires Python 3.11+")
+def test_config_process_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test create the process pool settings from environment variables."""
+    # Arrange
+    monkeypatch.setenv("SCHEDULER_PROCESS_POOL_MAX_WORKERS", "4")
+    monkeypatch.setenv("SCHEDULER_PROCESS_POOL_FORKSERVER", "true")
+    monkeypatch.setenv("SCHEDULER_PROCESS_POOL_PRELOAD_MODULES", "pandas, app.reports")
+    monkeypatch.setenv("SCHEDULER_PROCESS_POOL_MAX_JOBS_PER_CHILD", "100")
+
+    # Act
+    config = SchedulerEnvConfig()
+
+    # Assert
+    assert config.process_pool_max_workers == 4  # noqa: PLR2004
+    assert config.process_pool_forkserver is True
+    assert config.process_pool_preload_modules == ["pandas", "app.reports"]
+    assert config.process_pool_max_jobs_per_child == 100  # noqa: PLR2004
+
+
+@pytest.mark.unit
+def test_postgres_env_config_pool(monkeypatch: pytest.MonkeyPatch, postgres_config: PostgresConfig) -> None:
+    """Test create the postgres pool settings from environment variables."""
+    # Arrange
+    monkeypatch.setenv("POSTGRES_HOST", postgres_config.host)
+    monkeypatch.setenv("POSTGRES_DB", postgres_config.db)
+    monkeypatch.setenv("POSTGRES_USER", postgres_config.username)
+    monkeypatch.setenv("POSTGRES_PASSWORD", postgres_config.password.get_secret_value())
+    monkeypatch.setenv("POSTGRES_POOL_SIZE", "20")
+    monkeypatch.setenv("POSTGRES_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("POSTGRES_POOL_PRE_PING", "false")
+    monkeypatch.setenv("POSTGRES_POOL_RECYCLE", "1800")
+
+    # Act
+    config = PostgresEnvConfig.from_env()
+
+    # Assert
+    assert config.pool_size == 20  # noqa: PLR2004
+    assert config.max_overflow == 0
+    assert config.pool_pre_ping is False
+    assert config.pool_recycle == 1800  # noqa: PLR2004
@@ -0,0 +1,103 @@
+"""Test Event Stream."""
+
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+from apscheduler import JobOutcome, JobReleased, ScheduleAdded, SchedulerStarted, TaskAdded
+
+from fastapi_apscheduler4.constants import MANIFEST_TASK_ID
+from fastapi_apscheduler4.events import KEEPALIVE, EventStream, dump_event, format_sse
+
+JOB_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+def job_released(task_id: str = "task") -> JobReleased:
+    """Job released event of a task."""
+    return JobReleased(
+        timestamp=datetime(2100, 1, 1, tzinfo=timezone.utc),
+        job_id=JOB_ID,
+        scheduler_id="scheduler",
+        task_id=task_id,
+        scheduled_start=None,
+        started_at=None,
+        outcome=JobOutcome.success,
+    )
+
+
+async def read_sse(stream: EventStream, count: int) -> list[bytes]:
+    """Read a number of server-sent events from a stream."""
+    chunks = []
+    async for chunk in stream.iter_sse():
+        chunks.append(chunk)
+        if len(chunks) == count:
+            return chunks
+    return chunks
+
+
+@pytest.mark.unit
+def test_dump_event() -> None:
+    """Test an event is dumped into JSON, with its enums by name."""
+    # Act
+    data = json.loads(dump_event(job_released()))
+
+    # Assert
+    assert data["job_id"] == str(JOB_ID)
+    assert data["timestamp"] == "2100-01-01T00:00:00Z"
+    assert data["outcome"] == "success"
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_event_stream_filters() -> None:
+    """Test only the events of the streamed tasks are buffered, without the manifest task."""
+    # Arrange
+    stream = EventStream(task_ids=["task"])
+    expected = job_released()
+
+    # Act
+    stream.handle_event(job_released("other"))
+    stream.handle_event(TaskAdded(task_id=MANIFEST_TASK_ID))
+    stream.handle_event(SchedulerStarted())
+    stream.handle_event(expected)
+    chunks = await read_sse(stream, 1)
+
+    # Assert
+    assert chunks == [format_sse("JobReleased", dump_event(expected))]
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_event_stream_drops_events() -> None:
+    """Test the events beyond the buffer are dropped, and counted before the next event."""
+    # Arrange
+    stream = EventStream(buffer_size=2)
+    events = [ScheduleAdded(schedule_id=str(i), task_id="task", next_fire_time=None) for i in range(5)]
+
+    # Act
+    for event in events:
+        stream.handle_event(event)
+    chunks = await read_sse(stream, 3)
+
+    # Assert
+    assert chunks == [
+        format_sse("dropped", b'{"count":3}'),
+        format_sse("ScheduleAdded", dump_event(events[0])),
+        format_sse("ScheduleAdded", dump_event(events[1])),
+    ]
+    assert stream.dropped == 0
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_event_stream_keepalive() -> None:
+    """Test a keepalive comment is sent while there is no event."""
+    # Arrange
+    stream = EventStream(keepalive=0.01)
+
+    # Act
+    chunks = await read_sse(stream, 2)
+
+    # Assert
+    assert chunks == [KEEPALIVE, KEEPALIVE]
@@ -0,0 +1,81 @@
+"""Test Reconcile Locks."""
+
+import pytest
+from anyio import sleep
+
+from fastapi_apscheduler4.locks import RECONCILE_LOCK_NAME, MemoryReconcileLock
+from fastapi_apscheduler4.locks.redis import RedisReconcileLock
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_memory_reconcile_lock() -> None:
+    """Test memory reconcile lock is acquired and released."""
+    # Arrange
+    lock = MemoryReconcileLock(timeout=0.05, poll_interval=0.01)
+
+    # Act
+    async with lock.hold() as first_acquired, lock.hold() as second_acquired:
+        pass
+    async with lock.hold() as third_acquired:
+        pass
+
+    # Assert
+    assert first_acquired is True
+    assert second_acquired is False
+    assert third_acquired is True
+
+
+class FakeRedis:
+    """Redis client keeping the lock keys in memory, with the scripts of the Redis lock."""
+
+    def __init__(self) -> None:
+        """Initialize without keys."""
+        self.values: dict[str, str] = {}
+        self.renewals = 0
+
+    async def set(self, name: str, value: str, *, nx: bool, px: int) -> bool:  # noqa: ARG002
+        """Set the key if not set yet."""
+        if nx and name in self.values:
+            return False
+        self.values[name] = value
+        return True
+
+    async def eval(self, script: str, _numkeys: int, name: str, token: str, *_args: object) -> int:
+        """Renew or delete the key if owned by the token."""
+        if self.values.get(name) != token:
+            return 0
+        if "pexpire" in script:
+            self.renewals += 1
+        else:
+            del self.values[name]
+        return 1
+
+    async def aclose(self) -> None:
+        """Close nothing."""
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_redis_reconcile_lock_renew() -> None:
+    """Test the Redis lock lease is renewed while held, and only released by its holder."""
+    # Arrange
+    client = FakeRedis()
+    lock = RedisReconcileLock("redis://localhost", timeout=0.05, poll_interval=0.01, lease=0.03)
+    other_lock = RedisReconcileLock("redis://localhost", timeout=0.05, poll_interval=0.01)
+    lock._client = client
+    other_lock._client = client
+
+    # Act
+    async with lock.hold() as acquired:
+        await sleep(0.1)
+        async with other_lock.hold() as other_acquired:
+            pass
+        held = RECONCILE_LOCK_NAME in client.values
+
+    # Assert
+    assert acquired is True
+    assert other_acquired is False
+    assert held is True
+    assert client.renewals >= 2  # noqa: PLR2004
+    assert client.values == {}
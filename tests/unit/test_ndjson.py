@@ -0,0 +1,137 @@
+"""Test NDJSON."""
+
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from apscheduler import CoalescePolicy, DeserializationError, Schedule, Task
+from apscheduler.triggers.cron import CronTrigger
+
+from fastapi_apscheduler4.dtos import Page
+from fastapi_apscheduler4.ndjson import (
+    dump_lines,
+    dump_schedule,
+    dump_task,
+    iter_lines,
+    iter_pages,
+    load_schedule,
+    load_task,
+)
+
+
+@pytest.mark.unit
+def test_dump_load_schedule() -> None:
+    """Test a schedule is restored from its line, without its acquisition state."""
+    # Arrange
+    next_fire_time = datetime(2100, 1, 1, 1, tzinfo=timezone.utc)
+    schedule = Schedule(
+        id="schedule",
+        task_id="module:func",
+        trigger=CronTrigger(hour=1, timezone="Europe/Paris"),
+        args=(1, "a"),
+        kwargs={"b": [2]},
+        coalesce=CoalescePolicy.all,
+        misfire_grace_time=timedelta(seconds=30),
+        job_executor="threadpool",
+        next_fire_time=next_fire_time,
+        acquired_by="scheduler",
+        acquired_until=next_fire_time,
+    )
+
+    # Act
+    line = dump_schedule(schedule)
+    loaded = load_schedule(line)
+
+    # Assert
+    assert line.endswith(b"\n")
+    assert line.count(b"\n") == 1
+    assert (loaded.id, loaded.task_id, loaded.args, loaded.kwargs) == ("schedule", "module:func", (1, "a"), {"b": [2]})
+    assert loaded.trigger.__getstate__() == schedule.trigger.__getstate__()
+    assert loaded.coalesce is CoalescePolicy.all
+    assert loaded.misfire_grace_time == timedelta(seconds=30)
+    assert loaded.job_executor == "threadpool"
+    assert loaded.next_fire_time == next_fire_time
+    assert loaded.acquired_by is None
+    assert loaded.acquired_until is None
+
+
+@pytest.mark.unit
+def test_dump_load_task() -> None:
+    """Test a task is restored from its line, without its running jobs."""
+    # Arrange
+    task = Task(id="task", func="module:func", job_executor="async", max_running_jobs=2, metadata={"a": 1})
+    task.running_jobs = 1
+
+    # Act
+    loaded = load_task(dump_task(task))
+
+    # Assert
+    assert (loaded.id, loaded.func, loaded.job_executor, loaded.max_running_jobs) == ("task", "module:func", "async", 2)
+    assert loaded.metadata == {"a": 1}
+    assert loaded.running_jobs == 0
+
+
+@pytest.mark.unit
+def test_dump_lines_unserializable() -> None:
+    """Test an unserializable schedule is replaced by an error line, reported as an error when loaded."""
+    # Arrange
+    trigger = CronTrigger(hour=1)
+    schedules = [
+        Schedule(id=schedule_id, task_id="module:func", trigger=trigger, kwargs=kwargs, job_executor="async")
+        for schedule_id, kwargs in (("a", {}), ("b", {"c": {(1, 2): 3}}), ("d", {}))
+    ]
+
+    # Act
+    lines = dump_lines(schedules, dump_schedule).splitlines()
+
+    # Assert
+    assert len(lines) == 3  # noqa: PLR2004
+    assert [load_schedule(lines[index]).id for index in (0, 2)] == ["a", "d"]
+    with pytest.raises(ValueError, match="Not exported"):
+        load_schedule(lines[1])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("line", "error"),
+    [(b"not json", DeserializationError), (b"[1]", TypeError), (b'{"id": "schedule"}', TypeError)],
+)
+def test_load_schedule_invalid(line: bytes, error: type[Exception]) -> None:
+    """Test loading an invalid schedule line."""
+    # Act & Assert
+    with pytest.raises(error):
+        load_schedule(line)
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_iter_lines() -> None:
+    """Test the lines are split across the chunks, numbered and the blank ones skipped."""
+
+    # Arrange
+    async def chunks() -> AsyncIterator[bytes]:
+        for chunk in (b'{"a"', b": 1}\n\n", b'{"b": 2}\n{"c"', b": 3}", b""):
+            yield chunk
+
+    # Act
+    lines = [line async for line in iter_lines(chunks())]
+
+    # Assert
+    assert lines == [(1, b'{"a": 1}'), (3, b'{"b": 2}'), (4, b'{"c": 3}')]
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+async def test_iter_pages() -> None:
+    """Test the pages are read after the cursor of the previous page until the last one."""
+    # Arrange
+    pages = {None: Page(items=[1, 2], next_cursor="2"), "2": Page(items=[3])}
+
+    async def get_page(cursor: str | None) -> Page[int]:
+        return pages[cursor]
+
+    # Act
+    items = [chunk async for chunk in iter_pages(get_page)]
+
+    # Assert
+    assert items == [[1, 2], [3]]
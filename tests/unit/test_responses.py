@@ -0,0 +1,67 @@
+"""Test JSON Responses."""
+
+import json
+
+import pytest
+from fastapi import Response, status
+from pydantic import BaseModel
+
+from fastapi_apscheduler4.constants import JSON_MEDIA_TYPE
+from fastapi_apscheduler4.responses import get_list_adapter, get_partial_model, json_list_response
+
+
+class Item(BaseModel):
+    """Test schema."""
+
+    id: str
+    note: str | None = None
+
+
+class AttrsItem:
+    """Test object read by attributes."""
+
+    def __init__(self, id: str, note: str | None = None) -> None:
+        """Initialize the object."""
+        self.id = id
+        self.note = note
+
+
+@pytest.mark.unit
+def test_get_list_adapter_cached() -> None:
+    """Test the type adapter of a model is built once."""
+    # Act & Assert
+    assert get_list_adapter(Item) is get_list_adapter(Item)
+
+
+@pytest.mark.unit
+def test_json_list_response() -> None:
+    """Test the objects are dumped by attributes without the None fields, with the status and headers of the route."""
+    # Arrange
+    route_response = Response()
+    del route_response.headers["content-length"]
+    route_response.status_code = status.HTTP_206_PARTIAL_CONTENT
+    route_response.headers["X-Total-Count"] = "3"
+
+    # Act
+    response = json_list_response(Item, [AttrsItem("a"), AttrsItem("b", "note")], route_response)
+
+    # Assert
+    assert json.loads(response.body) == [{"id": "a"}, {"id": "b", "note": "note"}]
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert response.media_type == JSON_MEDIA_TYPE
+    assert response.headers["X-Total-Count"] == "3"
+    assert response.headers.getlist("content-length") == [str(len(response.body))]
+
+
+@pytest.mark.unit
+def test_json_list_response_fields() -> None:
+    """Test only the selected fields are dumped, with a partial schema built once per fieldset."""
+    # Arrange
+    fields = frozenset({"note"})
+
+    # Act
+    response = json_list_response(Item, [AttrsItem("a", "note")], Response(), fields)
+
+    # Assert
+    assert json.loads(response.body) == [{"note": "note"}]
+    assert get_partial_model(Item, fields) is get_partial_model(Item, frozenset({"note"}))
@@ -5,7 +5,8 @@ import pytest
 from fastapi_apscheduler4.config import SchedulerAPIEnvConfig
 from fastapi_apscheduler4.constants import API_PAGE_DEFAULT_LIMIT, API_PAGE_MAX_LIMIT
 from fastapi_apscheduler4.dtos import LimitOffset
-from fastapi_apscheduler4.routers.deps import get_scheduler_api_config, limit_offset
+from fastapi_apscheduler4.routers.deps import get_scheduler_api_config, limit_offset, schedule_fields
+from fastapi_apscheduler4.schemas import ScheduleField
 
 
 @pytest.mark.unit
@@ -136,3 +137,30 @@ def test_limit_offset_with_none_config() -> None:
     # Assert
     assert result.limit == test_limit
     assert result.offset == test_offset
+
+
+@pytest.mark.unit
+def test_limit_offset_with_cursor() -> None:
+    """Test limit_offset passes the cursor through, none by default."""
+    # Arrange
+    config = get_scheduler_api_config()
+
+    # Act
+    result_default = limit_offset(config=config, limit=10, offset=0)
+    result_cursor = limit_offset(config=config, limit=10, offset=0, cursor="cursor")
+
+    # Assert
+    assert result_default.cursor is None
+    assert result_cursor.cursor == "cursor"
+
+
+@pytest.mark.unit
+def test_schedule_fields() -> None:
+    """Test schedule_fields always includes the ID, and selects all the fields when none is given."""
+    # Act
+    fields = schedule_fields([ScheduleField.PAUSED, ScheduleField.NEXT_FIRE_TIME])
+    all_fields = schedule_fields(None)
+
+    # Assert
+    assert fields == {"id", "paused", "next_fire_time"}
+    assert all_fields is None
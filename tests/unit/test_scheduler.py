@@ -1,12 +1,17 @@
 """Test Scheduler."""
 
 import pytest
+from apscheduler.triggers.cron import CronTrigger as APSCronTrigger
 from apscheduler.triggers.interval import IntervalTrigger as APSIntervalTrigger
 
 from fastapi_apscheduler4.errors import ScheduleAlreadyExistsError
 from fastapi_apscheduler4.scheduler import Scheduler
 
 
+def report_task() -> None:
+    """Test task."""
+
+
 @pytest.mark.unit
 def test_interval_decorator() -> None:
     """Test interval decorator."""
@@ -24,19 +29,18 @@ def test_interval_decorator() -> None:
         """Test register async every minute."""
 
     # Assert
-    assert len(scheduler._schedules) == schedules_count
-    scheduler1_func, scheduler1_trigger = scheduler._schedules[0]
-    scheduler2_func, scheduler2_trigger = scheduler._schedules[1]
+    assert len(scheduler.schedules) == schedules_count
+    schedule1, schedule2 = scheduler.schedules
 
-    assert scheduler1_func == every_second
-    assert isinstance(scheduler1_trigger, APSIntervalTrigger)
-    assert scheduler1_trigger.seconds == 1
-    assert scheduler1_trigger.minutes == 0
+    assert schedule1.func == every_second
+    assert isinstance(schedule1.trigger, APSIntervalTrigger)
+    assert schedule1.trigger.seconds == 1
+    assert schedule1.trigger.minutes == 0
 
-    assert scheduler2_func == every_minute
-    assert isinstance(scheduler2_trigger, APSIntervalTrigger)
-    assert scheduler2_trigger.seconds == 0
-    assert scheduler2_trigger.minutes == 1
+    assert schedule2.func == every_minute
+    assert isinstance(schedule2.trigger, APSIntervalTrigger)
+    assert schedule2.trigger.seconds == 0
+    assert schedule2.trigger.minutes == 1
 
 
 @pytest.mark.unit
@@ -55,11 +59,63 @@ def test_interval_decorator_multiple_error() -> None:
             """Test register every second."""
 
     # Assert
-    assert len(scheduler._schedules) == 1
-    scheduler1_func, scheduler1_trigger = scheduler._schedules[0]
-
-    assert hasattr(scheduler1_func, "__name__")
-    assert scheduler1_func.__name__ == "mutiple_interval"
-    assert isinstance(scheduler1_trigger, APSIntervalTrigger)
-    assert scheduler1_trigger.seconds == 1
-    assert scheduler1_trigger.minutes == 0
+    assert len(scheduler.schedules) == 1
+    (schedule,) = scheduler.schedules
+
+    assert hasattr(schedule.func, "__name__")
+    assert schedule.func.__name__ == "mutiple_interval"
+    assert isinstance(schedule.trigger, APSIntervalTrigger)
+    assert schedule.trigger.seconds == 1
+    assert schedule.trigger.minutes == 0
+
+
+@pytest.mark.unit
+def test_multiple_triggers_with_ids() -> None:
+    """Test several schedules on the same function with explicit IDs."""
+    # Arrange
+    scheduler = Scheduler()
+
+    # Act
+    scheduler.interval(minutes=5, id="report-frequent")(report_task)
+    scheduler.cron(hour=0, id="report-daily")(report_task)
+
+    # Assert
+    daily_schedule = scheduler.schedules.get("auto:report-daily")
+    assert [schedule.id for schedule in scheduler.schedules] == ["auto:report-frequent", "auto:report-daily"]
+    assert daily_schedule is not None
+    assert isinstance(daily_schedule.trigger, APSCronTrigger)
+    assert [schedule.func for schedule in scheduler.schedules] == [report_task, report_task]
+
+
+@pytest.mark.unit
+def test_include() -> None:
+    """Test including the schedules of another scheduler."""
+    # Arrange
+    scheduler = Scheduler()
+    sub_scheduler = Scheduler()
+    scheduler.interval(minutes=5, id="report-frequent")(report_task)
+    sub_scheduler.cron(hour=0, id="report-daily")(report_task)
+
+    # Act
+    scheduler.include(sub_scheduler)
+
+    # Assert
+    assert [schedule.id for schedule in scheduler.schedules] == ["auto:report-frequent", "auto:report-daily"]
+
+
+@pytest.mark.unit
+def test_include_conflict_error() -> None:
+    """Test that including a conflicting schedule leaves the scheduler unchanged."""
+    # Arrange
+    scheduler = Scheduler()
+    sub_scheduler = Scheduler()
+    scheduler.interval(minutes=5)(report_task)
+    sub_scheduler.cron(hour=0, id="report-daily")(report_task)
+    sub_scheduler.interval(minutes=10)(report_task)
+
+    # Act
+    with pytest.raises(ScheduleAlreadyExistsError):
+        scheduler.include(sub_scheduler)
+
+    # Assert
+    assert [schedule.id for schedule in scheduler.schedules] == ["auto:tests.unit.test_scheduler:report_task"]
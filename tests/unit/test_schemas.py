@@ -1,9 +1,25 @@
 """Test Schemas."""
 
+from datetime import date, datetime, timezone
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import apscheduler as aps
 import pytest
+from apscheduler.triggers.calendarinterval import CalendarIntervalTrigger as APSCalendarIntervalTrigger
+from apscheduler.triggers.cron import CronTrigger as APSCronTrigger
+from apscheduler.triggers.interval import IntervalTrigger as APSIntervalTrigger
 from pydantic import BaseModel, ValidationError
 
-from fastapi_apscheduler4.schemas import TimeZoneName
+from fastapi_apscheduler4.schemas import (
+    JobOutcome,
+    JobResult,
+    ScheduleCreate,
+    TimeZoneName,
+    TriggerType,
+    UnknownTrigger,
+    model_trigger_discriminator,
+)
 
 
 class SampleTimezone(BaseModel):
@@ -20,8 +36,10 @@ class SampleTimezone(BaseModel):
         ("Europe/Paris", "Europe/Paris"),
         ("Asia/Tokyo", "Asia/Tokyo"),
         ("UTC", "UTC"),
+        (ZoneInfo("Europe/Zurich"), "Europe/Zurich"),
+        (timezone.utc, "UTC"),
     ],
-    ids=["europe_zurich", "america_new_york", "europe_paris", "asia_tokyo", "utc"],
+    ids=["europe_zurich", "america_new_york", "europe_paris", "asia_tokyo", "utc", "zoneinfo", "tzinfo_utc"],
 )
 @pytest.mark.unit
 def test_timezone_valid(timezone_value: TimeZoneName, expected: str) -> None:
@@ -53,3 +71,108 @@ def test_timezone_invalid(invalid_timezone: TimeZoneName) -> None:
 
     # Assert - verify the error is about timezone validation
     assert "timezone" in str(exc_info.value).lower()
+
+
+@pytest.mark.unit
+def test_job_result_from_apscheduler() -> None:
+    """Test a job result is validated from APScheduler, with its outcome by name and its exception as text."""
+    # Arrange
+    finished_at = datetime(2100, 1, 1, tzinfo=timezone.utc)
+    result = aps.JobResult(
+        job_id=uuid4(),
+        outcome=aps.JobOutcome.error,
+        finished_at=finished_at,
+        expires_at=finished_at,
+        exception=ValueError("invalid"),
+    )
+
+    # Act
+    model = JobResult.model_validate(result, from_attributes=True)
+
+    # Assert
+    assert model.outcome is JobOutcome.ERROR
+    assert model.exception == "ValueError: invalid"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("trigger", "expected"),
+    [
+        (
+            {"type": "IntervalTrigger", "hours": 2, "start_time": "2100-01-01T00:00:00Z"},
+            APSIntervalTrigger(hours=2, start_time=datetime(2100, 1, 1, tzinfo=timezone.utc)),
+        ),
+        (
+            {"type": "CronTrigger", "hour": "*/2", "start_time": "2100-01-01T00:00:00Z", "timezone": "Europe/Paris"},
+            APSCronTrigger(hour="*/2", start_time=datetime(2100, 1, 1, tzinfo=timezone.utc), timezone="Europe/Paris"),
+        ),
+        (
+            {"type": "CalendarIntervalTrigger", "months": 1, "hour": 3, "start_date": "2100-01-01", "timezone": "UTC"},
+            APSCalendarIntervalTrigger(months=1, hour=3, start_date=date(2100, 1, 1), timezone="UTC"),
+        ),
+    ],
+    ids=["interval", "cron", "calendar_interval"],
+)
+def test_schedule_trigger_to_apscheduler(trigger: dict[str, object], expected: aps.abc.Trigger) -> None:
+    """Test the trigger of a schedule body converts into the APScheduler trigger."""
+    # Arrange
+    schedule = ScheduleCreate.model_validate({"task_id": "task", "trigger": trigger})
+
+    # Act
+    result = schedule.trigger.to_apscheduler()
+
+    # Assert
+    assert result == expected
+
+
+@pytest.mark.unit
+def test_unknown_trigger_to_apscheduler() -> None:
+    """Test the unknown trigger is rejected by the conversion, having no APScheduler trigger class."""
+    # Act & Assert
+    with pytest.raises(ValueError, match="UnknownTrigger cannot be converted"):
+        UnknownTrigger().to_apscheduler()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "trigger",
+    [
+        {"type": "IntervalTrigger"},
+        {"type": "CronTrigger", "hour": 25},
+        {"type": "CalendarIntervalTrigger", "hour": 1},
+        {"type": "UnknownTrigger"},
+        {"hours": 1},
+    ],
+    ids=["zero_interval", "invalid_cron_hour", "zero_calendar_interval", "unknown_type", "missing_type"],
+)
+def test_schedule_trigger_invalid(trigger: dict[str, object]) -> None:
+    """Test an invalid trigger of a schedule body is rejected."""
+    # Act & Assert
+    with pytest.raises(ValidationError) as exc_info:
+        ScheduleCreate.model_validate({"task_id": "task", "trigger": trigger})
+
+    # Assert
+    assert exc_info.value.errors()[0]["loc"][0] == "trigger"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (APSIntervalTrigger(hours=1), "IntervalTrigger"),
+        ({"type": "CronTrigger"}, "CronTrigger"),
+        ({"type": TriggerType.CALENDAR_INTERVAL}, "CalendarIntervalTrigger"),
+        ({"type": ["CronTrigger"]}, "UnknownTrigger"),
+        ({}, "UnknownTrigger"),
+        (object(), "UnknownTrigger"),
+    ],
+    ids=["aps_trigger", "name", "enum_member", "unhashable", "missing", "unknown_class"],
+)
+def test_model_trigger_discriminator(value: object, expected: str) -> None:
+    """Test the trigger tag is found by class name, by name or by enum member, and unknown otherwise."""
+    # Act
+    tag = model_trigger_discriminator(value)
+
+    # Assert
+    assert tag == expected
+    assert type(tag) is str
@@ -0,0 +1,132 @@
+"""Test Schedule Spread."""
+
+from datetime import datetime, timedelta, timezone
+from itertools import pairwise
+from typing import cast
+
+import pytest
+from apscheduler import Schedule
+from apscheduler.triggers.calendarinterval import CalendarIntervalTrigger
+from apscheduler.triggers.combining import OrTrigger
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from fastapi_apscheduler4.spread import get_fire_time_histogram, get_spread_offset, spread_trigger
+
+START_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.unit
+def test_get_spread_offset() -> None:
+    """Test the spread offset is deterministic and within the window."""
+    # Act
+    offsets = [get_spread_offset(f"auto:job-{i}", 60) for i in range(100)]
+
+    # Assert
+    assert offsets == [get_spread_offset(f"auto:job-{i}", 60) for i in range(100)]
+    assert all(0 <= offset < 60 for offset in offsets)  # noqa: PLR2004
+    assert len({int(offset) for offset in offsets}) > 30  # noqa: PLR2004
+
+
+@pytest.mark.unit
+def test_spread_trigger() -> None:
+    """Test the supported triggers are offset and the unsupported ones are left to the caller."""
+    # Arrange
+    interval_trigger = IntervalTrigger(minutes=5, start_time=START_TIME)
+    cron_trigger = CronTrigger(minute="*/5", start_time=START_TIME, timezone="UTC")
+    explicit_cron_trigger = CronTrigger(minute="*/5", second=0, start_time=START_TIME, timezone="UTC")
+    calendar_trigger = CalendarIntervalTrigger(days=1, hour=23, minute=59, second=30, timezone="UTC")
+    or_trigger = OrTrigger([interval_trigger, cron_trigger])
+    offset = get_spread_offset("auto:job", 3600)
+
+    # Act
+    spread_interval = spread_trigger(interval_trigger, "auto:job", 3600)
+    spread_cron = spread_trigger(cron_trigger, "auto:job", 3600)
+    spread_explicit_cron = spread_trigger(explicit_cron_trigger, "auto:job", 3600)
+    spread_calendar = spread_trigger(calendar_trigger, "auto:job", 3600)
+    spread_or = spread_trigger(or_trigger, "auto:job", 3600)
+
+    # Assert
+    assert isinstance(spread_interval, IntervalTrigger)
+    assert spread_interval.start_time - START_TIME == timedelta(seconds=get_spread_offset("auto:job", 300))
+    assert isinstance(spread_cron, CronTrigger)
+    assert spread_cron.second == int(get_spread_offset("auto:job", 60))
+    assert spread_explicit_cron is explicit_cron_trigger
+    assert isinstance(spread_calendar, CalendarIntervalTrigger)
+    seconds = (spread_calendar.hour * 3600 + spread_calendar.minute * 60 + spread_calendar.second - 86370) % 86400
+    assert seconds == int(offset)
+    assert spread_or is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("fields", "period"),
+    [
+        ({"hour": 3}, timedelta(days=1)),
+        ({"day_of_week": "mon"}, timedelta(weeks=1)),
+        ({"minute": "*/5"}, timedelta(minutes=5)),
+        ({"day": 1, "hour": 12}, None),
+        ({}, None),
+    ],
+)
+def test_spread_cron_trigger_keeps_frequency(fields: dict[str, int | str], period: timedelta | None) -> None:
+    """Test a spread cron trigger fires as often as the original one, only later by the offset in seconds."""
+    # Arrange
+    trigger = CronTrigger(**fields, start_time=START_TIME, timezone="UTC")
+    spread = spread_trigger(CronTrigger(**fields, start_time=START_TIME, timezone="UTC"), "auto:job", 3600)
+    offset = timedelta(seconds=int(get_spread_offset("auto:job", 60)))
+
+    # Act
+    fire_times = [trigger.next() for _ in range(5)]
+    spread_fire_times = [cast("CronTrigger", spread).next() for _ in range(5)]
+
+    # Assert
+    assert spread_fire_times == [fire_time + offset for fire_time in fire_times]
+    if period is not None:
+        assert all(later - earlier == period for earlier, later in pairwise(spread_fire_times))
+
+
+@pytest.mark.unit
+def test_get_fire_time_histogram() -> None:
+    """Test the fire times are counted per second until the end time."""
+    # Arrange
+    schedules = []
+    for schedule_id, second in (("first", 0), ("second", 0), ("third", 30)):
+        trigger = CronTrigger(minute="*/5", second=second, start_time=START_TIME, timezone="UTC")
+        schedules.append(Schedule(id=schedule_id, task_id="task", trigger=trigger, job_executor="async"))
+    paused_trigger = CronTrigger(minute="*/5", start_time=START_TIME, timezone="UTC")
+    schedules.append(Schedule(id="paused", task_id="task", trigger=paused_trigger, job_executor="async", paused=True))
+    for schedule in schedules:
+        schedule.next_fire_time = schedule.trigger.next()
+
+    # Act
+    histogram, end = get_fire_time_histogram(schedules, START_TIME + timedelta(minutes=10))
+
+    # Assert
+    assert end == START_TIME + timedelta(minutes=10)
+    assert histogram == {
+        START_TIME: 2,
+        START_TIME + timedelta(seconds=30): 1,
+        START_TIME + timedelta(minutes=5): 2,
+        START_TIME + timedelta(minutes=5, seconds=30): 1,
+        START_TIME + timedelta(minutes=10): 2,
+    }
+
+
+@pytest.mark.unit
+def test_get_fire_time_histogram_max_fire_times() -> None:
+    """Test the end time is moved back to the last complete second once the maximum of fire times is computed."""
+    # Arrange
+    schedules = []
+    for schedule_id in ("first", "second"):
+        trigger = CronTrigger(second="*/10", start_time=START_TIME, timezone="UTC")
+        schedules.append(Schedule(id=schedule_id, task_id="task", trigger=trigger, job_executor="async"))
+    for schedule in schedules:
+        schedule.next_fire_time = schedule.trigger.next()
+
+    # Act
+    histogram, end = get_fire_time_histogram(schedules, START_TIME + timedelta(days=1), max_fire_times=5)
+
+    # Assert
+    assert histogram == {START_TIME: 2, START_TIME + timedelta(seconds=10): 2}
+    assert end == START_TIME + timedelta(seconds=20, microseconds=-1)
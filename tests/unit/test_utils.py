@@ -1,12 +1,26 @@
 """Test Utilities."""
 
+from datetime import datetime, timezone
+from functools import partial
+
 import pytest
-from fastapi import Response, status
+from apscheduler.triggers.calendarinterval import CalendarIntervalTrigger
+from apscheduler.triggers.combining import OrTrigger
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from fastapi import Request, Response, status
 from pydantic import BaseModel
 
-from fastapi_apscheduler4.dtos import LimitOffset
+from fastapi_apscheduler4.dtos import Page
 from fastapi_apscheduler4.errors import DeleteNotAllowedAPIError, NotFoundAPIError, UnexpectedAPIError
-from fastapi_apscheduler4.utils import paginate, safe_error
+from fastapi_apscheduler4.utils import (
+    get_not_modified_response,
+    get_trigger_params,
+    has_explicit_start,
+    is_async_callable,
+    safe_error,
+    set_page_headers,
+)
 
 
 @pytest.mark.unit
@@ -104,23 +118,135 @@ def test_safe_error_contextmanager() -> None:
 
 
 @pytest.mark.unit
-def test_paginate() -> None:
-    """Test paginate."""
+def test_set_page_headers() -> None:
+    """Test the pagination headers and the partial content status of the pages."""
+    # Arrange
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "path": "/schedules",
+        "query_string": b"limit=2&offset=2",
+        "headers": [],
+    }
+    request = Request(scope)
+    partial_response = Response()
+    full_response = Response()
+    cursor_response = Response()
+
+    # Act
+    set_page_headers(Page(items=[1, 2], total_count=5), request, partial_response)
+    set_page_headers(Page(items=[1, 2], total_count=2), request, full_response)
+    set_page_headers(Page(items=[1, 2], next_cursor="c2"), request, cursor_response)
+
+    # Assert
+    assert partial_response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert partial_response.headers["X-Total-Count"] == "5"
+    assert full_response.status_code == status.HTTP_200_OK
+    assert full_response.headers["X-Total-Count"] == "2"
+    assert cursor_response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert "X-Total-Count" not in cursor_response.headers
+    assert cursor_response.headers["X-Next-Cursor"] == "c2"
+    assert cursor_response.headers["Link"] == '<http://testserver/schedules?limit=2&cursor=c2>; rel="next"'
+
+
+@pytest.mark.unit
+def test_get_trigger_params() -> None:
+    """Test get trigger params ignores the runtime state."""
+    # Arrange
+    start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    trigger = IntervalTrigger(hours=1, start_time=start_time)
+    same_trigger = IntervalTrigger(hours=1)
+    other_trigger = IntervalTrigger(hours=2, start_time=start_time)
+    combined_trigger = OrTrigger([IntervalTrigger(hours=1), CronTrigger(minute="*/5")])
+    same_combined_trigger = OrTrigger([IntervalTrigger(hours=1), CronTrigger(minute="*/5")])
+
+    # Act
+    trigger.next()
+    params = get_trigger_params(trigger)
+
+    # Assert
+    assert params["type"] == "IntervalTrigger"
+    assert "start_time" not in params
+    assert "last_fire_time" not in params
+    assert params == get_trigger_params(same_trigger)
+    assert params != get_trigger_params(other_trigger)
+    assert get_trigger_params(combined_trigger) == get_trigger_params(same_combined_trigger)
+    assert get_trigger_params(trigger, keep_start=True)["start_time"] == start_time
+    assert get_trigger_params(trigger, keep_start=True) != get_trigger_params(same_trigger, keep_start=True)
+
+
+@pytest.mark.unit
+def test_has_explicit_start() -> None:
+    """Test has explicit start tells the given start times from the default instantiation time."""
+    # Arrange
+    start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    default_triggers = [IntervalTrigger(hours=1), CronTrigger(hour=3), CalendarIntervalTrigger(days=1)]
+    explicit_triggers = [
+        IntervalTrigger(hours=1, start_time=start_time),
+        CalendarIntervalTrigger(days=1, start_date=start_time.date()),
+        OrTrigger([IntervalTrigger(hours=1), CronTrigger(hour=3, start_time=start_time)]),
+    ]
+    registered_at = datetime.now(timezone.utc)
+
+    # Act & Assert
+    assert not any(has_explicit_start(trigger, registered_at) for trigger in default_triggers)
+    assert all(has_explicit_start(trigger, registered_at) for trigger in explicit_triggers)
+
+
+class AsyncCallable:
+    """Callable object with an async `__call__`."""
+
+    async def __call__(self) -> None:
+        """Do nothing."""
+
+
+@pytest.mark.unit
+def test_is_async_callable() -> None:
+    """Test is async callable detects coroutine functions through partials and callable objects."""
+
+    # Arrange
+    def sync_func(value: int) -> int:
+        return value
+
+    async def async_func(value: int) -> int:
+        return value
+
+    # Act & Assert
+    assert not is_async_callable(sync_func)
+    assert not is_async_callable(partial(sync_func, 1))
+    assert is_async_callable(async_func)
+    assert is_async_callable(partial(partial(async_func), 1))
+    assert is_async_callable(AsyncCallable())
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("if_none_match", "not_modified"),
+    [
+        (None, False),
+        ('W/"epoch-1"', True),
+        ('"epoch-1"', True),
+        ('W/"epoch-0", W/"epoch-1"', True),
+        ("*", True),
+        ('W/"epoch-0"', False),
+        ('W/"other-1"', False),
+    ],
+)
+def test_get_not_modified_response(if_none_match: str | None, not_modified: bool) -> None:
+    """Test the ETag is set, and compared with the weak comparison of `If-None-Match`."""
     # Arrange
-    items = [1, 2, 3, 4, 5]
-    limit_offset_partial = LimitOffset(limit=2, offset=0)
-    response_partial = Response()
-    limit_offset_full = LimitOffset(limit=5, offset=0)
-    response_full = Response()
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    request = Request({"type": "http", "method": "GET", "headers": headers})
+    response = Response()
 
     # Act
-    partial_items = paginate(items, limit_offset_partial, response_partial)
-    full_items = paginate(items, limit_offset_full, response_full)
+    not_modified_response = get_not_modified_response('W/"epoch-1"', request, response)
 
     # Assert
-    assert partial_items == [1, 2]
-    assert response_partial.status_code == status.HTTP_206_PARTIAL_CONTENT
-    assert response_partial.headers["X-Total-Count"] == "5"
-    assert full_items == [1, 2, 3, 4, 5]
-    assert response_full.status_code == status.HTTP_200_OK
-    assert response_full.headers["X-Total-Count"] == "5"
+    assert response.headers["ETag"] == 'W/"epoch-1"'
+    assert (not_modified_response is not None) is not_modified
+    if not_modified_response is not None:
+        assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified_response.headers["ETag"] == 'W/"epoch-1"'